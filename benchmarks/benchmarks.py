@@ -0,0 +1,108 @@
+import importlib.util
+import os
+import shutil
+import tempfile
+import time
+
+from pyvolleydata import config, get_data, helpers, manifest, memo, schemas, session
+
+from .releases import MANIFEST_PATH, ReleaseServer, write_releases
+
+
+LEAGUE = 'au'
+SEASONS = [2022, 2023, 2024, 2025]
+# download: every load downloads and parses the files
+# cached:   files are revalidated in the download cache and parsed from disk
+# parquet:  files are revalidated and memory-mapped from columnar storage
+# pyarrow:  every load downloads and parses the files with the pyarrow engine
+CONFIGURATIONS = ['download', 'cached', 'parquet', 'pyarrow']
+OPTIONS = ['cache_dir', 'storage_format', 'engine', 'memo_max_bytes']
+
+
+class LoadSuite:
+    """
+    Times every load_* function on synthetic seasons served from a local HTTP server.
+
+    The size of the seasons is set with PYVOLLEYDATA_BENCHMARK_SCALE, where 1 is about
+    the size of a published season.
+    """
+    params = ([f'load_{data_type}' for data_type in schemas.SCHEMAS], [1, len(SEASONS)], CONFIGURATIONS)
+    param_names = ['function', 'seasons', 'configuration']
+    timeout = 600
+
+    def setup_cache(self):
+        directory = os.path.abspath('releases')
+        write_releases(directory, LEAGUE, SEASONS)
+        return directory
+
+    def setup(self, directory, function, seasons, configuration):
+        if configuration in {'parquet', 'pyarrow'} and importlib.util.find_spec('pyarrow') is None:
+            raise NotImplementedError('pyarrow is not installed')
+        self.server = ReleaseServer(directory).start()
+        self.urls = helpers.BASE_URL, manifest.MANIFEST_URL
+        helpers.BASE_URL, manifest.MANIFEST_URL = self.server.url, self.server.url + MANIFEST_PATH
+        # A manifest that fails to parse is not an error, loads would silently fall back to
+        # guessing seasons from the calendar
+        assert manifest.get_manifest() is not None, 'The benchmark manifest could not be parsed'
+        # Repeated loads would otherwise be answered from memory
+        config.set_option('memo_max_bytes', 0)
+        self.cache_dir = None
+        if configuration in {'cached', 'parquet'}:
+            self.cache_dir = tempfile.mkdtemp(prefix='pyvolleydata-benchmark-')
+            config.set_option('cache_dir', self.cache_dir)
+            config.set_option('storage_format', 'parquet' if configuration == 'parquet' else 'csv')
+        if configuration == 'pyarrow':
+            config.set_option('engine', 'pyarrow')
+        self.load = getattr(get_data, function)
+        self.seasons = SEASONS[-seasons:]
+        if self.cache_dir is not None:
+            self.load(LEAGUE, self.seasons)
+
+    def teardown(self, directory, function, seasons, configuration):
+        self.server.stop()
+        helpers.BASE_URL, manifest.MANIFEST_URL = self.urls
+        for name in OPTIONS:
+            config.reset_option(name)
+        memo.clear()
+        manifest.clear()
+        session.close()
+        if self.cache_dir is not None:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def time_load(self, directory, function, seasons, configuration):
+        self.load(LEAGUE, self.seasons)
+
+    def peakmem_load(self, directory, function, seasons, configuration):
+        self.load(LEAGUE, self.seasons)
+
+    def track_rows_per_second(self, directory, function, seasons, configuration):
+        start = time.perf_counter()
+        df = self.load(LEAGUE, self.seasons)
+        return len(df) / (time.perf_counter() - start)
+
+    track_rows_per_second.unit = 'rows/s'
+
+    def track_frame_bytes(self, directory, function, seasons, configuration):
+        return int(self.load(LEAGUE, self.seasons).memory_usage(deep=True).sum())
+
+    track_frame_bytes.unit = 'bytes'
+
+
+class ImportSuite:
+    """
+    Times importing the package in a fresh interpreter, which short-lived scripts pay on
+    every run. pandas is only imported on first data access, so importing the loaders
+    should stay far below the cost of importing pandas, timed for comparison.
+    """
+
+    def timeraw_import_package(self):
+        return 'import pyvolleydata'
+
+    def timeraw_import_get_data(self):
+        return 'import pyvolleydata.get_data'
+
+    def timeraw_import_aio(self):
+        return 'import pyvolleydata.aio'
+
+    def timeraw_import_pandas(self):
+        return 'import pandas'
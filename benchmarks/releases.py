@@ -0,0 +1,194 @@
+import hashlib
+import json
+import os
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from pyvolleydata import helpers, schemas
+
+
+MANIFEST_PATH = '/releases'
+
+# Rows in the release file of each dataset for one match, roughly as published
+ROWS_PER_MATCH = {
+    'schedule': 1,
+    'officials': 6,
+    'player_info': 28,
+    'team_staff': 10,
+    'pbp': 700,
+    'events_log': 900,
+    'player_boxscore': 96,
+    'team_boxscore': 8,
+}
+# Matches in a regular season and its playoffs at scale 1
+MATCHES_PER_SEASON = 90
+TEAMS = [f'Team {name}' for name in 'ABCDEFGHIJ']
+PLAYERS = 320
+# Most events log columns only apply to a few event types, so they are mostly empty
+SPARSE = {
+    'events_log': 0.8,
+}
+DENSE_COLUMNS = {
+    'match_id', 'season', 'match_datetime', 'set', 'set_number', 'event_type', 'event_time',
+    'team_involved', 'team_name', 'home_team', 'away_team', 'home_team_name', 'away_team_name',
+}
+
+
+def get_scale():
+    """Returns the scale of the synthetic seasons, from PYVOLLEYDATA_BENCHMARK_SCALE."""
+    return float(os.environ.get('PYVOLLEYDATA_BENCHMARK_SCALE', 1))
+
+
+def make_release(data_type, season, n_matches, seed=0):
+    """
+    Builds a synthetic release file of one season, following the registered schema.
+
+    Rows are grouped by match like the published files: every match has a date, two
+    of a small set of teams, numbered sets, and a running point count, and labels and
+    names repeat with the cardinality they have in real seasons.
+    """
+    rng = np.random.default_rng([seed, season, list(schemas.SCHEMAS).index(data_type)])
+    n_rows = n_matches * ROWS_PER_MATCH[data_type]
+    match = np.repeat(np.arange(n_matches), ROWS_PER_MATCH[data_type])
+    within = np.arange(n_rows) - match * ROWS_PER_MATCH[data_type]
+    home = rng.integers(0, len(TEAMS), n_matches)
+    away = (home + rng.integers(1, len(TEAMS), n_matches)) % len(TEAMS)
+    teams = np.array(TEAMS, dtype=object)
+    dates = pd.Timestamp(f'{season}-01-10 19:00') + pd.to_timedelta(np.arange(n_matches) * 2, unit='D')
+    sparse = SPARSE.get(data_type, 0)
+
+    columns = {}
+    for column, dtype in schemas.get_schema(data_type).items():
+        if column == 'season':
+            values = np.full(n_rows, season)
+        elif column == 'match_id':
+            values = season * 1000 + match
+        elif column in {'date', 'match_datetime'}:
+            values = dates.strftime('%Y-%m-%dT%H:%M:%S').to_numpy()[match]
+        elif column in {'home_team', 'home_team_name'}:
+            values = teams[home][match]
+        elif column in {'away_team', 'away_team_name'}:
+            values = teams[away][match]
+        elif column in {'team_involved', 'team_name', 'point_winner', 'rally_point_winner', 'serving_team'}:
+            values = np.where(rng.random(n_rows) < 0.5, teams[home][match], teams[away][match])
+        elif column in {'set', 'set_number'}:
+            values = 1 + within * 4 // ROWS_PER_MATCH[data_type]
+        elif column == 'point_number':
+            values = 1 + within % 180
+        elif column in {'player_name', 'full_name'}:
+            values = np.array([f'Player {i}' for i in range(PLAYERS)], dtype=object)[rng.integers(0, PLAYERS, n_rows)]
+        elif dtype == schemas.ID:
+            values = rng.integers(1, 100_000, n_rows)
+        elif dtype in {schemas.SMALL, schemas.COUNT, 'Int32'}:
+            values = rng.integers(0, 26, n_rows)
+        elif dtype == schemas.RATIO:
+            values = rng.random(n_rows).round(3)
+        elif dtype == schemas.FLAG:
+            values = rng.random(n_rows) < 0.2
+        elif dtype == schemas.LABEL:
+            values = rng.choice([f'{column}_{i}' for i in range(6)], n_rows)
+        elif column.endswith('_time'):
+            values = pd.Series(pd.Timestamp(f'{season}-01-10') + pd.to_timedelta(rng.integers(0, 10 ** 7, n_rows), unit='s')).dt.strftime('%Y-%m-%dT%H:%M:%S').to_numpy()
+        else:
+            values = np.array([f'{column} {i}' for i in range(2000)], dtype=object)[rng.integers(0, 2000, n_rows)]
+        values = pd.Series(values)
+        if sparse and column not in DENSE_COLUMNS:
+            values = values.where(rng.random(n_rows) >= sparse)
+        columns[column] = values
+    return pd.DataFrame(columns)
+
+
+def write_releases(directory, league, seasons, datasets=None, scale=None):
+    """
+    Writes synthetic release files for seasons of a league under their release URLs.
+
+    Seasonal datasets get one file per season, and the others one file holding every
+    season, like the published releases.
+    """
+    scale = get_scale() if scale is None else scale
+    n_matches = max(1, round(MATCHES_PER_SEASON * scale))
+    for data_type in datasets or list(schemas.SCHEMAS):
+        frames = {season: make_release(data_type, season, n_matches) for season in seasons}
+        if data_type in {'pbp', 'events_log'}:
+            files = frames
+        else:
+            files = {None: pd.concat(frames.values(), ignore_index=True)}
+        for season, frame in files.items():
+            path = os.path.join(directory, *helpers.build_url(league, data_type, season)[len(helpers.BASE_URL):].strip('/').split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            frame.to_csv(path, index=False)
+
+
+class ReleaseServer:
+    """
+    Serves release files written by `write_releases` and their manifest over local HTTP.
+
+    Files are revalidated with their ETag like on the real host, so cached loads only
+    pay for a round trip.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def manifest(self):
+        releases = []
+        for release in sorted(os.listdir(self.directory)):
+            assets = [
+                {'name': name, 'browser_download_url': f'{self.url}/{release}/{name}'}
+                for name in sorted(os.listdir(os.path.join(self.directory, release)))
+            ]
+            releases.append({'tag_name': release, 'assets': assets})
+        return json.dumps(releases).encode()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                if self.path == MANIFEST_PATH:
+                    body = server.manifest()
+                    modified = 0
+                else:
+                    path = os.path.join(server.directory, *self.path.strip('/').split('/'))
+                    if '..' in self.path or not os.path.isfile(path):
+                        self.send_response(404)
+                        self.send_header('Content-Length', '0')
+                        self.end_headers()
+                        return
+                    with open(path, 'rb') as f:
+                        body = f.read()
+                    modified = os.path.getmtime(path)
+                etag = f'"{hashlib.md5(body).hexdigest()}"'
+                status = 304 if self.headers.get('If-None-Match') == etag else 200
+                self.send_response(status)
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', formatdate(modified, usegmt=True))
+                body = body if status == 200 else b''
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
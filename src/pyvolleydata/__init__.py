@@ -1,3 +1,24 @@
-# read version from installed package
-from importlib.metadata import version
-__version__ = version("pyvolleydata")
\ No newline at end of file
+import importlib
+
+
+# Submodules are imported on first access (`pyvolleydata.get_data`), and the version is
+# read from the installed package only when asked for, since importing
+# importlib.metadata is slower than importing the package itself
+SUBMODULES = [
+    'aio', 'cache', 'config', 'database', 'filters', 'get_data', 'helpers', 'lazy', 'manifest',
+    'memo', 'players', 'processes', 'rollups', 'rotations', 'schemas', 'session', 'stats', 'storage',
+]
+
+
+def __getattr__(name):
+    if name == '__version__':
+        from importlib.metadata import version
+        globals()['__version__'] = version("pyvolleydata")
+        return globals()['__version__']
+    if name in SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), '__version__', *SUBMODULES])
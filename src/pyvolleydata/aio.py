@@ -0,0 +1,459 @@
+import asyncio
+import warnings
+from . import memo, schemas, stats
+from . import helpers as h
+from .filters import filter_columns, normalize_filters
+from .lazy import lazy_import
+
+
+pd = lazy_import('pandas')
+
+
+async def load_schedule(league = None, seasons = None, columns = None, filters = None, engine = None):
+    """
+    Load cleaned schedule data from the volleydata repository without blocking the event loop.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `get_data.load_schedule`. By
+        default, None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, see `get_data.load_schedule`. By default, None uses the 'engine' option.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The same DataFrame as `get_data.load_schedule`.
+
+    Examples
+    --------
+    >>> await load_schedule('lovb', 2025)
+    """
+    schedule = await get_data(league, seasons, 'schedule', columns=columns, filters=filters, engine=engine)
+    return schedule
+
+
+async def load_officials(league = None, seasons = None, columns = None, filters = None, engine = None):
+    """
+    Load cleaned officials data from the volleydata repository without blocking the event loop.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `get_data.load_officials`. By
+        default, None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, see `get_data.load_officials`. By default, None uses the 'engine' option.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The same DataFrame as `get_data.load_officials`.
+
+    Examples
+    --------
+    >>> await load_officials('lovb', 2025)
+    """
+    officials = await get_data(league, seasons, 'officials', columns=columns, filters=filters, engine=engine)
+    return officials
+
+
+async def load_player_info(league = None, seasons = None, columns = None, filters = None, engine = None):
+    """
+    Load cleaned player info data from the volleydata repository without blocking the event loop.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `get_data.load_player_info`. By
+        default, None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, see `get_data.load_player_info`. By default, None uses the 'engine' option.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The same DataFrame as `get_data.load_player_info`.
+
+    Examples
+    --------
+    >>> await load_player_info('lovb', 2025)
+    """
+    player_info = await get_data(league, seasons, 'player_info', columns=columns, filters=filters, engine=engine)
+    return player_info
+
+
+async def load_team_staff(league = None, seasons = None, columns = None, filters = None, engine = None):
+    """
+    Load cleaned team staff data from the volleydata repository without blocking the event loop.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `get_data.load_team_staff`. By
+        default, None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, see `get_data.load_team_staff`. By default, None uses the 'engine' option.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The same DataFrame as `get_data.load_team_staff`.
+
+    Examples
+    --------
+    >>> await load_team_staff('lovb', 2025)
+    """
+    team_staff = await get_data(league, seasons, 'team_staff', columns=columns, filters=filters, engine=engine)
+    return team_staff
+
+
+async def load_pbp(league = None, seasons = None, columns = None, filters = None, engine = None):
+    """
+    Load cleaned play-by-play data from the volleydata repository without blocking the event loop.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `get_data.load_pbp`. By
+        default, None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, see `get_data.load_pbp`. By default, None uses the 'engine' option.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The same DataFrame as `get_data.load_pbp`.
+
+    Examples
+    --------
+    >>> await load_pbp('mlv', 2025)
+    """
+    pbp = await get_data(league, seasons, 'pbp', columns=columns, filters=filters, engine=engine)
+    return pbp
+
+
+async def load_events_log(league = None, seasons = None, columns = None, filters = None, engine = None):
+    """
+    Load cleaned events log data from the volleydata repository without blocking the event loop.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `get_data.load_events_log`. By
+        default, None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, see `get_data.load_events_log`. By default, None uses the 'engine' option.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The same DataFrame as `get_data.load_events_log`.
+
+    Examples
+    --------
+    >>> await load_events_log('mlv', 2025)
+    """
+    events_log = await get_data(league, seasons, 'events_log', columns=columns, filters=filters, engine=engine)
+    return events_log
+
+
+async def load_player_boxscore(league = None, seasons = None, columns = None, filters = None, engine = None):
+    """
+    Load cleaned player boxscore data from the volleydata repository without blocking the event loop.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `get_data.load_player_boxscore`. By
+        default, None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, see `get_data.load_player_boxscore`. By default, None uses the 'engine' option.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The same DataFrame as `get_data.load_player_boxscore`.
+
+    Examples
+    --------
+    >>> await load_player_boxscore('au', [2024, 2025])
+    """
+    player_boxscore = await get_data(league, seasons, 'player_boxscore', columns=columns, filters=filters, engine=engine)
+    return player_boxscore
+
+
+async def load_team_boxscore(league = None, seasons = None, columns = None, filters = None, engine = None):
+    """
+    Load cleaned team boxscore data from the volleydata repository without blocking the event loop.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `get_data.load_team_boxscore`. By
+        default, None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, see `get_data.load_team_boxscore`. By default, None uses the 'engine' option.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The same DataFrame as `get_data.load_team_boxscore`.
+
+    Examples
+    --------
+    >>> await load_team_boxscore('au', [2024, 2025])
+    """
+    team_boxscore = await get_data(league, seasons, 'team_boxscore', columns=columns, filters=filters, engine=engine)
+    return team_boxscore
+
+
+async def get_data(league, seasons, data_type, columns=None, filters=None, engine=None):
+    """
+    Loads data for a specified league and season(s) without blocking the event loop.
+
+    The files of the seasons are downloaded and parsed concurrently in threads of the
+    event loop's default executor, through the same download cache as `helpers.get_data`.
+    The threads share the keep-alive connections of `session`, so each file after the
+    first ones reuses an open connection. Memoization, storage formats, and the handling
+    of failed seasons match `helpers.get_data` too.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to load data for.
+
+    seasons : int, list of int, or None
+        Season(s) to load. None loads all available seasons.
+
+    data_type : str
+        The type of data to fetch (e.g., 'pbp', 'events_log').
+
+    columns : list of str or None, optional
+        The columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters in the `pandas.read_parquet` format, e.g. [('set', '==', 5)]. By
+        default, None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, see `schemas.resolve_engine`. By default, None uses the 'engine' option.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the data with an additional 'league' column.
+
+    Examples
+    --------
+    >>> await get_data('mlv', 2025, 'pbp')
+    """
+    # The manifest behind resolve_seasons may need a download
+    seasons = await asyncio.to_thread(h.resolve_seasons, league, seasons, data_type)
+    filters = normalize_filters(filters)
+    h.validate_columns(columns, filter_columns(filters), data_type)
+    engine = schemas.resolve_engine(engine)
+    key = memo.memo_key(league, data_type, seasons, columns, filters)
+    with stats.span('load', league=league, data_type=data_type, cache='hit') as event:
+        df = memo.get(key)
+        if df is None:
+            event['cache'] = 'miss'
+            df = await asyncio.to_thread(memo.put, key, await read_data(league, seasons, data_type, columns, filters, engine))
+        event['frame'] = df
+    return df
+
+
+async def read_data(league, seasons, data_type, columns=None, filters=None, engine=None):
+    """
+    Reads checked seasons of a dataset, bypassing the in-memory memo.
+
+    The async counterpart of `helpers.read_data`.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to load data for.
+
+    seasons : list of int
+        The seasons to load, see `helpers.resolve_seasons`.
+
+    data_type : str
+        The type of data to fetch (e.g., 'pbp', 'events_log').
+
+    columns : list of str or None, optional
+        The columns to load, in the order they should be returned.
+
+    filters : list of list of tuple or None, optional
+        Row filters in disjunctive normal form, see `filters.normalize_filters`.
+
+    engine : str or None, optional
+        The CSV parser, see `schemas.resolve_engine`.
+
+    Returns
+    -------
+    pd.DataFrame
+        The data with an additional 'league' column.
+
+    Examples
+    --------
+    >>> await read_data('mlv', [2025], 'pbp')
+    """
+    read_columns = None if columns is None else [column for column in columns if column != 'league']
+    if data_type not in {'pbp', 'events_log'}:
+        df = await asyncio.to_thread(h.read_partitions, league, data_type, seasons, read_columns, filters, engine)
+    elif seasons:
+        frames = await read_seasons(league, data_type, seasons, read_columns, filters, engine)
+        df = await asyncio.to_thread(h.concat_frames, frames)
+    else:
+        df = schemas.empty_frame(data_type, read_columns)
+    df['league'] = pd.Categorical([league] * len(df))
+    if columns is not None:
+        df = df[columns]
+    return df
+
+
+async def read_seasons(league, data_type, seasons, columns=None, filters=None, engine=None):
+    """
+    Downloads and parses one release file per season concurrently.
+
+    Each file is read by `helpers.read_file` in a thread of the default executor. Failed
+    seasons are reported like in `helpers.read_seasons`.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to read data for.
+
+    data_type : str
+        The type of data in the files (e.g., 'pbp', 'events_log').
+
+    seasons : list of int
+        The seasons to read.
+
+    columns : list of str or None, optional
+        The columns to read. By default, None reads every column.
+
+    filters : list of list of tuple or None, optional
+        Row filters in disjunctive normal form, see `filters.normalize_filters`.
+
+    engine : str or None, optional
+        The CSV parser, see `schemas.resolve_engine`.
+
+    Returns
+    -------
+    list of pd.DataFrame
+        The parsed files of the seasons that loaded, in the order of `seasons`.
+
+    Examples
+    --------
+    >>> await read_seasons('au', 'events_log', [2022, 2023])
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(h.read_file, league, data_type, season, columns, filters, engine) for season in seasons),
+        return_exceptions=True
+    )
+    frames = []
+    errors = {}
+    for season, result in zip(seasons, results):
+        if isinstance(result, Exception):
+            errors[season] = result
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            frames.append(result)
+    if errors and not frames:
+        raise next(iter(errors.values()))
+    if errors:
+        failed = ', '.join(f'{season} ({e})' for season, e in errors.items())
+        warnings.warn(f"Failed to load {league} {data_type} for season(s): {failed}", stacklevel=2)
+    return frames
@@ -0,0 +1,537 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import urllib.error
+import uuid
+import urllib.request
+from . import config, session, stats
+
+
+INDEX_NAME = 'index.json'
+_lock = threading.Lock()
+
+
+def get_cache_dir():
+    """
+    Returns the configured cache directory, or None if caching is disabled.
+
+    Returns
+    -------
+    str or None
+        The absolute path of the cache directory.
+
+    Examples
+    --------
+    >>> get_cache_dir()
+    """
+    cache_dir = config.get_option('cache_dir')
+    if cache_dir is None:
+        return None
+    return os.path.abspath(os.path.expanduser(str(cache_dir)))
+
+
+def cache_key(league, data_type, season=None, suffix='csv'):
+    """
+    Builds the cache key for a release file.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' the file belongs to.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    season : int or None, optional
+        The season of the file. None is used for files that hold every season.
+
+    suffix : str, optional
+        The file extension of the cached file.
+
+    Returns
+    -------
+    str
+        A key of the form 'league/data_type/season.suffix'.
+
+    Examples
+    --------
+    >>> cache_key('mlv', 'pbp', 2025)
+    'mlv/pbp/2025.csv'
+    >>> cache_key('au', 'schedule')
+    'au/schedule/all.csv'
+    """
+    return f"{league}/{data_type}/{'all' if season is None else season}.{suffix}"
+
+
+def partitions_key(league, data_type, storage_format='csv'):
+    """
+    Builds the cache key for the per-season partitions of an all-seasons release file.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' the file belongs to.
+
+    data_type : str
+        The type of data in the file (e.g., 'schedule', 'player_boxscore').
+
+    storage_format : str, optional
+        The format of the partition files.
+
+    Returns
+    -------
+    str
+        A key of the form 'league/data_type/storage_format-seasons', naming a directory
+        that holds one 'season.storage_format' file per season.
+
+    Examples
+    --------
+    >>> partitions_key('mlv', 'schedule')
+    'mlv/schedule/csv-seasons'
+    """
+    return f"{league}/{data_type}/{storage_format}-seasons"
+
+
+def fetch(url, key, final=False, convert=None, headers=None, timeout=None):
+    """
+    Returns the path of a local copy of a release file, downloading it if needed.
+
+    Cached files are revalidated against the server with their ETag/Last-Modified
+    validators. Files marked as final (completed seasons) are served from disk without
+    revalidation and are never evicted. If the server cannot be reached or answers with a
+    server error (5xx), a stale cached copy is returned instead of raising.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the release file.
+
+    key : str
+        The cache key of the file, see `cache_key`.
+
+    final : bool, optional
+        Whether the file will no longer change upstream.
+
+    convert : callable or None, optional
+        A function `convert(downloaded_path, path)` that turns a freshly downloaded file
+        into the file or directory stored in the cache. By default, None stores the
+        download as is.
+
+    headers : dict or None, optional
+        Extra request headers (e.g., an Authorization header), sent with the validators.
+
+    timeout : float or None, optional
+        Number of seconds to wait for the server before treating it as unreachable. None
+        uses the default socket timeout.
+
+    Returns
+    -------
+    str
+        The path of the cached file.
+
+    Examples
+    --------
+    >>> fetch(url, cache_key('mlv', 'pbp', 2024), final=True)
+    """
+    path, entry = lookup(key)
+    if entry is not None and entry.get('final'):
+        touch(key)
+        stats.emit('download', source=url, cache='hit', bytes=0, seconds=0.0)
+        return path
+
+    request = urllib.request.Request(url, headers={**(headers or {}), **revalidation_headers(entry)})
+    start = time.perf_counter()
+    try:
+        response = session.urlopen(request, timeout)
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and entry is not None:
+            stats.emit('connect', source=url, seconds=time.perf_counter() - start)
+            touch(key, final=final)
+            stats.emit('download', source=url, cache='revalidated', bytes=0, seconds=0.0)
+            return path
+        # A server error is no answer about the file, serve the local copy like when offline
+        if e.code >= 500 and entry is not None:
+            stats.emit('download', source=url, cache='stale', bytes=0, seconds=0.0)
+            return path
+        raise
+    except urllib.error.URLError:
+        if entry is not None:
+            stats.emit('download', source=url, cache='stale', bytes=0, seconds=0.0)
+            return path
+        raise
+    stats.emit('connect', source=url, seconds=time.perf_counter() - start)
+    # The download includes writing the file into the cache and converting it
+    with response, stats.span('download', source=url, cache='miss') as event:
+        path = store(key, url, response, response.headers, final=final, convert=convert)
+        length = response.headers.get('Content-Length')
+        event['bytes'] = None if length is None else int(length)
+    return path
+
+
+def lookup(key):
+    """
+    Returns the path of a cache key and its index entry, if the file is cached.
+
+    Parameters
+    ----------
+    key : str
+        The cache key of the file, see `cache_key`.
+
+    Returns
+    -------
+    tuple of (str, dict or None)
+        The path of the file and its entry, or None if it is not cached.
+
+    Examples
+    --------
+    >>> path, entry = lookup(cache_key('mlv', 'pbp', 2024))
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        raise ValueError("Caching is disabled, set the 'cache_dir' option first")
+    path = os.path.join(cache_dir, *key.split('/'))
+    with _lock:
+        entry = _read_index(cache_dir).get(key)
+    if entry is not None and not os.path.exists(path):
+        entry = None
+    return path, entry
+
+
+def revalidation_headers(entry):
+    """
+    Returns the conditional request headers that revalidate a cached file.
+
+    Parameters
+    ----------
+    entry : dict or None
+        The index entry of the file, see `lookup`.
+
+    Returns
+    -------
+    dict
+        The If-None-Match/If-Modified-Since headers, empty if nothing is cached.
+
+    Examples
+    --------
+    >>> revalidation_headers(lookup(key)[1])
+    """
+    headers = {}
+    if entry is not None:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def store(key, url, content, headers, final=False, convert=None):
+    """
+    Writes a downloaded file into the cache and records its validators.
+
+    Parameters
+    ----------
+    key : str
+        The cache key of the file, see `cache_key`.
+
+    url : str
+        The URL the file was downloaded from.
+
+    content : file-like or bytes
+        The body of the response.
+
+    headers : mapping
+        The headers of the response, used for its ETag/Last-Modified validators.
+
+    final : bool, optional
+        Whether the file will no longer change upstream.
+
+    convert : callable or None, optional
+        A function `convert(downloaded_path, path)`, see `fetch`.
+
+    Returns
+    -------
+    str
+        The path of the cached file.
+
+    Examples
+    --------
+    >>> store(key, url, response, response.headers)
+    """
+    path, _ = lookup(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_paths = [_temp_path(path)]
+    try:
+        with open(tmp_paths[0], 'wb') as f:
+            if isinstance(content, bytes):
+                f.write(content)
+            else:
+                shutil.copyfileobj(content, f)
+        if convert is not None:
+            tmp_paths.append(_temp_path(path))
+            convert(tmp_paths[0], tmp_paths[1])
+        if os.path.isdir(path):
+            # Directories cannot be replaced atomically, move the old one out first
+            tmp_paths.append(_temp_path(path))
+            os.replace(path, tmp_paths[-1])
+            os.replace(tmp_paths[-2], path)
+        else:
+            os.replace(tmp_paths[-1], path)
+    finally:
+        for tmp_path in tmp_paths:
+            _remove(tmp_path)
+    _record(key, {
+        'url': url,
+        'etag': headers.get('ETag'),
+        'last_modified': headers.get('Last-Modified'),
+        'size': _size(path),
+        'last_access': time.time(),
+        'final': final,
+    })
+    return path
+
+
+def lookup_derived(key, source):
+    """
+    Returns the path of a file derived from cached files, if it was derived from their current version.
+
+    Parameters
+    ----------
+    key : str
+        The cache key of the derived file, see `cache_key`.
+
+    source : str
+        A signature of the files it is derived from, see `store_derived`.
+
+    Returns
+    -------
+    str or None
+        The path of the file, or None if it is not cached or was derived from other
+        versions of its sources.
+
+    Examples
+    --------
+    >>> lookup_derived(cache_key('mlv', 'pbp_players', 2025), source)
+    """
+    path, entry = lookup(key)
+    if entry is None or entry.get('source') != source:
+        return None
+    touch(key)
+    return path
+
+
+def store_derived(key, write, source=None, final=False):
+    """
+    Writes a file derived from cached files (e.g., a rollup or a joined frame) into the cache.
+
+    Derived files are recorded in the index like downloads, so they count towards the
+    'cache_max_bytes' option, are evicted when they are the least recently used, and are
+    deleted by `clear_cache`.
+
+    Parameters
+    ----------
+    key : str
+        The cache key of the derived file, see `cache_key`.
+
+    write : callable
+        A function `write(path)` that writes the file to the given temporary path.
+
+    source : str or None, optional
+        A signature of the files it is derived from, such as their `helpers.file_signature`.
+        `lookup_derived` only returns the file while the signature is the same.
+
+    final : bool, optional
+        Whether the file is never evicted. It still counts towards the budget.
+
+    Returns
+    -------
+    str
+        The path of the cached file.
+
+    Examples
+    --------
+    >>> store_derived(cache_key('mlv', 'pbp_players', 2025, 'parquet'), lambda path: df.to_parquet(path), source)
+    """
+    path, _ = lookup(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = _temp_path(path)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        _remove(tmp_path)
+    register(key, source, final)
+    return path
+
+
+def register(key, source=None, final=False):
+    """
+    Records a file that was written into the cache directory in place, with its current size.
+
+    Parameters
+    ----------
+    key : str
+        The cache key of the file, see `cache_key`.
+
+    source : str or None, optional
+        A signature of the files it is derived from, see `store_derived`.
+
+    final : bool, optional
+        Whether the file is never evicted. It still counts towards the budget.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> register('pyvolleydata.sqlite', final=True)
+    """
+    path, _ = lookup(key)
+    _record(key, {'source': source, 'size': _size(path), 'last_access': time.time(), 'final': final})
+
+
+def touch(key, final=False):
+    """
+    Marks a cached file as recently used, and optionally as final.
+
+    Parameters
+    ----------
+    key : str
+        The cache key of the file, see `cache_key`.
+
+    final : bool, optional
+        Whether the file will no longer change upstream.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> touch(cache_key('mlv', 'pbp', 2024))
+    """
+    cache_dir = get_cache_dir()
+    with _lock:
+        index = _read_index(cache_dir)
+        if key in index:
+            index[key]['last_access'] = time.time()
+            if final:
+                index[key]['final'] = True
+            _write_index(cache_dir, index)
+
+
+def clear_cache():
+    """
+    Deletes every file recorded in the cache index, and the index itself.
+
+    Only files the package wrote are deleted, so a 'cache_dir' shared with other files
+    (e.g., '~/.cache') keeps them. Directories left empty are removed too.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> clear_cache()
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return
+    with _lock:
+        for key in _read_index(cache_dir):
+            path = os.path.join(cache_dir, *key.split('/'))
+            _remove(path)
+            _prune(os.path.dirname(path), cache_dir)
+        _remove(os.path.join(cache_dir, INDEX_NAME))
+
+
+def cache_size():
+    """
+    Returns the number of bytes currently held in the cache.
+
+    Returns
+    -------
+    int
+        The total size of all cached files.
+
+    Examples
+    --------
+    >>> cache_size()
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return 0
+    with _lock:
+        return sum(entry['size'] for entry in _read_index(cache_dir).values())
+
+
+def _evict(cache_dir, index, keep=None):
+    total = sum(entry['size'] for entry in index.values())
+    max_bytes = config.get_option('cache_max_bytes')
+    if max_bytes is None or total <= max_bytes:
+        return
+    candidates = sorted(
+        (key for key, entry in index.items() if key != keep and not entry.get('final')),
+        key=lambda key: index[key]['last_access']
+    )
+    for key in candidates:
+        if total <= max_bytes:
+            break
+        total -= index.pop(key)['size']
+        _remove(os.path.join(cache_dir, *key.split('/')))
+
+
+def _record(key, entry):
+    cache_dir = get_cache_dir()
+    with _lock:
+        index = _read_index(cache_dir)
+        index[key] = entry
+        _evict(cache_dir, index, keep=key)
+        _write_index(cache_dir, index)
+
+
+def _temp_path(path):
+    return f"{path}.{uuid.uuid4().hex}.part"
+
+
+def _size(path):
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+def _remove(path):
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+def _prune(directory, cache_dir):
+    # Removes the empty directories between a deleted file and the cache directory
+    while directory != cache_dir and directory.startswith(cache_dir + os.sep):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            return
+        directory = os.path.dirname(directory)
+
+
+def _read_index(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, INDEX_NAME)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _write_index(cache_dir, index):
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.part')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(index, f)
+    os.replace(tmp_path, os.path.join(cache_dir, INDEX_NAME))
@@ -0,0 +1,120 @@
+import os
+
+
+_defaults = {
+    'cache_dir': os.environ.get('PYVOLLEYDATA_CACHE_DIR'),
+    'cache_max_bytes': 2 * 1024 ** 3,
+    'max_workers': 8,
+    'storage_format': 'csv',
+    'chunksize': 100_000,
+    'memo_ttl': 600,
+    'memo_max_bytes': 512 * 1024 ** 2,
+    'manifest_ttl': 3600,
+    'engine': 'c',
+    'processes': 0,
+}
+
+_options = dict(_defaults)
+
+
+def get_option(name):
+    """
+    Returns the current value of a pyvolleydata option.
+
+    Parameters
+    ----------
+    name : str
+        The name of the option (e.g., 'cache_dir').
+
+    Returns
+    -------
+    object
+        The current value of the option.
+
+    Examples
+    --------
+    >>> get_option('cache_dir')
+    """
+    if name not in _options:
+        raise KeyError(f"Unknown option '{name}', expected one of {sorted(_options)}")
+    return _options[name]
+
+
+def set_option(name, value):
+    """
+    Sets a pyvolleydata option for the rest of the session.
+
+    Available options:
+    - cache_dir : str or None
+        Directory used to cache downloaded release files. None (the default, unless
+        the PYVOLLEYDATA_CACHE_DIR environment variable is set) disables caching.
+    - cache_max_bytes : int
+        Byte budget for the cache. Least recently used files are evicted once it is exceeded.
+    - max_workers : int
+        Number of season files downloaded and parsed in parallel.
+    - storage_format : str
+        Format of cached files, one of 'csv' (the default), 'parquet', or 'feather'. The
+        columnar formats require pyarrow and are read through a memory map.
+    - chunksize : int
+        Number of rows parsed at a time when rows are filtered while parsing.
+    - memo_ttl : float or None
+        Number of seconds loaded DataFrames are kept in memory and returned again for
+        identical calls. None keeps them until they are evicted.
+    - memo_max_bytes : int
+        Memory budget for DataFrames kept in memory. Least recently used frames are
+        dropped once it is exceeded, and 0 disables keeping frames. Without pandas
+        copy-on-write (pandas 2 by default), repeat calls return deep copies, so frames
+        are charged twice their size.
+    - manifest_ttl : float or None
+        Number of seconds the list of published files is trusted before it is fetched
+        again. It decides which seasons exist. None fetches it once per session.
+    - engine : str
+        CSV parser, either 'c' (the default) for the single-threaded pandas parser or
+        'pyarrow' for the multithreaded pyarrow parser. Both give the same dtypes, and
+        'pyarrow' falls back to 'c' with a warning when pyarrow is not installed.
+    - processes : int
+        Number of worker processes that parse CSV files, for loads that parse many
+        large files such as full backfills. 0 (the default) parses in threads.
+
+    Parameters
+    ----------
+    name : str
+        The name of the option.
+
+    value : object
+        The new value of the option.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> set_option('cache_dir', '~/.cache/pyvolleydata')
+    >>> set_option('cache_max_bytes', 500 * 1024 ** 2)
+    """
+    if name not in _options:
+        raise KeyError(f"Unknown option '{name}', expected one of {sorted(_options)}")
+    _options[name] = value
+
+
+def reset_option(name):
+    """
+    Restores a pyvolleydata option to its default value.
+
+    Parameters
+    ----------
+    name : str
+        The name of the option.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> reset_option('cache_dir')
+    """
+    if name not in _options:
+        raise KeyError(f"Unknown option '{name}', expected one of {sorted(_options)}")
+    _options[name] = _defaults[name]
@@ -0,0 +1,351 @@
+import argparse
+import os
+import sqlite3
+from contextlib import closing
+from . import cache, schemas
+from . import helpers as h
+from .filters import filter_columns, normalize_filters
+from .lazy import lazy_import
+
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+
+DATABASE_NAME = 'pyvolleydata.sqlite'
+SOURCES_TABLE = '_sources'
+
+SQL_TYPES = {
+    schemas.ID: 'INTEGER',
+    'Int32': 'INTEGER',
+    schemas.COUNT: 'INTEGER',
+    schemas.SMALL: 'INTEGER',
+    schemas.FLAG: 'INTEGER',
+    schemas.RATIO: 'REAL',
+}
+
+# Each table gets an index on (league, season, match_id) and on each of these columns it has
+INDEXED_COLUMNS = [
+    'player_id', 'player_name',
+    'team_name', 'team_involved', 'home_team', 'away_team', 'home_team_name', 'away_team_name',
+    'set', 'set_number',
+]
+
+SQL_OPERATORS = {'==': '=', '=': '=', '!=': '!=', '<': '<', '<=': '<=', '>': '>', '>=': '>=', 'in': 'IN', 'not in': 'NOT IN'}
+
+
+def get_database_path(path=None):
+    """
+    Returns the path of the local SQLite database.
+
+    Parameters
+    ----------
+    path : str or None, optional
+        An explicit path. By default, None uses 'pyvolleydata.sqlite' in the cache directory.
+
+    Returns
+    -------
+    str
+        The absolute path of the database file.
+
+    Examples
+    --------
+    >>> get_database_path()
+    """
+    if path is not None:
+        return os.path.abspath(os.path.expanduser(str(path)))
+    cache_dir = cache.get_cache_dir()
+    if cache_dir is None:
+        raise ValueError("The database is kept in the cache directory, set the 'cache_dir' option or pass a path")
+    return os.path.join(cache_dir, DATABASE_NAME)
+
+
+def build_database(leagues=None, datasets=None, seasons=None, path=None):
+    """
+    Materializes datasets from the download cache into a local SQLite database.
+
+    Every dataset becomes one table with a 'league' column, indexed on (league, season,
+    match_id) and on its player, team, and set columns. The database is updated
+    incrementally: a season is only reloaded when its cached file changed since the last
+    build. Files are revalidated through the cache, so a build without a connection
+    reloads nothing and leaves the database as it was.
+
+    Parameters
+    ----------
+    leagues : str, list of str, or None, optional
+        The leagues to materialize. None materializes every league.
+
+    datasets : str, list of str, or None, optional
+        The datasets to materialize. None materializes every dataset.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to materialize. None materializes all available seasons.
+
+    path : str or None, optional
+        The database file, see `get_database_path`.
+
+    Returns
+    -------
+    int
+        The number of season files that were (re)loaded.
+
+    Examples
+    --------
+    >>> build_database()
+    >>> build_database(['mlv'], ['pbp', 'player_boxscore'], 2025)
+    """
+    if cache.get_cache_dir() is None:
+        raise ValueError("The database is built from the download cache, set the 'cache_dir' option first")
+    leagues = list(h.LEAGUE_CONFIG) if leagues is None else [leagues] if isinstance(leagues, str) else leagues
+    datasets = list(schemas.SCHEMAS) if datasets is None else [datasets] if isinstance(datasets, str) else datasets
+    for data_type in datasets:
+        schemas.get_schema(data_type)
+    path = get_database_path(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    loaded = 0
+    # The connection's context manager only commits, closing() releases the file
+    with closing(sqlite3.connect(path)) as connection, connection:
+        connection.execute(
+            f'CREATE TABLE IF NOT EXISTS {SOURCES_TABLE} '
+            '(league TEXT, dataset TEXT, season INTEGER, signature TEXT, PRIMARY KEY (league, dataset, season))'
+        )
+        for data_type in datasets:
+            create_table(connection, data_type)
+        for league in leagues:
+            for data_type in datasets:
+                league_years = None if seasons is None else h.league_seasons(league, seasons, data_type)
+                for season, (file_path, storage_format) in h.locate_seasons(league, data_type, league_years).items():
+                    signature = repr(h.file_signature(file_path))
+                    stored = connection.execute(
+                        f'SELECT signature FROM {SOURCES_TABLE} WHERE league = ? AND dataset = ? AND season = ?',
+                        (league, data_type, season)
+                    ).fetchone()
+                    if stored is not None and stored[0] == signature:
+                        continue
+                    df = h.read_source(file_path, storage_format, data_type)
+                    connection.execute(f'DELETE FROM "{data_type}" WHERE league = ? AND season = ?', (league, season))
+                    insert_frame(connection, data_type, league, df)
+                    connection.execute(
+                        f'INSERT OR REPLACE INTO {SOURCES_TABLE} VALUES (?, ?, ?, ?)',
+                        (league, data_type, season, signature)
+                    )
+                    connection.commit()
+                    loaded += 1
+    if path == get_database_path():
+        # The database counts towards the cache budget, but only a rebuild replaces it
+        cache.register(DATABASE_NAME, final=True)
+    return loaded
+
+
+def create_table(connection, data_type):
+    """
+    Creates the table and indexes of a dataset if they do not exist.
+
+    Parameters
+    ----------
+    connection : sqlite3.Connection
+        The open database.
+
+    data_type : str
+        The type of data (e.g., 'pbp', 'events_log').
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> create_table(connection, 'pbp')
+    """
+    schema = schemas.get_schema(data_type)
+    columns = ', '.join(['league TEXT', *(f'"{column}" {SQL_TYPES.get(dtype, "TEXT")}' for column, dtype in schema.items())])
+    connection.execute(f'CREATE TABLE IF NOT EXISTS "{data_type}" ({columns})')
+    connection.execute(
+        f'CREATE INDEX IF NOT EXISTS "{data_type}_league_season_match" ON "{data_type}" (league, season, match_id)'
+    )
+    for column in INDEXED_COLUMNS:
+        if column in schema:
+            connection.execute(f'CREATE INDEX IF NOT EXISTS "{data_type}_{column}" ON "{data_type}" ("{column}")')
+
+
+def insert_frame(connection, data_type, league, df):
+    """
+    Inserts the registered columns of a DataFrame into the table of its dataset.
+
+    Parameters
+    ----------
+    connection : sqlite3.Connection
+        The open database.
+
+    data_type : str
+        The type of data (e.g., 'pbp', 'events_log').
+
+    league : str
+        The league of the rows.
+
+    df : pd.DataFrame
+        The rows to insert. Unregistered columns are skipped and missing ones are stored as NULL.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> insert_frame(connection, 'pbp', 'mlv', pbp)
+    """
+    columns = [column for column in schemas.get_schema(data_type) if column in df]
+    # sqlite3 only binds builtin Python values, so every column is converted to objects
+    # with None for missing values
+    values = [[league] * len(df)]
+    values += [df[column].astype(object).where(df[column].notna(), None).tolist() for column in columns]
+    placeholders = ', '.join('?' * (len(columns) + 1))
+    names = ', '.join(['league', *(f'"{column}"' for column in columns)])
+    connection.executemany(f'INSERT INTO "{data_type}" ({names}) VALUES ({placeholders})', zip(*values))
+
+
+def query(sql, params=None, path=None):
+    """
+    Runs a SQL query against the local database.
+
+    Parameters
+    ----------
+    sql : str
+        The query. Tables are named after their dataset (e.g., 'pbp', 'player_boxscore').
+
+    params : sequence, dict, or None, optional
+        Values for the '?' or ':name' placeholders of the query.
+
+    path : str or None, optional
+        The database file, see `get_database_path`.
+
+    Returns
+    -------
+    pd.DataFrame
+        The result of the query, with SQLite column types.
+
+    Examples
+    --------
+    >>> query('SELECT team_name, SUM(attack_kills) AS kills FROM team_boxscore WHERE league = ? GROUP BY team_name', ['mlv'])
+    """
+    path = get_database_path(path)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f'No database at {path}, build it with build_database() first')
+    with closing(sqlite3.connect(f'file:{path}?mode=ro', uri=True)) as connection:
+        return pd.read_sql_query(sql, connection, params=params)
+
+
+def query_table(data_type, league=None, seasons=None, columns=None, filters=None, path=None):
+    """
+    Reads the matching rows of a dataset from the local database with the registered dtypes.
+
+    Parameters
+    ----------
+    data_type : str
+        The dataset to read (e.g., 'pbp', 'events_log').
+
+    league : str or None, optional
+        The league to read. None reads every league.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to read. None reads every season.
+
+    columns : list of str or None, optional
+        The columns to read, in the order they should be returned. None reads every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters in the `pandas.read_parquet` format, e.g. [('set', '==', 5)], which are
+        translated into the WHERE clause of the query.
+
+    path : str or None, optional
+        The database file, see `get_database_path`.
+
+    Returns
+    -------
+    pd.DataFrame
+        The matching rows, with an additional 'league' column.
+
+    Examples
+    --------
+    >>> query_table('pbp', 'mlv', 2025, filters=[('set', '==', 5), ('action', '==', 'Serve')])
+    """
+    schema = schemas.get_schema(data_type)
+    filters = normalize_filters(filters)
+    h.validate_columns(columns, filter_columns(filters), data_type)
+    conditions = []
+    params = []
+    if league is not None:
+        conditions.append('league = ?')
+        params.append(league)
+    if seasons is not None:
+        seasons = [seasons] if isinstance(seasons, int) else seasons
+        conditions.append(f"season IN ({', '.join('?' * len(seasons))})")
+        params += [to_sql_value(season) for season in seasons]
+    if filters is not None:
+        alternatives = []
+        for alternative in filters:
+            clauses = []
+            for column, operator, value in alternative:
+                if operator in {'in', 'not in'}:
+                    value = [to_sql_value(item) for item in value]
+                    clauses.append(f'"{column}" {SQL_OPERATORS[operator]} ({", ".join("?" * len(value))})')
+                    params += value
+                else:
+                    clauses.append(f'"{column}" {SQL_OPERATORS[operator]} ?')
+                    params.append(to_sql_value(value))
+            alternatives.append(' AND '.join(clauses))
+        conditions.append('(' + ' OR '.join(f'({clauses})' for clauses in alternatives) + ')')
+    names = '*' if columns is None else ', '.join(f'"{column}"' for column in columns)
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+    df = query(f'SELECT {names} FROM "{data_type}"{where}', params, path)
+    for column in df.columns:
+        if column in schema:
+            df[column] = df[column].astype(schema[column])
+    if 'league' in df:
+        df['league'] = df['league'].astype('category')
+    return df
+
+
+def to_sql_value(value):
+    """
+    Converts a filter value into a value sqlite3 can bind.
+
+    sqlite3 binds numpy scalars as BLOBs, which compare unequal to every stored value, so
+    they are converted into the builtin Python value they hold.
+
+    Parameters
+    ----------
+    value : object
+        The value of a filter.
+
+    Returns
+    -------
+    object
+        The value, as a builtin Python value if it was a numpy scalar.
+
+    Examples
+    --------
+    >>> to_sql_value(np.int64(2025001))
+    2025001
+    """
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the local pyvolleydata SQLite database from the download cache.')
+    parser.add_argument('--cache-dir', help="the cache directory, by default the 'cache_dir' option")
+    parser.add_argument('--league', action='append', help='a league to include, repeatable (default: all)')
+    parser.add_argument('--dataset', action='append', help='a dataset to include, repeatable (default: all)')
+    parser.add_argument('--season', action='append', type=int, help='a season to include, repeatable (default: all)')
+    parser.add_argument('--path', help='the database file, by default pyvolleydata.sqlite in the cache directory')
+    args = parser.parse_args(argv)
+    if args.cache_dir is not None:
+        from . import config
+        config.set_option('cache_dir', args.cache_dir)
+    loaded = build_database(args.league, args.dataset, args.season, args.path)
+    print(f'Loaded {loaded} file(s) into {get_database_path(args.path)}')
+
+
+if __name__ == '__main__':
+    main()
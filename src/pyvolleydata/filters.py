@@ -0,0 +1,188 @@
+from .lazy import lazy_import
+
+
+pd = lazy_import('pandas')
+
+
+OPERATORS = {'==', '=', '!=', '<', '<=', '>', '>=', 'in', 'not in'}
+
+
+def normalize_filters(filters):
+    """
+    Checks row filters and converts them to disjunctive normal form.
+
+    Filters follow the convention of `pandas.read_parquet`: a list of
+    (column, operator, value) tuples that must all hold, or a list of such lists, any
+    of which must hold.
+
+    Parameters
+    ----------
+    filters : list of tuple, list of list of tuple, or None
+        The row filters to check.
+
+    Returns
+    -------
+    list of list of tuple or None
+        The filters as a list of alternatives, each a list of conditions.
+
+    Examples
+    --------
+    >>> normalize_filters([('set', '==', 5)])
+    [[('set', '==', 5)]]
+    >>> normalize_filters([[('team_name', '==', 'Omaha')], [('match_id', 'in', [1, 2])]])
+    """
+    if filters is None:
+        return None
+    if not isinstance(filters, list) or not filters:
+        raise TypeError('Expected filters to be a non-empty list of (column, operator, value) tuples')
+    if all(isinstance(condition, tuple) for condition in filters):
+        filters = [filters]
+    for conditions in filters:
+        if not isinstance(conditions, list) or not conditions:
+            raise TypeError('Expected filters to be a non-empty list of (column, operator, value) tuples')
+        for condition in conditions:
+            if not isinstance(condition, tuple) or len(condition) != 3:
+                raise TypeError(f'Expected a (column, operator, value) tuple, got {condition!r}')
+            column, operator, value = condition
+            if operator not in OPERATORS:
+                raise ValueError(f"Unknown filter operator '{operator}', expected one of {sorted(OPERATORS)}")
+            if operator in {'in', 'not in'} and isinstance(value, (str, bytes)):
+                raise TypeError(f"Expected a collection of values for '{operator}', got {type(value).__name__}")
+    return [list(conditions) for conditions in filters]
+
+
+def filter_columns(filters):
+    """
+    Returns the columns that row filters read.
+
+    Parameters
+    ----------
+    filters : list of list of tuple or None
+        Row filters in disjunctive normal form, see `normalize_filters`.
+
+    Returns
+    -------
+    list of str
+        The filtered columns, in order of first use.
+
+    Examples
+    --------
+    >>> filter_columns([[('set', '==', 5), ('match_id', 'in', [1, 2])]])
+    ['set', 'match_id']
+    """
+    if filters is None:
+        return []
+    return list(dict.fromkeys(column for conditions in filters for column, _, _ in conditions))
+
+
+def add_condition(filters, condition):
+    """
+    Adds a condition that must hold in every alternative of row filters.
+
+    Parameters
+    ----------
+    filters : list of list of tuple or None
+        Row filters in disjunctive normal form, see `normalize_filters`.
+
+    condition : tuple
+        The (column, operator, value) condition to add.
+
+    Returns
+    -------
+    list of list of tuple
+        The combined filters.
+
+    Examples
+    --------
+    >>> add_condition([[('set', '==', 5)]], ('season', 'in', [2025]))
+    [[('set', '==', 5), ('season', 'in', [2025])]]
+    """
+    if filters is None:
+        return [[condition]]
+    return [[*conditions, condition] for conditions in filters]
+
+
+def apply_filters(df, filters):
+    """
+    Keeps the rows of a DataFrame that match row filters.
+
+    Rows where a filtered column is missing never match.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The frame to filter.
+
+    filters : list of list of tuple or None
+        Row filters in disjunctive normal form, see `normalize_filters`.
+
+    Returns
+    -------
+    pd.DataFrame
+        The matching rows.
+
+    Examples
+    --------
+    >>> apply_filters(pbp, [[('set', '==', 5)]])
+    """
+    if filters is None:
+        return df
+    mask = pd.Series(False, index=df.index)
+    for conditions in filters:
+        matches = pd.Series(True, index=df.index)
+        for column, operator, value in conditions:
+            matches &= _compare(df[column], operator, value)
+        mask |= matches
+    return df[mask]
+
+
+def to_expression(filters):
+    """
+    Converts row filters into a pyarrow compute expression.
+
+    Parameters
+    ----------
+    filters : list of list of tuple
+        Row filters in disjunctive normal form, see `normalize_filters`.
+
+    Returns
+    -------
+    pyarrow.compute.Expression
+        An expression that is true for matching rows.
+
+    Examples
+    --------
+    >>> table.filter(to_expression([[('set', '==', 5)]]))
+    """
+    import pyarrow.compute as pc
+    import pyarrow.parquet
+    expression = None
+    for conditions in filters:
+        matches = pyarrow.parquet.filters_to_expression([conditions])
+        for column, _, _ in conditions:
+            matches = matches & pc.field(column).is_valid()
+        expression = matches if expression is None else expression | matches
+    return expression
+
+
+def _compare(series, operator, value):
+    if operator in {'<', '<=', '>', '>='} and isinstance(series.dtype, pd.CategoricalDtype):
+        # Unordered categoricals only compare equality, so ranges compare the labels
+        series = series.astype(series.cat.categories.dtype)
+    if operator in {'==', '='}:
+        result = series == value
+    elif operator == '!=':
+        result = series != value
+    elif operator == '<':
+        result = series < value
+    elif operator == '<=':
+        result = series <= value
+    elif operator == '>':
+        result = series > value
+    elif operator == '>=':
+        result = series >= value
+    elif operator == 'in':
+        result = series.isin(list(value))
+    else:
+        result = ~series.isin(list(value))
+    return result.fillna(False).astype(bool) & series.notna()
@@ -1,9 +1,13 @@
-import pandas as pd
+from . import cache, database, memo, players, rollups, rotations, stats
 from . import helpers as h
 from datetime import datetime
+from .lazy import lazy_import
 
 
-def load_schedule(league = None, seasons = None):
+pd = lazy_import('pandas')
+
+
+def load_schedule(league = None, seasons = None, columns = None, filters = None, engine = None):
     """
     Load cleaned schedule data from the volleydata repository.
     
@@ -18,6 +22,21 @@ def load_schedule(league = None, seasons = None):
         - list of int : Multiple seasons (e.g., [2024, 2025])
         - None : Load all available seasons
 
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column. Other columns are skipped while parsing.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples that must all hold, e.g.
+        [('match_id', 'in', [1, 2]), ('set', '==', 5)], or a list of such lists, any of
+        which must hold. Rows that do not match are dropped while parsing. By default,
+        None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, either 'c' or 'pyarrow' for pyarrow's multithreaded reader.
+        Both give the same result, and 'pyarrow' falls back to 'c' with a warning when
+        pyarrow is not installed. By default, None uses the 'engine' option.
+
     Returns
     -------
     pandas.DataFrame
@@ -44,11 +63,11 @@ def load_schedule(league = None, seasons = None):
     >>> load_schedule('mlv', [2024, 2025])
     >>> load_schedule('au')
     """
-    schedule = h.get_data(league, seasons, 'schedule')
+    schedule = h.get_data(league, seasons, 'schedule', columns=columns, filters=filters, engine=engine)
     return schedule
 
 
-def load_officials(league = None, seasons = None):
+def load_officials(league = None, seasons = None, columns = None, filters = None, engine = None):
     """
     Load cleaned officials data from the volleydata repository.
 
@@ -63,6 +82,21 @@ def load_officials(league = None, seasons = None):
         - list of int : Multiple seasons (e.g., [2024, 2025])
         - None : Load all available seasons
 
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column. Other columns are skipped while parsing.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples that must all hold, e.g.
+        [('match_id', 'in', [1, 2]), ('set', '==', 5)], or a list of such lists, any of
+        which must hold. Rows that do not match are dropped while parsing. By default,
+        None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, either 'c' or 'pyarrow' for pyarrow's multithreaded reader.
+        Both give the same result, and 'pyarrow' falls back to 'c' with a warning when
+        pyarrow is not installed. By default, None uses the 'engine' option.
+
     Returns
     -------
     pandas.DataFrame
@@ -88,11 +122,11 @@ def load_officials(league = None, seasons = None):
     >>> load_officials('mlv', [2024, 2025])
     >>> load_officials('au')
     """
-    officials = h.get_data(league, seasons, 'officials')
+    officials = h.get_data(league, seasons, 'officials', columns=columns, filters=filters, engine=engine)
     return officials
 
 
-def load_player_info(league = None, seasons = None):
+def load_player_info(league = None, seasons = None, columns = None, filters = None, engine = None):
     """
     Load cleaned player info data from the volleydata repository.
 
@@ -107,6 +141,21 @@ def load_player_info(league = None, seasons = None):
         - list of int : Multiple seasons (e.g., [2024, 2025])
         - None : Load all available seasons
 
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column. Other columns are skipped while parsing.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples that must all hold, e.g.
+        [('match_id', 'in', [1, 2]), ('set', '==', 5)], or a list of such lists, any of
+        which must hold. Rows that do not match are dropped while parsing. By default,
+        None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, either 'c' or 'pyarrow' for pyarrow's multithreaded reader.
+        Both give the same result, and 'pyarrow' falls back to 'c' with a warning when
+        pyarrow is not installed. By default, None uses the 'engine' option.
+
     Returns
     -------
     pandas.DataFrame
@@ -152,11 +201,11 @@ def load_player_info(league = None, seasons = None):
     >>> load_player_info('mlv', [2024, 2025])
     >>> load_player_info('au')
     """
-    player_info = h.get_data(league, seasons, "player_info")
+    player_info = h.get_data(league, seasons, "player_info", columns=columns, filters=filters, engine=engine)
     return player_info
 
 
-def load_team_staff(league = None, seasons = None):
+def load_team_staff(league = None, seasons = None, columns = None, filters = None, engine = None):
     """
     Load cleaned team staff data from the volleydata repository.
 
@@ -171,6 +220,21 @@ def load_team_staff(league = None, seasons = None):
         - list of int : Multiple seasons (e.g., [2024, 2025])
         - None : Load all available seasons
 
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column. Other columns are skipped while parsing.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples that must all hold, e.g.
+        [('match_id', 'in', [1, 2]), ('set', '==', 5)], or a list of such lists, any of
+        which must hold. Rows that do not match are dropped while parsing. By default,
+        None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, either 'c' or 'pyarrow' for pyarrow's multithreaded reader.
+        Both give the same result, and 'pyarrow' falls back to 'c' with a warning when
+        pyarrow is not installed. By default, None uses the 'engine' option.
+
     Returns
     -------
     pandas.DataFrame
@@ -196,11 +260,11 @@ def load_team_staff(league = None, seasons = None):
     >>> load_team_staff('mlv', [2024, 2025])
     >>> load_team_staff('au')
     """
-    team_staff = h.get_data(league, seasons, "team_staff")
+    team_staff = h.get_data(league, seasons, "team_staff", columns=columns, filters=filters, engine=engine)
     return team_staff
 
 
-def load_pbp(league = None, seasons = None):
+def load_pbp(league = None, seasons = None, columns = None, filters = None, with_players = False, engine = None):
     """
     Load cleaned pbp data from the volleydata repository.
 
@@ -215,6 +279,28 @@ def load_pbp(league = None, seasons = None):
         - list of int : Multiple seasons (e.g., [2024, 2025])
         - None : Load all available seasons
 
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column. Other columns are skipped while parsing.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples that must all hold, e.g.
+        [('match_id', 'in', [1, 2]), ('set', '==', 5)], or a list of such lists, any of
+        which must hold. Rows that do not match are dropped while parsing. By default,
+        None keeps every row.
+
+    with_players : bool, optional
+        Whether to add the 'player_id', 'player_name', and 'primary_position' of the
+        player involved in each row from `load_player_info`, matched on the match, team,
+        and jersey number. The joined data of each season is kept in memory like other
+        loads, and stored in the cache when one is configured. Columns and filters may
+        refer to the player columns.
+
+    engine : str or None, optional
+        The CSV parser, either 'c' or 'pyarrow' for pyarrow's multithreaded reader.
+        Both give the same result, and 'pyarrow' falls back to 'c' with a warning when
+        pyarrow is not installed. By default, None uses the 'engine' option.
+
     Returns
     -------
     pandas.DataFrame
@@ -246,12 +332,17 @@ def load_pbp(league = None, seasons = None):
     >>> load_pbp('lovb', 2025)
     >>> load_pbp('mlv', [2024, 2025])
     >>> load_pbp('au')
+    >>> load_pbp('mlv', 2025, columns=['match_id', 'action', 'outcome'], filters=[('set', '==', 5)])
+    >>> load_pbp('mlv', 2025, with_players=True, filters=[('player_name', '==', 'Jane Doe')])
     """
-    pbp = h.get_data(league, seasons, "pbp")
+    if with_players:
+        pbp = players.get_pbp_players(league, seasons, columns=columns, filters=filters, engine=engine)
+        return pbp
+    pbp = h.get_data(league, seasons, "pbp", columns=columns, filters=filters, engine=engine)
     return pbp
 
 
-def load_events_log(league = None, seasons = None):
+def load_events_log(league = None, seasons = None, columns = None, filters = None, engine = None):
     """
     Load cleaned events log data from the volleydata repository.
 
@@ -266,6 +357,21 @@ def load_events_log(league = None, seasons = None):
         - list of int : Multiple seasons (e.g., [2024, 2025])
         - None : Load all available seasons
 
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column. Other columns are skipped while parsing.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples that must all hold, e.g.
+        [('match_id', 'in', [1, 2]), ('set', '==', 5)], or a list of such lists, any of
+        which must hold. Rows that do not match are dropped while parsing. By default,
+        None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, either 'c' or 'pyarrow' for pyarrow's multithreaded reader.
+        Both give the same result, and 'pyarrow' falls back to 'c' with a warning when
+        pyarrow is not installed. By default, None uses the 'engine' option.
+
     Returns
     -------
     pandas.DataFrame
@@ -333,12 +439,13 @@ def load_events_log(league = None, seasons = None):
     >>> load_events_log('lovb', 2025)
     >>> load_events_log('mlv', [2024, 2025])
     >>> load_events_log('au')
+    >>> load_events_log('mlv', 2025, filters=[('event_type', 'in', ['Substitution', 'Libero'])])
     """
-    events_log = h.get_data(league, seasons, 'events_log')
+    events_log = h.get_data(league, seasons, 'events_log', columns=columns, filters=filters, engine=engine)
     return events_log
 
 
-def load_player_boxscore(league = None, seasons = None):
+def load_player_boxscore(league = None, seasons = None, columns = None, filters = None, engine = None):
     """
     Load cleaned player boxscore data from the volleydata repository.
 
@@ -353,6 +460,21 @@ def load_player_boxscore(league = None, seasons = None):
         - list of int : Multiple seasons (e.g., [2024, 2025])
         - None : Load all available seasons
 
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column. Other columns are skipped while parsing.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples that must all hold, e.g.
+        [('match_id', 'in', [1, 2]), ('set', '==', 5)], or a list of such lists, any of
+        which must hold. Rows that do not match are dropped while parsing. By default,
+        None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, either 'c' or 'pyarrow' for pyarrow's multithreaded reader.
+        Both give the same result, and 'pyarrow' falls back to 'c' with a warning when
+        pyarrow is not installed. By default, None uses the 'engine' option.
+
     Returns
     -------
     pandas.DataFrame
@@ -405,12 +527,13 @@ def load_player_boxscore(league = None, seasons = None):
     >>> load_player_boxscore('lovb', 2025)
     >>> load_player_boxscore('mlv', [2024, 2025])
     >>> load_player_boxscore('au')
+    >>> load_player_boxscore('mlv', 2025, columns=['player_name', 'points'], filters=[('team_name', '==', 'Omaha Supernovas')])
     """
-    player_boxscore = h.get_data(league, seasons, 'player_boxscore')
+    player_boxscore = h.get_data(league, seasons, 'player_boxscore', columns=columns, filters=filters, engine=engine)
     return player_boxscore
 
 
-def load_team_boxscore(league = None, seasons = None):
+def load_team_boxscore(league = None, seasons = None, columns = None, filters = None, engine = None):
     """
     Load cleaned mlv team boxscore data from the volleydata repository.
 
@@ -425,6 +548,21 @@ def load_team_boxscore(league = None, seasons = None):
         - list of int : Multiple seasons (e.g., [2024, 2025])
         - None : Load all available seasons
 
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column. Other columns are skipped while parsing.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples that must all hold, e.g.
+        [('match_id', 'in', [1, 2]), ('set', '==', 5)], or a list of such lists, any of
+        which must hold. Rows that do not match are dropped while parsing. By default,
+        None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, either 'c' or 'pyarrow' for pyarrow's multithreaded reader.
+        Both give the same result, and 'pyarrow' falls back to 'c' with a warning when
+        pyarrow is not installed. By default, None uses the 'engine' option.
+
     Returns
     -------
     pandas.DataFrame
@@ -470,5 +608,746 @@ def load_team_boxscore(league = None, seasons = None):
     >>> load_team_boxscore('mlv', [2024, 2025])
     >>> load_team_boxscore('au')
     """
-    team_boxscore = h.get_data(league, seasons, 'team_boxscore')
-    return team_boxscore
\ No newline at end of file
+    team_boxscore = h.get_data(league, seasons, 'team_boxscore', columns=columns, filters=filters, engine=engine)
+    return team_boxscore
+
+
+def load_player_rollups(league = None, seasons = None, by = 'season'):
+    """
+    Load per-player totals of the player boxscores for each season or match.
+
+    Counts are summed over the per-set boxscore rows and the ratios ('serve_efficiency',
+    'attack_success_ratio', 'attack_efficiency', 'positive_reception_ratio', and
+    'perfect_reception_ratio') are recomputed from the summed counts rather than
+    averaged. Players are told apart by the 'player_id' they have in `load_player_info`,
+    so players who share a name get their own rows. With a cache configured (see the
+    'cache_dir' option) the totals of every season are stored on disk and only
+    recomputed when the boxscores of that season change.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+
+    by : str, optional
+        Either 'season' for one row per player, team, and season, or 'match' for one row
+        per player, team, and match.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The 'season', 'match_id' (by match only), 'team_name', 'player_id', and
+        'player_name' of each row, the number of 'matches' and 'sets' it covers, the boxscore counts and
+        ratios, and a 'league' column.
+
+    Examples
+    --------
+    >>> load_player_rollups('mlv', 2025).nlargest(10, 'attack_kills')
+    >>> load_player_rollups('mlv', 2025, by='match')
+    """
+    player_rollups = rollups.get_rollups(league, seasons, 'player_boxscore', by)
+    return player_rollups
+
+
+def load_team_rollups(league = None, seasons = None, by = 'season'):
+    """
+    Load per-team totals of the team boxscores for each season or match.
+
+    Counts are summed over the per-set boxscore rows and the ratios are recomputed from
+    the summed counts, see `load_player_rollups`.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+
+    by : str, optional
+        Either 'season' for one row per team and season, or 'match' for one row per team
+        and match.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The 'season', 'match_id' (by match only), and 'team_name' of each row, the number
+        of 'matches' and 'sets' it covers, the boxscore counts and ratios, and a
+        'league' column.
+
+    Examples
+    --------
+    >>> load_team_rollups('lovb', 2025).sort_values('attack_efficiency', ascending=False)
+    """
+    team_rollups = rollups.get_rollups(league, seasons, 'team_boxscore', by)
+    return team_rollups
+
+
+def load_many(leagues = None, datasets = None, seasons = None, concat = False):
+    """
+    Load several datasets for several leagues at once from the volleydata repository.
+
+    Every file that is needed is planned up front and downloaded once, in parallel, which
+    is much faster than calling each `load_*` function for each league in turn.
+
+    Parameters
+    ----------
+    leagues : str, list of str, or None, optional
+        Leagues to load, any of 'mlv', 'lovb', or 'au'. By default, None loads every league.
+
+    datasets : str, list of str, or None, optional
+        Datasets to load, any of 'schedule', 'officials', 'player_info', 'team_staff',
+        'pbp', 'events_log', 'player_boxscore', or 'team_boxscore'. By default, None
+        loads every dataset.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. Each league loads the requested seasons it has played. By
+        default, None loads all available seasons of each league.
+
+    concat : bool, optional
+        Whether to combine the leagues of each dataset into a single DataFrame.
+
+    Returns
+    -------
+    dict
+        A mapping of league to a mapping of dataset to DataFrame, or of dataset to
+        DataFrame if `concat` is True. Each DataFrame has the columns documented in the
+        matching `load_*` function, including 'league'.
+
+    Examples
+    --------
+    >>> data = load_many(['mlv', 'lovb'], ['pbp', 'schedule'], 2025)
+    >>> data['lovb']['pbp']
+    >>> load_many(datasets=['player_boxscore'], concat=True)['player_boxscore']
+    """
+    data = h.get_many(leagues, datasets, seasons, concat=concat)
+    return data
+
+
+def load_match(league = None, match_id = None, datasets = None, refresh = False):
+    """
+    Load every row of a single match from several datasets.
+
+    With a cache configured (see the 'cache_dir' option), the local files are indexed by
+    match, so only the rows of the match are read and repeat lookups take milliseconds.
+    The first lookup for a league downloads and indexes its files.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to load data for.
+
+    match_id : int
+        The match to load.
+
+    datasets : str, list of str, or None, optional
+        Datasets to load, any of 'schedule', 'officials', 'player_info', 'team_staff',
+        'pbp', 'events_log', 'player_boxscore', or 'team_boxscore'. By default, None
+        loads every dataset.
+
+    refresh : bool, optional
+        Whether to check the server for updated files before looking up the match.
+
+    Returns
+    -------
+    dict
+        A mapping of dataset to a DataFrame with the rows of the match, with the columns
+        documented in the matching `load_*` function.
+
+    Examples
+    --------
+    >>> match = load_match('mlv', 2025001, ['pbp', 'events_log', 'player_boxscore'])
+    >>> match['pbp']
+    """
+    match = h.get_match(league, match_id, datasets, refresh=refresh)
+    return match
+
+
+def build_database(leagues = None, datasets = None, seasons = None, path = None):
+    """
+    Materialize datasets from the download cache into a local SQLite database.
+
+    Each dataset becomes a table named after it (e.g., 'pbp', 'player_boxscore') with an
+    extra 'league' column, indexed on (league, season, match_id) and on its player, team,
+    and set columns. Rebuilding only reloads the season files that changed, and without
+    a connection the cached files are used as they are. Requires the 'cache_dir' option.
+    The same build runs from the shell with `python -m pyvolleydata.database`.
+
+    Parameters
+    ----------
+    leagues : str, list of str, or None, optional
+        Leagues to include, any of 'mlv', 'lovb', or 'au'. By default, None includes every league.
+
+    datasets : str, list of str, or None, optional
+        Datasets to include. By default, None includes every dataset.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to include. By default, None includes all available seasons.
+
+    path : str or None, optional
+        The database file. By default, None uses 'pyvolleydata.sqlite' in the cache directory.
+
+    Returns
+    -------
+    int
+        The number of season files that were (re)loaded.
+
+    Examples
+    --------
+    >>> build_database()
+    >>> build_database('mlv', ['pbp', 'player_boxscore'])
+    """
+    loaded = database.build_database(leagues, datasets, seasons, path)
+    return loaded
+
+
+def query(sql = None, params = None, path = None):
+    """
+    Run a SQL query against the local database built by `build_database`.
+
+    Parameters
+    ----------
+    sql : str
+        The query. Tables are named after their dataset and have a 'league' column.
+
+    params : sequence, dict, or None, optional
+        Values for the '?' or ':name' placeholders of the query.
+
+    path : str or None, optional
+        The database file. By default, None uses 'pyvolleydata.sqlite' in the cache directory.
+
+    Returns
+    -------
+    pd.DataFrame
+        The result of the query.
+
+    Examples
+    --------
+    >>> query('''
+    ...     SELECT p.player_name, SUM(b.attack_kills) AS kills
+    ...     FROM player_boxscore b JOIN player_info p USING (league, season, player_id)
+    ...     WHERE b.league = ? GROUP BY p.player_name ORDER BY kills DESC LIMIT 10
+    ... ''', ['mlv'])
+    """
+    df = database.query(sql, params, path)
+    return df
+
+
+def query_table(dataset = None, league = None, seasons = None, columns = None, filters = None, path = None):
+    """
+    Load the matching rows of a dataset from the local database built by `build_database`.
+
+    Takes the same `columns` and `filters` as the `load_*` functions, but the filters run
+    as an indexed SQL query, so only the matching rows are read.
+
+    Parameters
+    ----------
+    dataset : str
+        The dataset to load (e.g., 'pbp', 'events_log').
+
+    league : str or None, optional
+        The league to load. By default, None loads every league.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads every season in the database.
+
+    columns : list of str or None, optional
+        Columns to load. By default, None loads every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters in the `pandas.read_parquet` format, e.g. [('set', '==', 5)].
+
+    path : str or None, optional
+        The database file. By default, None uses 'pyvolleydata.sqlite' in the cache directory.
+
+    Returns
+    -------
+    pd.DataFrame
+        The matching rows with the dtypes of the matching `load_*` function and a 'league' column.
+
+    Examples
+    --------
+    >>> query_table('pbp', 'mlv', 2025, filters=[('set', '==', 5), ('action', '==', 'Serve')])
+    """
+    df = database.query_table(dataset, league, seasons, columns, filters, path)
+    return df
+
+
+def build_rotations(events_log = None):
+    """
+    Reconstruct the players on court for every rally of an events log.
+
+    Lineups are carried forward from the events that record them through substitutions,
+    libero swaps, and the rotation after every side out, so each rally gets the six
+    players of both sides without looping over the rows.
+
+    Parameters
+    ----------
+    events_log : pandas.DataFrame
+        Events log rows as returned by `load_events_log`, for any leagues and seasons.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per rally, keyed by 'match_id', 'set', and 'point_number' like the rows
+        of `load_pbp`, with the server, winner, and score of the rally and the jersey
+        numbers in positions 'home_team_p1' through 'away_team_p6'.
+
+    Examples
+    --------
+    >>> lineups = build_rotations(load_events_log('mlv', 2025))
+    >>> load_pbp('mlv', 2025).merge(lineups, on=['match_id', 'set', 'point_number'], suffixes=('', '_rally'))
+    """
+    lineups = rotations.build_rotations(events_log)
+    return lineups
+
+
+def clear_cache(disk = False):
+    """
+    Clear the DataFrames that `load_*` functions keep in memory for repeat calls.
+
+    Parameters
+    ----------
+    disk : bool, optional
+        Whether to also delete the files cached on disk under the 'cache_dir' option.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> clear_cache()
+    >>> clear_cache(disk=True)
+    """
+    memo.clear()
+    if disk:
+        cache.clear_cache()
+
+
+def cache_info():
+    """
+    Report how often `load_*` calls were answered from memory.
+
+    Returns
+    -------
+    dict
+        The number of 'hits' and 'misses' since the last `clear_cache`, the number of
+        DataFrames kept in memory ('entries'), and the 'bytes' charged for them against the
+        'memo_max_bytes' option.
+
+    Examples
+    --------
+    >>> load_player_info('mlv', 2025)
+    >>> load_player_info('mlv', 2025)
+    >>> cache_info()
+    {'hits': 1, 'misses': 1, 'entries': 1, 'bytes': 48213}
+    """
+    info = memo.info()
+    return info
+
+
+def record_stats():
+    """
+    Record where the time of `load_*` calls goes, file by file and stage by stage.
+
+    Every file that is loaded while the context is open reports how long connecting,
+    downloading, parsing, filtering, and concatenating took, with the bytes downloaded,
+    how the cache answered, and the rows and memory of the resulting frames. Outside
+    the context nothing is measured. For a callback per event, see `stats.add_hook`.
+
+    Returns
+    -------
+    context manager
+        A context manager yielding a `stats.Recorder`, whose `report()` has one row per
+        event and `summary()` one row per stage.
+
+    Examples
+    --------
+    >>> with record_stats() as recorder:
+    ...     load_events_log('mlv', [2024, 2025])
+    >>> recorder.summary()
+    >>> recorder.report().query("stage == 'parse'")
+    """
+    recorder = stats.record()
+    return recorder
+
+
+def iter_schedule(league = None, seasons = None, by = 'chunk', chunksize = None, columns = None, filters = None):
+    """
+    Stream cleaned schedule data from the volleydata repository.
+
+    Yields the rows of `load_schedule` in smaller DataFrames, parsing the data as it is read,
+    so peak memory is bounded by the size of each frame rather than the whole dataset.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+        - int : Single season year (e.g., 2025)
+        - list of int : Multiple seasons (e.g., [2024, 2025])
+        - None : Load all available seasons
+
+    by : str, optional
+        How rows are grouped into the yielded DataFrames.
+        - 'chunk' : Up to `chunksize` rows at a time (the default)
+        - 'season' : One DataFrame per season
+        - 'match' : One DataFrame per match_id
+
+    chunksize : int or None, optional
+        Number of rows parsed at a time. By default, None uses the 'chunksize' option.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `load_schedule`. By default,
+        None keeps every row.
+
+    Yields
+    ------
+    pandas.DataFrame
+        The next group of rows, with the columns documented in `load_schedule`.
+
+    Examples
+    --------
+    >>> for season in iter_schedule('au', by='season'):
+    ...     print(season['season'].iloc[0], len(season))
+    """
+    return h.iter_data(league, seasons, 'schedule', by=by, chunksize=chunksize, columns=columns, filters=filters)
+
+def iter_officials(league = None, seasons = None, by = 'chunk', chunksize = None, columns = None, filters = None):
+    """
+    Stream cleaned officials data from the volleydata repository.
+
+    Yields the rows of `load_officials` in smaller DataFrames, parsing the data as it is read,
+    so peak memory is bounded by the size of each frame rather than the whole dataset.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+        - int : Single season year (e.g., 2025)
+        - list of int : Multiple seasons (e.g., [2024, 2025])
+        - None : Load all available seasons
+
+    by : str, optional
+        How rows are grouped into the yielded DataFrames.
+        - 'chunk' : Up to `chunksize` rows at a time (the default)
+        - 'season' : One DataFrame per season
+        - 'match' : One DataFrame per match_id
+
+    chunksize : int or None, optional
+        Number of rows parsed at a time. By default, None uses the 'chunksize' option.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `load_officials`. By default,
+        None keeps every row.
+
+    Yields
+    ------
+    pandas.DataFrame
+        The next group of rows, with the columns documented in `load_officials`.
+
+    Examples
+    --------
+    >>> for season in iter_officials('mlv', [2024, 2025], by='season'):
+    ...     print(len(season))
+    """
+    return h.iter_data(league, seasons, 'officials', by=by, chunksize=chunksize, columns=columns, filters=filters)
+
+def iter_player_info(league = None, seasons = None, by = 'chunk', chunksize = None, columns = None, filters = None):
+    """
+    Stream cleaned player-info data from the volleydata repository.
+
+    Yields the rows of `load_player_info` in smaller DataFrames, parsing the data as it is read,
+    so peak memory is bounded by the size of each frame rather than the whole dataset.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+        - int : Single season year (e.g., 2025)
+        - list of int : Multiple seasons (e.g., [2024, 2025])
+        - None : Load all available seasons
+
+    by : str, optional
+        How rows are grouped into the yielded DataFrames.
+        - 'chunk' : Up to `chunksize` rows at a time (the default)
+        - 'season' : One DataFrame per season
+        - 'match' : One DataFrame per match_id
+
+    chunksize : int or None, optional
+        Number of rows parsed at a time. By default, None uses the 'chunksize' option.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `load_player_info`. By default,
+        None keeps every row.
+
+    Yields
+    ------
+    pandas.DataFrame
+        The next group of rows, with the columns documented in `load_player_info`.
+
+    Examples
+    --------
+    >>> for season in iter_player_info('mlv', [2024, 2025], by='season'):
+    ...     print(len(season))
+    """
+    return h.iter_data(league, seasons, 'player_info', by=by, chunksize=chunksize, columns=columns, filters=filters)
+
+def iter_team_staff(league = None, seasons = None, by = 'chunk', chunksize = None, columns = None, filters = None):
+    """
+    Stream cleaned team-staff data from the volleydata repository.
+
+    Yields the rows of `load_team_staff` in smaller DataFrames, parsing the data as it is read,
+    so peak memory is bounded by the size of each frame rather than the whole dataset.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+        - int : Single season year (e.g., 2025)
+        - list of int : Multiple seasons (e.g., [2024, 2025])
+        - None : Load all available seasons
+
+    by : str, optional
+        How rows are grouped into the yielded DataFrames.
+        - 'chunk' : Up to `chunksize` rows at a time (the default)
+        - 'season' : One DataFrame per season
+        - 'match' : One DataFrame per match_id
+
+    chunksize : int or None, optional
+        Number of rows parsed at a time. By default, None uses the 'chunksize' option.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `load_team_staff`. By default,
+        None keeps every row.
+
+    Yields
+    ------
+    pandas.DataFrame
+        The next group of rows, with the columns documented in `load_team_staff`.
+
+    Examples
+    --------
+    >>> for season in iter_team_staff('mlv', [2024, 2025], by='season'):
+    ...     print(len(season))
+    """
+    return h.iter_data(league, seasons, 'team_staff', by=by, chunksize=chunksize, columns=columns, filters=filters)
+
+def iter_pbp(league = None, seasons = None, by = 'chunk', chunksize = None, columns = None, filters = None):
+    """
+    Stream cleaned pbp data from the volleydata repository.
+
+    Yields the rows of `load_pbp` in smaller DataFrames, parsing the data as it is read,
+    so peak memory is bounded by the size of each frame rather than the whole dataset.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+        - int : Single season year (e.g., 2025)
+        - list of int : Multiple seasons (e.g., [2024, 2025])
+        - None : Load all available seasons
+
+    by : str, optional
+        How rows are grouped into the yielded DataFrames.
+        - 'chunk' : Up to `chunksize` rows at a time (the default)
+        - 'season' : One DataFrame per season
+        - 'match' : One DataFrame per match_id
+
+    chunksize : int or None, optional
+        Number of rows parsed at a time. By default, None uses the 'chunksize' option.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `load_pbp`. By default,
+        None keeps every row.
+
+    Yields
+    ------
+    pandas.DataFrame
+        The next group of rows, with the columns documented in `load_pbp`.
+
+    Examples
+    --------
+    >>> for match in iter_pbp('mlv', 2025, by='match'):
+    ...     print(match['match_id'].iloc[0], len(match))
+    """
+    return h.iter_data(league, seasons, 'pbp', by=by, chunksize=chunksize, columns=columns, filters=filters)
+
+def iter_events_log(league = None, seasons = None, by = 'chunk', chunksize = None, columns = None, filters = None):
+    """
+    Stream cleaned events log data from the volleydata repository.
+
+    Yields the rows of `load_events_log` in smaller DataFrames, parsing the data as it is read,
+    so peak memory is bounded by the size of each frame rather than the whole dataset.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+        - int : Single season year (e.g., 2025)
+        - list of int : Multiple seasons (e.g., [2024, 2025])
+        - None : Load all available seasons
+
+    by : str, optional
+        How rows are grouped into the yielded DataFrames.
+        - 'chunk' : Up to `chunksize` rows at a time (the default)
+        - 'season' : One DataFrame per season
+        - 'match' : One DataFrame per match_id
+
+    chunksize : int or None, optional
+        Number of rows parsed at a time. By default, None uses the 'chunksize' option.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `load_events_log`. By default,
+        None keeps every row.
+
+    Yields
+    ------
+    pandas.DataFrame
+        The next group of rows, with the columns documented in `load_events_log`.
+
+    Examples
+    --------
+    >>> for chunk in iter_events_log('au', chunksize=50_000, columns=['match_id', 'event_type']):
+    ...     print(len(chunk))
+    """
+    return h.iter_data(league, seasons, 'events_log', by=by, chunksize=chunksize, columns=columns, filters=filters)
+
+def iter_player_boxscore(league = None, seasons = None, by = 'chunk', chunksize = None, columns = None, filters = None):
+    """
+    Stream cleaned player-boxscore data from the volleydata repository.
+
+    Yields the rows of `load_player_boxscore` in smaller DataFrames, parsing the data as it is read,
+    so peak memory is bounded by the size of each frame rather than the whole dataset.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+        - int : Single season year (e.g., 2025)
+        - list of int : Multiple seasons (e.g., [2024, 2025])
+        - None : Load all available seasons
+
+    by : str, optional
+        How rows are grouped into the yielded DataFrames.
+        - 'chunk' : Up to `chunksize` rows at a time (the default)
+        - 'season' : One DataFrame per season
+        - 'match' : One DataFrame per match_id
+
+    chunksize : int or None, optional
+        Number of rows parsed at a time. By default, None uses the 'chunksize' option.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `load_player_boxscore`. By default,
+        None keeps every row.
+
+    Yields
+    ------
+    pandas.DataFrame
+        The next group of rows, with the columns documented in `load_player_boxscore`.
+
+    Examples
+    --------
+    >>> for season in iter_player_boxscore('mlv', [2024, 2025], by='season'):
+    ...     print(len(season))
+    """
+    return h.iter_data(league, seasons, 'player_boxscore', by=by, chunksize=chunksize, columns=columns, filters=filters)
+
+def iter_team_boxscore(league = None, seasons = None, by = 'chunk', chunksize = None, columns = None, filters = None):
+    """
+    Stream cleaned team-boxscore data from the volleydata repository.
+
+    Yields the rows of `load_team_boxscore` in smaller DataFrames, parsing the data as it is read,
+    so peak memory is bounded by the size of each frame rather than the whole dataset.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'pvf', or 'au' to load data for.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. By default, None loads all available seasons.
+        - int : Single season year (e.g., 2025)
+        - list of int : Multiple seasons (e.g., [2024, 2025])
+        - None : Load all available seasons
+
+    by : str, optional
+        How rows are grouped into the yielded DataFrames.
+        - 'chunk' : Up to `chunksize` rows at a time (the default)
+        - 'season' : One DataFrame per season
+        - 'match' : One DataFrame per match_id
+
+    chunksize : int or None, optional
+        Number of rows parsed at a time. By default, None uses the 'chunksize' option.
+
+    columns : list of str or None, optional
+        Columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters as (column, operator, value) tuples, see `load_team_boxscore`. By default,
+        None keeps every row.
+
+    Yields
+    ------
+    pandas.DataFrame
+        The next group of rows, with the columns documented in `load_team_boxscore`.
+
+    Examples
+    --------
+    >>> for season in iter_team_boxscore('mlv', [2024, 2025], by='season'):
+    ...     print(len(season))
+    """
+    return h.iter_data(league, seasons, 'team_boxscore', by=by, chunksize=chunksize, columns=columns, filters=filters)
\ No newline at end of file
@@ -1,8 +1,29 @@
-import pandas as pd
+import io
+import json
+import os
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from . import cache, config, manifest, memo, processes, schemas, session, stats, storage
+from .filters import add_condition, apply_filters, filter_columns, normalize_filters
+from .lazy import lazy_import
 
 
-def get_data(league, seasons, data_type):
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+
+BASE_URL = "https://github.com/awosoga/volleydata/releases/download"
+
+LEAGUE_CONFIG = {
+    'mlv': {'start_year': 2024, 'internal_name': 'pvf'},
+    'lovb': {'start_year': 2025, 'internal_name': 'lovb'},
+    'au': {'start_year': 2022, 'internal_name': 'aupvb'}
+}
+
+
+def get_data(league, seasons, data_type, max_workers=None, columns=None, filters=None, engine=None):
     """
     Loads data for a specified league and season(s) from the volleydata repository.
 
@@ -20,50 +41,191 @@ def get_data(league, seasons, data_type):
         - list of int : Multiple seasons (e.g., [2024, 2025])
         - None : Load all available seasons
 
+    max_workers : int or None, optional
+        The number of season files to download and parse in parallel. By default, None
+        uses the 'max_workers' option.
+
+    columns : list of str or None, optional
+        The columns to load, in the order they should be returned. By default, None loads
+        every column. Other columns are skipped while parsing.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters in the `pandas.read_parquet` format, e.g. [('set', '==', 5)]. Rows
+        that do not match are dropped while parsing. By default, None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, either 'c' or 'pyarrow', see `schemas.resolve_engine`. Both give
+        the same result. By default, None uses the 'engine' option.
+
     Returns
     -------
     pd.DataFrame
         A DataFrame containing the merged or filtered data with an additional 'league' column.
+        Identical calls within the 'memo_ttl' option return a copy of the earlier result,
+        see `memo.get`.
 
     Examples
     --------
     >>> fetch_data(league='mlv', data_type='pbp', seasons=2024)
     >>> fetch_data(league='au', data_type='rosters', seasons=[2022, 2023])
     >>> fetch_data(league='lovb', data_type='events_log')
+    >>> fetch_data(league='mlv', data_type='pbp', columns=['match_id', 'action'], filters=[('set', '==', 5)])
     """
-    league_config = {
-        'mlv': {'start_year': 2024, 'internal_name': 'pvf'},
-        'lovb': {'start_year': 2025, 'internal_name': 'lovb'},
-        'au': {'start_year': 2022, 'internal_name': 'aupvb'}
-    }
-    if league in league_config:
-        league_start_year = league_config.get(league).get('start_year')
-        league_internal_name = league_config.get(league).get('internal_name')
-    
-        if isinstance(seasons, int):
-            seasons = [seasons]
-        if isinstance(seasons, list):
-            validate_seasons(seasons, league_start_year)
-        elif seasons is None:
-            seasons = list(range(league_start_year, datetime.now().year + 1))
-        else:
-            raise TypeError(f'Expected seasons to be an int, list of ints, or None, got {type(seasons).__name__}')
-        base_url = "https://github.com/awosoga/volleydata/releases/download"
-        df = pd.DataFrame()
-        if data_type in {'pbp', 'events_log'}:
-            for season in seasons:
-                file_path = f"{league_internal_name}-{data_type.replace("_", "-")}/{league_internal_name}_{data_type}_{season}.csv"
-                df = pd.concat([df, pd.read_csv(f"{base_url}/{file_path}")])
-        else:
-            file_path = f"{league_internal_name}-{data_type.replace("_", "-")}/{league_internal_name}_{data_type}.csv"
-            df = pd.read_csv(f"{base_url}/{file_path}")
-            df = df[df['season'].isin(seasons)]
+    seasons = resolve_seasons(league, seasons, data_type)
+    filters = normalize_filters(filters)
+    validate_columns(columns, filter_columns(filters), data_type)
+    # Both engines give the same frame, so the engine is not part of the memo key
+    engine = schemas.resolve_engine(engine)
+    with stats.span('load', league=league, data_type=data_type, cache='hit') as event:
+        def load():
+            event['cache'] = 'miss'
+            return read_data(league, seasons, data_type, max_workers, columns, filters, engine)
+
+        df = memo.memoized(memo.memo_key(league, data_type, seasons, columns, filters), load)
+        event['frame'] = df
+    return df
+
+
+def read_data(league, seasons, data_type, max_workers=None, columns=None, filters=None, engine=None):
+    """
+    Reads checked seasons of a dataset, bypassing the in-memory memo.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to load data for.
+
+    seasons : list of int
+        The seasons to load, see `resolve_seasons`.
+
+    data_type : str
+        The type of data to fetch (e.g., 'pbp', 'events_log').
+
+    max_workers : int or None, optional
+        The number of season files to download and parse in parallel.
+
+    columns : list of str or None, optional
+        The columns to load, in the order they should be returned.
+
+    filters : list of list of tuple or None, optional
+        Row filters in disjunctive normal form, see `filters.normalize_filters`.
+
+    engine : str or None, optional
+        The CSV parser, see `schemas.resolve_engine`. By default, None uses the 'engine'
+        option.
+
+    Returns
+    -------
+    pd.DataFrame
+        The data with an additional 'league' column.
+
+    Examples
+    --------
+    >>> read_data('mlv', [2025], 'pbp')
+    """
+    read_columns = None if columns is None else [column for column in columns if column != 'league']
+    if data_type not in {'pbp', 'events_log'}:
+        df = read_partitions(league, data_type, seasons, read_columns, filters, engine)
+    elif seasons:
+        df = concat_frames(read_seasons(league, data_type, seasons, max_workers, read_columns, filters, engine))
     else:
-        raise TypeError("league must be one of 'mlv', 'lovb', or 'au'")
-    df['league'] = league
+        df = schemas.empty_frame(data_type, read_columns)
+    df['league'] = pd.Categorical([league] * len(df))
+    if columns is not None:
+        df = df[columns]
     return df
 
 
+def resolve_seasons(league, seasons, data_type=None):
+    """
+    Checks the league and season(s) to load and returns the seasons as a list.
+
+    Datasets released as one file per season are checked against the manifest of
+    published files, so no file is ever requested that does not exist. When the manifest
+    cannot be fetched, seasons up to the current year are assumed to exist.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to load data for.
+
+    seasons : int, list of int, or None
+        Season(s) to load. None resolves to all available seasons.
+
+    data_type : str or None, optional
+        The type of data to load (e.g., 'pbp', 'events_log'). By default, None only
+        checks seasons against the calendar.
+
+    Returns
+    -------
+    list of int
+        The seasons to load.
+
+    Examples
+    --------
+    >>> resolve_seasons('mlv', 2025)
+    [2025]
+    >>> resolve_seasons('au', None, 'pbp')
+    >>> resolve_seasons('au', 2023, 'pbp')  # Raises ValueError if no 2023 file was published
+    """
+    if league not in LEAGUE_CONFIG:
+        raise TypeError("league must be one of 'mlv', 'lovb', or 'au'")
+    league_start_year = LEAGUE_CONFIG.get(league).get('start_year')
+    if isinstance(seasons, int):
+        seasons = [seasons]
+    if isinstance(seasons, list):
+        validate_seasons(seasons, league_start_year)
+    elif seasons is not None:
+        raise TypeError(f'Expected seasons to be an int, list of ints, or None, got {type(seasons).__name__}')
+    published = published_seasons(league, data_type) if data_type in {'pbp', 'events_log'} else None
+    if published is None:
+        return list(range(league_start_year, datetime.now().year + 1)) if seasons is None else seasons
+    if seasons is None:
+        return [season for season in published if season >= league_start_year]
+    unpublished = [season for season in seasons if season not in published]
+    if unpublished:
+        available = ', '.join(map(str, published)) or 'none'
+        raise ValueError(
+            f"No {league} {data_type} file is published for season(s) {', '.join(map(str, unpublished))} "
+            f"(available: {available})"
+        )
+    return seasons
+
+
+def published_seasons(league, data_type):
+    """
+    Returns the seasons of a dataset that have a published file, according to the manifest.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to look up.
+
+    data_type : str
+        The type of data released as one file per season (e.g., 'pbp', 'events_log').
+
+    Returns
+    -------
+    list of int or None
+        The published seasons in ascending order, or None if the manifest is unavailable.
+
+    Examples
+    --------
+    >>> published_seasons('mlv', 'pbp')
+    [2024, 2025]
+    """
+    internal_name = LEAGUE_CONFIG.get(league).get('internal_name')
+    assets = manifest.release_assets(f"{internal_name}-{data_type.replace('_', '-')}")
+    if assets is None:
+        return None
+    prefix = f"{internal_name}_{data_type}_"
+    return sorted(
+        int(name[len(prefix):-len('.csv')])
+        for name in assets
+        if name.startswith(prefix) and name.endswith('.csv') and name[len(prefix):-len('.csv')].isdigit()
+    )
+
+
 def validate_seasons(seasons, league_start_year):
     """
     Checks whether all the provided seasons are valid years and raises an error if not.
@@ -92,4 +254,1213 @@ def validate_seasons(seasons, league_start_year):
         if not isinstance(year, int):
             raise TypeError(f'Expected an integer for year, got {type(year).__name__}')
         if year < league_start_year or year > datetime.now().year:
-            raise ValueError(f'Year {year} out of valid range for this league ({league_start_year}-{datetime.now().year})')
\ No newline at end of file
+            raise ValueError(f'Year {year} out of valid range for this league ({league_start_year}-{datetime.now().year})')
+
+
+def validate_columns(columns, filtered_columns, data_type):
+    """
+    Checks whether the requested and filtered columns exist in a dataset and raises an error if not.
+
+    Parameters
+    ----------
+    columns : list of str or None
+        The columns requested by the caller.
+
+    filtered_columns : list of str
+        The columns read by row filters.
+
+    data_type : str
+        The type of data (e.g., 'pbp', 'events_log').
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> validate_columns(['match_id', 'action'], ['set'], 'pbp')
+    >>> validate_columns('match_id', [], 'pbp')  # Raises TypeError
+    >>> validate_columns(['goals'], [], 'pbp')  # Raises ValueError
+    """
+    if columns is not None and (not isinstance(columns, list) or not all(isinstance(column, str) for column in columns)):
+        raise TypeError('Expected columns to be a list of column names')
+    schema = schemas.get_schema(data_type)
+    unknown = [column for column in (columns or []) if column not in schema and column != 'league']
+    unknown += [column for column in filtered_columns if column not in schema]
+    if unknown:
+        raise ValueError(f"Unknown {data_type} column(s): {', '.join(unknown)}")
+
+
+def build_url(league, data_type, season=None):
+    """
+    Builds the volleydata release URL of a data file.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to build the URL for.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    season : int or None, optional
+        The season of the file. None builds the URL of the file holding every season.
+
+    Returns
+    -------
+    str
+        The URL of the release file.
+
+    Examples
+    --------
+    >>> build_url('mlv', 'pbp', 2025)
+    >>> build_url('au', 'schedule')
+    """
+    internal_name = LEAGUE_CONFIG.get(league).get('internal_name')
+    release = f"{internal_name}-{data_type.replace("_", "-")}"
+    if season is None:
+        return f"{BASE_URL}/{release}/{internal_name}_{data_type}.csv"
+    return f"{BASE_URL}/{release}/{internal_name}_{data_type}_{season}.csv"
+
+
+def read_file(league, data_type, season=None, columns=None, filters=None, engine=None):
+    """
+    Reads a single release file, going through the local cache when one is configured.
+
+    With a cache configured and the 'storage_format' option set to 'parquet' or 'feather',
+    the file is converted once after download and later reads are memory-mapped.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to read data for.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    season : int or None, optional
+        The season of the file. None reads the file holding every season.
+
+    columns : list of str or None, optional
+        The columns to read. By default, None reads every column.
+
+    filters : list of list of tuple or None, optional
+        Row filters in disjunctive normal form, see `filters.normalize_filters`.
+
+    engine : str or None, optional
+        The CSV parser, see `schemas.resolve_engine`. By default, None uses the 'engine'
+        option.
+
+    Returns
+    -------
+    pd.DataFrame
+        The parsed contents of the file.
+
+    Examples
+    --------
+    >>> read_file('mlv', 'pbp', 2025)
+    >>> read_file('au', 'schedule')
+    """
+    source, storage_format = locate_file(league, data_type, season)
+    return read_source(source, storage_format, data_type, columns, filters, engine)
+
+
+def read_source(source, storage_format, data_type, columns=None, filters=None, engine=None):
+    """
+    Reads a located release file into a DataFrame.
+
+    With the 'processes' option set, CSV files are parsed in the shared process pool,
+    see `processes.read_source`.
+
+    Parameters
+    ----------
+    source : str or file-like
+        The URL, cached path, or buffer of the file, see `locate_file`.
+
+    storage_format : str
+        The format of the file, one of 'csv', 'parquet', or 'feather'.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    columns : list of str or None, optional
+        The columns to read. By default, None reads every column.
+
+    filters : list of list of tuple or None, optional
+        Row filters in disjunctive normal form, see `filters.normalize_filters`.
+
+    engine : str or None, optional
+        The CSV parser, see `schemas.resolve_engine`. By default, None uses the 'engine'
+        option.
+
+    Returns
+    -------
+    pd.DataFrame
+        The parsed contents of the file.
+
+    Examples
+    --------
+    >>> read_source(*locate_file('mlv', 'pbp', 2025), 'pbp')
+    """
+    pool = processes.get_pool() if storage_format == 'csv' and isinstance(source, str) else None
+    name = source if isinstance(source, str) else None
+    if storage_format == 'csv' and pool is None and isinstance(source, str) and '://' in source:
+        source = download(source)
+    with stats.span('parse', data_type=data_type, source=name) as event:
+        if pool is not None:
+            df = processes.read_source(pool, source, storage_format, data_type, columns, filters, engine)
+        elif storage_format == 'csv':
+            df = parse_csv(source, data_type, columns, filters, engine)
+        else:
+            df = storage.read_stored(source, storage_format, columns, filters)
+        event['frame'] = df
+    return df
+
+
+def download(url):
+    """
+    Downloads a release file into memory.
+
+    pandas downloads a URL in full before parsing it as well, so downloading it first
+    only separates the two, which lets the 'connect' and 'download' stages be measured,
+    see `stats.span`.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the file.
+
+    Returns
+    -------
+    io.BytesIO
+        The body of the file.
+
+    Examples
+    --------
+    >>> download(build_url('mlv', 'pbp', 2025))
+    """
+    start = time.perf_counter()
+    with session.urlopen(url) as response:
+        connected = time.perf_counter()
+        stats.emit('connect', source=url, seconds=connected - start)
+        content = response.read()
+    stats.emit('download', source=url, bytes=len(content), seconds=time.perf_counter() - connected)
+    return io.BytesIO(content)
+
+
+def locate_file(league, data_type, season=None):
+    """
+    Returns where a release file can be read from, downloading it into the cache if one is configured.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to read data for.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    season : int or None, optional
+        The season of the file. None locates the file holding every season.
+
+    Returns
+    -------
+    tuple of (str, str)
+        The URL or cached path of the file and its format, one of 'csv', 'parquet', or 'feather'.
+
+    Examples
+    --------
+    >>> locate_file('mlv', 'pbp', 2025)
+    """
+    url = build_url(league, data_type, season)
+    if cache.get_cache_dir() is None:
+        return url, 'csv'
+    key, final, convert, storage_format = file_target(league, data_type, season)
+    return cache.fetch(url, key, final=final, convert=convert), storage_format
+
+
+def file_target(league, data_type, season=None):
+    """
+    Returns how a release file is stored in the cache under the 'storage_format' option.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' the file belongs to.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    season : int or None, optional
+        The season of the file. None is used for the file holding every season.
+
+    Returns
+    -------
+    tuple of (str, bool, callable or None, str)
+        The cache key, whether the file is final, the conversion to apply after download
+        (see `cache.fetch`), and the stored format.
+
+    Examples
+    --------
+    >>> file_target('mlv', 'pbp', 2024)
+    ('mlv/pbp/2024.csv', True, None, 'csv')
+    """
+    final = season is not None and season < datetime.now().year
+    storage_format = config.get_option('storage_format')
+    if storage_format == 'csv':
+        return cache.cache_key(league, data_type, season), final, None, 'csv'
+    storage.validate_storage_format(storage_format)
+    key = cache.cache_key(league, data_type, season, suffix=storage_format)
+    if final or season is None:
+        convert = lambda csv_path, path: storage.convert_csv(csv_path, path, storage_format, data_type)
+    else:
+        # Seasons in progress grow match by match, so only the changed matches are re-parsed
+        previous_path = os.path.join(cache.get_cache_dir(), *key.split('/'))
+        convert = lambda csv_path, path: update_season_file(csv_path, path, previous_path, storage_format, data_type)
+    return key, final, convert, storage_format
+
+
+def update_season_file(csv_path, path, previous_path, storage_format, data_type):
+    """
+    Converts a downloaded season file, re-parsing only the matches that changed since the stored copy.
+
+    The raw rows of every match are hashed, and the hashes are kept in the metadata of the
+    stored file. When a newer version of the file is downloaded, unchanged matches are
+    copied from the stored file and only new and revised matches are parsed. Matches that
+    disappeared are dropped. Files that are not ordered by match, or whose header changed,
+    are converted in full.
+
+    Parameters
+    ----------
+    csv_path : str
+        The path of the downloaded CSV file.
+
+    path : str
+        The path to write the converted file to.
+
+    previous_path : str
+        The path of the currently stored copy of the file, which may not exist.
+
+    storage_format : str
+        Either 'parquet' or 'feather'.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> update_season_file('2025.csv.part', '2025.feather.part', 'mlv/pbp/2025.feather', 'feather', 'pbp')
+    """
+    with open(csv_path, 'rb') as f:
+        content = f.read()
+    scan = storage.scan_matches(content)
+    if scan is None:
+        storage.write_frame(schemas.read_csv(csv_path, data_type), path, storage_format)
+        return
+    header, blocks, digests = scan
+    previous = storage.read_digests(previous_path, storage_format) if os.path.exists(previous_path) else None
+    if previous is None or previous['header'] != digests['header']:
+        storage.write_frame(schemas.read_csv(csv_path, data_type), path, storage_format, digests)
+        return
+
+    changed = [match_id for match_id, digest in digests['matches'].items() if previous['matches'].get(match_id) != digest]
+    unchanged = [int(match_id) for match_id, digest in digests['matches'].items() if previous['matches'].get(match_id) == digest]
+    frames = []
+    if unchanged:
+        frames.append(storage.read_stored(previous_path, storage_format, filters=[[('match_id', 'in', unchanged)]]))
+    if changed:
+        delta = header + b''.join(content[blocks[match_id][0]:blocks[match_id][1]] for match_id in changed)
+        frames.append(schemas.read_csv(io.BytesIO(delta), data_type))
+    df = concat_frames(frames)
+    # Put the matches back in the order of the downloaded file, keeping the order of their rows
+    order = df['match_id'].map({int(match_id): i for i, match_id in enumerate(blocks)}).to_numpy()
+    df = df.iloc[np.argsort(order, kind='stable')].reset_index(drop=True)
+    storage.write_frame(df, path, storage_format, digests)
+
+
+def read_partitions(league, data_type, seasons, columns=None, filters=None, engine=None):
+    """
+    Reads the requested seasons of a dataset that is released as one all-seasons file.
+
+    Rows from other seasons are never materialized. Without a cache they are dropped
+    chunk by chunk while the file is parsed. With a cache the file is split into
+    per-season partitions once after download, and only the requested partitions are read.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to read data for.
+
+    data_type : str
+        The type of data in the file (e.g., 'schedule', 'player_boxscore').
+
+    seasons : list of int
+        The seasons to read.
+
+    columns : list of str or None, optional
+        The columns to read. By default, None reads every column.
+
+    filters : list of list of tuple or None, optional
+        Row filters in disjunctive normal form, see `filters.normalize_filters`.
+
+    engine : str or None, optional
+        The CSV parser, see `schemas.resolve_engine`. By default, None uses the 'engine'
+        option.
+
+    Returns
+    -------
+    pd.DataFrame
+        The rows of the requested seasons.
+
+    Examples
+    --------
+    >>> read_partitions('mlv', 'player_boxscore', [2025])
+    """
+    if cache.get_cache_dir() is None:
+        return read_file(league, data_type, columns=columns, filters=add_condition(filters, ('season', 'in', seasons)), engine=engine)
+    partitions, storage_format = locate_partitions(league, data_type)
+    return read_partition_files(partitions, storage_format, data_type, seasons, columns, filters, engine)
+
+
+def read_partition_files(partitions, storage_format, data_type, seasons, columns=None, filters=None, engine=None):
+    """
+    Reads the requested seasons from located per-season partitions.
+
+    Parameters
+    ----------
+    partitions : dict
+        A mapping of season to partition path, see `locate_partitions`.
+
+    storage_format : str
+        The format of the partitions, one of 'csv', 'parquet', or 'feather'.
+
+    data_type : str
+        The type of data in the partitions (e.g., 'schedule', 'player_boxscore').
+
+    seasons : list of int
+        The seasons to read. Seasons without a partition are skipped.
+
+    columns : list of str or None, optional
+        The columns to read. By default, None reads every column.
+
+    filters : list of list of tuple or None, optional
+        Row filters in disjunctive normal form, see `filters.normalize_filters`.
+
+    engine : str or None, optional
+        The CSV parser, see `schemas.resolve_engine`. By default, None uses the 'engine'
+        option.
+
+    Returns
+    -------
+    pd.DataFrame
+        The rows of the requested seasons.
+
+    Examples
+    --------
+    >>> read_partition_files(*locate_partitions('mlv', 'schedule'), 'schedule', [2025])
+    """
+    frames = [
+        read_source(partitions[season], storage_format, data_type, columns, filters, engine)
+        for season in seasons if season in partitions
+    ]
+    if not frames:
+        return schemas.empty_frame(data_type, columns)
+    return concat_frames(frames)
+
+
+def locate_partitions(league, data_type):
+    """
+    Returns the cached per-season partitions of an all-seasons release file, downloading and splitting it if needed.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to read data for.
+
+    data_type : str
+        The type of data in the file (e.g., 'schedule', 'player_boxscore').
+
+    Returns
+    -------
+    tuple of (dict, str)
+        A mapping of season to partition path, and the format of the partitions.
+
+    Examples
+    --------
+    >>> locate_partitions('mlv', 'schedule')
+    """
+    key, convert, storage_format = partitions_target(league, data_type)
+    path = cache.fetch(build_url(league, data_type), key, convert=convert)
+    return list_partitions(path, storage_format), storage_format
+
+
+def partitions_target(league, data_type):
+    """
+    Returns how the per-season partitions of an all-seasons release file are stored in the cache.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' the file belongs to.
+
+    data_type : str
+        The type of data in the file (e.g., 'schedule', 'player_boxscore').
+
+    Returns
+    -------
+    tuple of (str, callable, str)
+        The cache key of the partitions directory, the conversion that splits a
+        download into it (see `cache.fetch`), and the format of the partitions.
+
+    Examples
+    --------
+    >>> partitions_target('mlv', 'schedule')
+    """
+    storage_format = config.get_option('storage_format')
+    storage.validate_storage_format(storage_format)
+    chunksize = config.get_option('chunksize')
+    key = cache.partitions_key(league, data_type, storage_format)
+    previous_path = os.path.join(cache.get_cache_dir(), *key.split('/'))
+    return (
+        key,
+        lambda csv_path, path: storage.write_partitions(csv_path, path, storage_format, data_type, chunksize, previous_path),
+        storage_format
+    )
+
+
+def list_partitions(path, storage_format):
+    """
+    Lists the per-season partition files in a cached partitions directory.
+
+    Parameters
+    ----------
+    path : str
+        The path of the partitions directory.
+
+    storage_format : str
+        The format of the partitions, one of 'csv', 'parquet', or 'feather'.
+
+    Returns
+    -------
+    dict
+        A mapping of season to partition path.
+
+    Examples
+    --------
+    >>> list_partitions('cache/mlv/schedule/csv-seasons', 'csv')
+    """
+    partitions = {}
+    for name in os.listdir(path):
+        season, _, suffix = name.partition('.')
+        if suffix == storage_format:
+            partitions[int(season)] = os.path.join(path, name)
+    return partitions
+
+
+def parse_csv(source, data_type, columns=None, filters=None, engine=None):
+    """
+    Parses a release CSV file, skipping unrequested columns and rows while parsing.
+
+    Without filters the file is parsed in one pass. With filters it is parsed in chunks of
+    'chunksize' rows, so only the matching rows of one chunk are held at a time. The
+    'pyarrow' engine parses the file in one multithreaded pass and filters afterwards.
+
+    Parameters
+    ----------
+    source : str or file-like
+        The path, URL, or buffer of the CSV file.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    columns : list of str or None, optional
+        The columns to return. By default, None returns every column.
+
+    filters : list of list of tuple or None, optional
+        Row filters in disjunctive normal form, see `filters.normalize_filters`.
+
+    engine : str or None, optional
+        The CSV parser, see `schemas.resolve_engine`. By default, None uses the 'engine'
+        option.
+
+    Returns
+    -------
+    pd.DataFrame
+        The parsed rows and columns.
+
+    Examples
+    --------
+    >>> parse_csv('aupvb_pbp_2024.csv', 'pbp', columns=['match_id'], filters=[[('set', '==', 5)]])
+    """
+    if filters is None:
+        return schemas.read_csv(source, data_type, usecols=columns, engine=engine)
+    if schemas.resolve_engine(engine) == 'pyarrow':
+        usecols = None if columns is None else list(dict.fromkeys([*columns, *filter_columns(filters)]))
+        df = schemas.read_csv(source, data_type, usecols=usecols, engine='pyarrow')
+        with stats.span('filter', data_type=data_type) as event:
+            df = apply_filters(df, filters)
+            event['rows'] = len(df)
+        if columns is not None:
+            df = df[[column for column in columns if column in df]]
+        # Like the chunks of the C engine, drops the categories of the filtered out rows
+        return concat_frames([df])
+    return concat_frames(list(iter_csv_chunks(source, data_type, config.get_option('chunksize'), columns, filters)))
+
+
+def iter_csv_chunks(source, data_type, chunksize, columns=None, filters=None):
+    """
+    Parses a release CSV file chunk by chunk, skipping unrequested columns and rows.
+
+    Parameters
+    ----------
+    source : str or file-like
+        The path, URL, or buffer of the CSV file.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    chunksize : int
+        The number of rows parsed at a time.
+
+    columns : list of str or None, optional
+        The columns to return. By default, None returns every column.
+
+    filters : list of list of tuple or None, optional
+        Row filters in disjunctive normal form, see `filters.normalize_filters`.
+
+    Yields
+    ------
+    pd.DataFrame
+        The matching rows of each chunk, which may be empty.
+
+    Examples
+    --------
+    >>> for chunk in iter_csv_chunks('aupvb_pbp_2024.csv', 'pbp', 10_000, filters=[[('set', '==', 5)]]):
+    ...     print(len(chunk))
+    """
+    usecols = None if columns is None else list(dict.fromkeys([*columns, *filter_columns(filters)]))
+    for chunk in schemas.iter_csv(source, data_type, chunksize, usecols=usecols):
+        with stats.span('filter', data_type=data_type) as event:
+            chunk = apply_filters(chunk, filters)
+            event['rows'] = len(chunk)
+        yield chunk if columns is None else chunk[[column for column in columns if column in chunk]]
+
+
+def read_seasons(league, data_type, seasons, max_workers=None, columns=None, filters=None, engine=None):
+    """
+    Downloads and parses one release file per season in parallel.
+
+    Every season is attempted even if some of them fail. Failed seasons are reported in a
+    warning and left out of the result, unless every season fails, in which case the error
+    of the first season is raised.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to read data for.
+
+    data_type : str
+        The type of data in the files (e.g., 'pbp', 'events_log').
+
+    seasons : list of int
+        The seasons to read.
+
+    max_workers : int or None, optional
+        The number of files to fetch at once. By default, None uses the 'max_workers' option.
+
+    columns : list of str or None, optional
+        The columns to read. By default, None reads every column.
+
+    filters : list of list of tuple or None, optional
+        Row filters in disjunctive normal form, see `filters.normalize_filters`.
+
+    engine : str or None, optional
+        The CSV parser, see `schemas.resolve_engine`. By default, None uses the 'engine'
+        option.
+
+    Returns
+    -------
+    list of pd.DataFrame
+        The parsed files of the seasons that loaded, in the order of `seasons`.
+
+    Examples
+    --------
+    >>> read_seasons('au', 'events_log', [2022, 2023, 2024], max_workers=4)
+    """
+    if max_workers is None:
+        max_workers = config.get_option('max_workers')
+    if not seasons:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(seasons))) as executor:
+        futures = [executor.submit(read_file, league, data_type, season, columns, filters, engine) for season in seasons]
+    return collect_seasons(league, data_type, seasons, futures)
+
+
+def collect_seasons(league, data_type, seasons, futures):
+    """
+    Collects the results of per-season reads, reporting the seasons that failed.
+
+    Failed seasons are reported in a warning and left out of the result, unless every
+    season failed, in which case the error of the first season is raised.
+
+    Parameters
+    ----------
+    league : str
+        The league the seasons were read for.
+
+    data_type : str
+        The type of data that was read (e.g., 'pbp', 'events_log').
+
+    seasons : list of int
+        The seasons that were read.
+
+    futures : list of concurrent.futures.Future
+        The finished reads, in the order of `seasons`.
+
+    Returns
+    -------
+    list of pd.DataFrame
+        The frames of the seasons that loaded, in the order of `seasons`.
+
+    Examples
+    --------
+    >>> collect_seasons('mlv', 'pbp', [2024, 2025], futures)
+    """
+    frames = []
+    errors = {}
+    for season, future in zip(seasons, futures):
+        try:
+            frames.append(future.result())
+        except Exception as e:
+            errors[season] = e
+    if errors and not frames:
+        raise next(iter(errors.values()))
+    if errors:
+        failed = ', '.join(f'{season} ({e})' for season, e in errors.items())
+        warnings.warn(f"Failed to load {league} {data_type} for season(s): {failed}", stacklevel=3)
+    return frames
+
+
+def get_many(leagues, datasets, seasons=None, concat=False, max_workers=None):
+    """
+    Loads several datasets for several leagues, fetching every file once and in parallel.
+
+    Every file needed by the requested leagues, datasets, and seasons is planned up front
+    and read in a single thread pool, so the downloads of different leagues and datasets
+    overlap. Failed seasons are handled like in `read_seasons`.
+
+    Parameters
+    ----------
+    leagues : str, list of str, or None
+        The leagues to load, any of 'mlv', 'lovb', or 'au'. None loads every league.
+
+    datasets : str, list of str, or None
+        The datasets to load (e.g., ['pbp', 'schedule']). None loads every dataset.
+
+    seasons : int, list of int, or None, optional
+        Season(s) to load. Each league loads the requested seasons it has played, and
+        None loads all available seasons of each league.
+
+    concat : bool, optional
+        Whether to concatenate the leagues of each dataset into one frame.
+
+    max_workers : int or None, optional
+        The number of files to read at once. By default, None uses the 'max_workers' option.
+
+    Returns
+    -------
+    dict
+        {league: {dataset: DataFrame}}, or {dataset: DataFrame} if `concat` is True. Every
+        frame has a 'league' column.
+
+    Examples
+    --------
+    >>> get_many(['mlv', 'lovb'], ['pbp', 'schedule'], 2025)
+    >>> get_many(None, 'schedule', concat=True)['schedule']
+    """
+    leagues = list(LEAGUE_CONFIG) if leagues is None else [leagues] if isinstance(leagues, str) else leagues
+    datasets = list(schemas.SCHEMAS) if datasets is None else [datasets] if isinstance(datasets, str) else datasets
+    for data_type in datasets:
+        schemas.get_schema(data_type)
+    plan = {(league, data_type): league_seasons(league, seasons, data_type) for league in leagues for data_type in datasets}
+    if max_workers is None:
+        max_workers = config.get_option('max_workers')
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for (league, data_type), league_years in plan.items():
+            if data_type in {'pbp', 'events_log'}:
+                futures[league, data_type] = [executor.submit(read_file, league, data_type, season) for season in league_years]
+            elif league_years:
+                futures[league, data_type] = executor.submit(read_partitions, league, data_type, league_years)
+
+    results = {league: {} for league in leagues}
+    for (league, data_type), league_years in plan.items():
+        if not league_years:
+            df = schemas.empty_frame(data_type)
+        elif data_type in {'pbp', 'events_log'}:
+            df = concat_frames(collect_seasons(league, data_type, league_years, futures[league, data_type]))
+        else:
+            df = futures[league, data_type].result()
+        df['league'] = pd.Categorical([league] * len(df))
+        results[league][data_type] = df
+    if not concat:
+        return results
+    return {data_type: concat_frames([results[league][data_type] for league in leagues]) for data_type in datasets}
+
+
+def get_match(league, match_id, datasets=None, refresh=False):
+    """
+    Loads the rows of a single match from several datasets.
+
+    With a cache configured, a match index is kept for every dataset of a league, so only
+    the rows of the match are read from the local files. The index is built on first use,
+    which downloads any missing files, and is rebuilt whenever a local file changes. Later
+    lookups make no network requests. Without a cache, each dataset is loaded in full and
+    filtered by match_id.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to load data for.
+
+    match_id : int
+        The match to load.
+
+    datasets : str, list of str, or None, optional
+        The datasets to load (e.g., ['pbp', 'events_log']). None loads every dataset.
+
+    refresh : bool, optional
+        Whether to revalidate the local files with the server and rebuild the index first.
+
+    Returns
+    -------
+    dict
+        A mapping of dataset to the DataFrame of the match, with an additional 'league'
+        column. Datasets without the match map to an empty DataFrame.
+
+    Examples
+    --------
+    >>> get_match('mlv', 2025001, ['pbp', 'player_boxscore'])
+    """
+    if league not in LEAGUE_CONFIG:
+        raise TypeError("league must be one of 'mlv', 'lovb', or 'au'")
+    if isinstance(match_id, bool) or not isinstance(match_id, (int, np.integer)):
+        raise TypeError(f'Expected match_id to be an int, got {type(match_id).__name__}')
+    datasets = list(schemas.SCHEMAS) if datasets is None else [datasets] if isinstance(datasets, str) else datasets
+    for data_type in datasets:
+        schemas.get_schema(data_type)
+
+    results = {}
+    for data_type in datasets:
+        if cache.get_cache_dir() is None:
+            df = read_data(league, resolve_seasons(league, None, data_type), data_type, filters=[[('match_id', '==', match_id)]])
+            results[data_type] = df
+            continue
+        index = match_index(league, data_type, refresh)
+        location = index['matches'].get(str(match_id))
+        if location is None:
+            df = schemas.empty_frame(data_type)
+        else:
+            season, start, stop = location
+            file = index['files'][str(season)]
+            path = os.path.join(cache.get_cache_dir(), *file['key'].split('/'))
+            if start is None:
+                df = read_source(path, file['format'], data_type, filters=[[('match_id', '==', match_id)]])
+            else:
+                df = storage.read_match(path, file['format'], data_type, start, stop)
+        df['league'] = pd.Categorical([league] * len(df))
+        results[data_type] = df
+    return results
+
+
+def match_index(league, data_type, refresh=False):
+    """
+    Returns the match index of a dataset, building it from the local files if needed.
+
+    The index maps every match_id to its season and to the byte range (CSV files) or
+    row range (columnar files) of its rows. It is stored in the cache and records the
+    size and modification time of every file it covers, so it is rebuilt when a file is
+    refreshed or evicted, or when the index itself is evicted.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to index.
+
+    data_type : str
+        The type of data to index (e.g., 'pbp', 'events_log').
+
+    refresh : bool, optional
+        Whether to revalidate the files with the server and rebuild the index.
+
+    Returns
+    -------
+    dict
+        The indexed 'files', keyed by season, and the 'matches', keyed by match_id.
+
+    Examples
+    --------
+    >>> match_index('mlv', 'pbp')['matches']['2025001']
+    [2025, 10824, 19577]
+    """
+    cache_dir = cache.get_cache_dir()
+    key = f'{league}/{data_type}/match-index.json'
+    if not refresh:
+        index_path, entry = cache.lookup(key)
+        try:
+            if entry is not None:
+                with open(index_path) as f:
+                    index = json.load(f)
+                if index['format'] == config.get_option('storage_format') and all(
+                    file_signature(os.path.join(cache_dir, *file['key'].split('/'))) == file['signature']
+                    for file in index['files'].values()
+                ):
+                    cache.touch(key)
+                    return index
+        except (OSError, ValueError, KeyError):
+            pass
+
+    files = locate_seasons(league, data_type)
+    index = {'format': config.get_option('storage_format'), 'files': {}, 'matches': {}}
+    for season, (path, storage_format) in files.items():
+        index['files'][str(season)] = {
+            'key': os.path.relpath(path, cache_dir).replace(os.sep, '/'),
+            'format': storage_format,
+            'signature': file_signature(path),
+        }
+        for match_id, (start, stop) in storage.index_matches(path, storage_format).items():
+            index['matches'][match_id] = [season, start, stop]
+
+    def write(path):
+        with open(path, 'w') as f:
+            json.dump(index, f)
+
+    cache.store_derived(key, write)
+    return index
+
+
+def locate_seasons(league, data_type, seasons=None):
+    """
+    Returns the cached file of every season of a dataset, downloading the files that are missing.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to locate files for.
+
+    data_type : str
+        The type of data (e.g., 'pbp', 'schedule').
+
+    seasons : list of int or None, optional
+        The seasons to locate. By default, None locates every available season.
+
+    Returns
+    -------
+    dict
+        A mapping of season to the (path, storage_format) of its file. Seasons that fail
+        to download are reported in a warning and left out.
+
+    Examples
+    --------
+    >>> locate_seasons('mlv', 'pbp')
+    """
+    if data_type not in {'pbp', 'events_log'}:
+        partitions, storage_format = locate_partitions(league, data_type)
+        return {
+            season: (path, storage_format) for season, path in partitions.items()
+            if seasons is None or season in seasons
+        }
+    if seasons is None:
+        seasons = resolve_seasons(league, None, data_type)
+    with ThreadPoolExecutor(max_workers=config.get_option('max_workers')) as executor:
+        futures = [executor.submit(locate_file, league, data_type, season) for season in seasons]
+    files = {}
+    errors = {}
+    for season, future in zip(seasons, futures):
+        try:
+            files[season] = future.result()
+        except Exception as e:
+            errors[season] = e
+    if errors:
+        failed = ', '.join(f'{season} ({e})' for season, e in errors.items())
+        warnings.warn(f"Failed to locate {league} {data_type} for season(s): {failed}", stacklevel=3)
+    return files
+
+
+def file_signature(path):
+    """
+    Returns the size and modification time of a file, which change whenever the cache replaces it.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+
+    Returns
+    -------
+    list of int
+        The size in bytes and the modification time in nanoseconds.
+
+    Examples
+    --------
+    >>> file_signature('mlv/pbp/2025.csv')
+    """
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def league_seasons(league, seasons, data_type=None):
+    """
+    Returns the requested seasons that a league has played.
+
+    Unlike `resolve_seasons`, seasons before the first season of the league, or without
+    a published file, are dropped rather than rejected, so one list of seasons can be
+    applied to several leagues.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to load data for.
+
+    seasons : int, list of int, or None
+        Season(s) to load. None resolves to all available seasons of the league.
+
+    data_type : str or None, optional
+        The type of data to load (e.g., 'pbp', 'events_log'), see `resolve_seasons`.
+
+    Returns
+    -------
+    list of int
+        The seasons of the league to load.
+
+    Examples
+    --------
+    >>> league_seasons('lovb', [2024, 2025])
+    [2025]
+    """
+    available = resolve_seasons(league, None, data_type)
+    if seasons is None:
+        return available
+    if isinstance(seasons, int):
+        seasons = [seasons]
+    earliest = min(league_config['start_year'] for league_config in LEAGUE_CONFIG.values())
+    validate_seasons(seasons, earliest)
+    return [season for season in seasons if season in available]
+
+
+def concat_frames(frames):
+    """
+    Concatenates DataFrames into one with a fresh RangeIndex, keeping categorical columns.
+
+    pandas falls back to object dtype when categorical columns with different categories
+    are concatenated, so the categories are unified first. Categories that no row uses
+    are dropped, so the result does not depend on how the rows were split into frames.
+
+    Parameters
+    ----------
+    frames : list of pd.DataFrame
+        The frames to concatenate.
+
+    Returns
+    -------
+    pd.DataFrame
+        The concatenated frame.
+
+    Examples
+    --------
+    >>> concat_frames([pbp_2024, pbp_2025])
+    """
+    if not frames:
+        return pd.DataFrame()
+    with stats.span('concat') as event:
+        event['frame'] = df = _concat_frames(frames)
+    return df
+
+
+def _concat_frames(frames):
+    frames = [frame.copy(deep=False) for frame in frames]
+    categorical = [
+        column for column in frames[0].columns
+        if all(column in frame and isinstance(frame[column].dtype, pd.CategoricalDtype) for frame in frames)
+    ]
+    for column in categorical:
+        for frame in frames:
+            codes = frame[column].cat.codes.to_numpy()
+            if not np.bincount(codes[codes >= 0], minlength=len(frame[column].cat.categories)).all():
+                frame[column] = frame[column].cat.remove_unused_categories()
+        categories = frames[0][column].cat.categories
+        for frame in frames[1:]:
+            categories = categories.union(frame[column].cat.categories)
+        for frame in frames:
+            if not frame[column].cat.categories.equals(categories):
+                frame[column] = frame[column].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def iter_data(league, seasons, data_type, by='chunk', chunksize=None, columns=None, filters=None):
+    """
+    Streams data for a specified league and season(s) from the volleydata repository.
+
+    Files are parsed incrementally as they are read, one file at a time, so peak memory
+    is bounded by the size of the yielded frames rather than the size of the dataset.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to load data for.
+
+    seasons : int, list of int, or None
+        Season(s) to load. None loads all available seasons.
+
+    data_type : str
+        The type of data to fetch (e.g., 'pbp', 'events_log').
+
+    by : str, optional
+        How rows are grouped into the yielded frames.
+        - 'chunk' : Up to `chunksize` rows at a time (the default)
+        - 'season' : One frame per season
+        - 'match' : One frame per match_id
+        Seasons and matches are grouped as contiguous runs of rows, which matches how the
+        release files are ordered.
+
+    chunksize : int or None, optional
+        The number of rows parsed at a time. By default, None uses the 'chunksize' option.
+
+    columns : list of str or None, optional
+        The columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters in the `pandas.read_parquet` format, e.g. [('set', '==', 5)]. By
+        default, None keeps every row.
+
+    Yields
+    ------
+    pd.DataFrame
+        The next group of rows, with an additional 'league' column.
+
+    Examples
+    --------
+    >>> for match in iter_data('mlv', 2025, 'pbp', by='match'):
+    ...     print(match['match_id'].iloc[0], len(match))
+    """
+    if by not in {'chunk', 'season', 'match'}:
+        raise ValueError(f"by must be one of 'chunk', 'season', or 'match', got '{by}'")
+    seasons = resolve_seasons(league, seasons, data_type)
+    filters = normalize_filters(filters)
+    validate_columns(columns, filter_columns(filters), data_type)
+    if chunksize is None:
+        chunksize = config.get_option('chunksize')
+    key = {'season': 'season', 'match': 'match_id'}.get(by)
+    read_columns = None if columns is None else [column for column in columns if column != 'league']
+    if read_columns is not None and key is not None and key not in read_columns:
+        read_columns = [*read_columns, key]
+    if data_type in {'pbp', 'events_log'}:
+        sources = (locate_file(league, data_type, season) for season in seasons)
+    elif cache.get_cache_dir() is None:
+        sources = [locate_file(league, data_type)]
+        filters = add_condition(filters, ('season', 'in', seasons))
+    else:
+        partitions, storage_format = locate_partitions(league, data_type)
+        sources = [(partitions[season], storage_format) for season in seasons if season in partitions]
+
+    chunks = (
+        chunk
+        for source, storage_format in sources
+        for chunk in iter_source(source, storage_format, data_type, chunksize, read_columns, filters)
+        if len(chunk)
+    )
+    for df in (chunks if key is None else group_runs(chunks, key)):
+        df = df.reset_index(drop=True)
+        df['league'] = pd.Categorical([league] * len(df))
+        yield df if columns is None else df[columns]
+
+
+def iter_source(source, storage_format, data_type, chunksize, columns=None, filters=None):
+    """
+    Streams a located release file chunk by chunk.
+
+    Parameters
+    ----------
+    source : str
+        The URL or cached path of the file, see `locate_file`.
+
+    storage_format : str
+        The format of the file, one of 'csv', 'parquet', or 'feather'.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    chunksize : int
+        The number of rows read at a time.
+
+    columns : list of str or None, optional
+        The columns to read. By default, None reads every column.
+
+    filters : list of list of tuple or None, optional
+        Row filters in disjunctive normal form, see `filters.normalize_filters`.
+
+    Yields
+    ------
+    pd.DataFrame
+        The matching rows of each chunk, which may be empty.
+
+    Examples
+    --------
+    >>> for chunk in iter_source(*locate_file('mlv', 'pbp', 2025), 'pbp', 10_000):
+    ...     print(len(chunk))
+    """
+    if storage_format == 'csv' and '://' in source:
+        # pandas reads a URL into memory in full before parsing, an open response is
+        # parsed as it arrives instead
+        with session.urlopen(source) as response:
+            yield from iter_csv_chunks(response, data_type, chunksize, columns, filters)
+    elif storage_format == 'csv':
+        yield from iter_csv_chunks(source, data_type, chunksize, columns, filters)
+    else:
+        yield from storage.iter_stored(source, storage_format, chunksize, columns, filters)
+
+
+def group_runs(chunks, key):
+    """
+    Regroups a stream of chunks into frames holding one contiguous run of a key each.
+
+    Parameters
+    ----------
+    chunks : iterable of pd.DataFrame
+        The chunks to regroup, in file order.
+
+    key : str
+        The column to group on (e.g., 'season', 'match_id').
+
+    Yields
+    ------
+    pd.DataFrame
+        The rows of each run of equal key values.
+
+    Examples
+    --------
+    >>> for match in group_runs(iter_source(*locate_file('mlv', 'pbp', 2025), 'pbp', 10_000), 'match_id'):
+    ...     print(len(match))
+    """
+    pending = []
+    for chunk in chunks:
+        codes, _ = pd.factorize(chunk[key], use_na_sentinel=False)
+        bounds = [0, *(np.flatnonzero(np.diff(codes)) + 1), len(chunk)]
+        for begin, end in zip(bounds[:-1], bounds[1:]):
+            run = chunk.iloc[begin:end]
+            if pending and not _same_value(pending[-1][key].iloc[-1], run[key].iloc[0]):
+                yield concat_frames(pending)
+                pending = []
+            pending.append(run)
+    if pending:
+        yield concat_frames(pending)
+
+
+def _same_value(a, b):
+    return (pd.isna(a) and pd.isna(b)) or a == b
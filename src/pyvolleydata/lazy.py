@@ -0,0 +1,59 @@
+import importlib
+import sys
+
+
+class LazyModule:
+    """
+    Stands in for a module that is imported on first attribute access, see `lazy_import`.
+    """
+    # Not a types.ModuleType, whose failed attribute lookups are an order of magnitude
+    # slower than a plain object's
+    __slots__ = ('_name', '_module')
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, name):
+        # Attributes are looked up on the module every time rather than copied, so
+        # attributes patched on the module (e.g., in tests) are seen through it too
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, name)
+
+    def __dir__(self):
+        return dir(importlib.import_module(self._name))
+
+    def __repr__(self):
+        return f'<lazy module {self._name!r}>'
+
+
+def lazy_import(name):
+    """
+    Returns a module that is only imported when one of its attributes is first used.
+
+    Importing pandas and numpy takes most of the time of importing the package, so
+    modules that only use them inside functions import them with `lazy_import`, and
+    importing the package for its options, schemas or validation stays fast.
+
+    Parameters
+    ----------
+    name : str
+        The name of the module (e.g., 'pandas').
+
+    Returns
+    -------
+    module
+        The module itself when it is already imported, otherwise a `LazyModule`
+        standing in for it.
+
+    Examples
+    --------
+    >>> pd = lazy_import('pandas')
+    >>> pd.DataFrame  # pandas is imported here
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
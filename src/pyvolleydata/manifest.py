@@ -0,0 +1,123 @@
+import json
+import os
+import posixpath
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from . import cache, config, session
+
+
+# Every release of the data repository fits on one page, so the whole manifest is a
+# single request, revalidated with its ETag when a cache is configured
+MANIFEST_URL = "https://api.github.com/repos/awosoga/volleydata/releases?per_page=100"
+MANIFEST_KEY = 'manifest.json'
+MANIFEST_TIMEOUT = 10
+
+_state = {'releases': None, 'fetched': None}
+_lock = threading.Lock()
+
+
+def release_assets(release):
+    """
+    Returns the names of the files published in a release of the data repository.
+
+    The names are taken from the download URLs of the assets, so they are the file
+    names `helpers.build_url` requests rather than the display names of the assets.
+
+    Parameters
+    ----------
+    release : str
+        The tag of the release (e.g., 'pvf-pbp').
+
+    Returns
+    -------
+    list of str or None
+        The file names of the release, empty if the release does not exist, or None if
+        the manifest cannot be fetched.
+
+    Examples
+    --------
+    >>> release_assets('pvf-pbp')
+    ['pvf_pbp_2024.csv', 'pvf_pbp_2025.csv']
+    """
+    releases = get_manifest()
+    if releases is None:
+        return None
+    return releases.get(release, [])
+
+
+def get_manifest():
+    """
+    Returns the published files of every release, fetching the manifest at most once per 'manifest_ttl'.
+
+    With a cache configured the manifest is stored next to the data files and revalidated
+    with its ETag, so a refresh that finds no new files costs a 304 response. When the
+    manifest cannot be fetched and no copy is available, None is returned and callers
+    fall back to guessing seasons from the calendar.
+
+    Anonymous requests to the GitHub API are limited to 60 per hour and per address. Set
+    the GITHUB_TOKEN environment variable to send authenticated requests instead.
+
+    Returns
+    -------
+    dict or None
+        A mapping of release tag to the sorted file names in the release.
+
+    Examples
+    --------
+    >>> get_manifest()['pvf-pbp']
+    """
+    ttl = config.get_option('manifest_ttl')
+    with _lock:
+        if _state['fetched'] is not None and (ttl is None or time.monotonic() - _state['fetched'] < ttl):
+            return _state['releases']
+        try:
+            releases = _parse(_download())
+        except (urllib.error.URLError, OSError, ValueError, KeyError, TypeError):
+            releases = _state['releases']
+        _state.update(releases=releases, fetched=time.monotonic())
+        return releases
+
+
+def clear():
+    """
+    Forgets the manifest held in memory, so the next lookup fetches it again.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> clear()
+    """
+    with _lock:
+        _state.update(releases=None, fetched=None)
+
+
+def _download():
+    headers = _headers()
+    if cache.get_cache_dir() is not None:
+        with open(cache.fetch(MANIFEST_URL, MANIFEST_KEY, headers=headers, timeout=MANIFEST_TIMEOUT), 'rb') as f:
+            return json.load(f)
+    request = urllib.request.Request(MANIFEST_URL, headers=headers)
+    with session.urlopen(request, MANIFEST_TIMEOUT) as response:
+        return json.load(response)
+
+
+def _headers():
+    token = os.environ.get('GITHUB_TOKEN')
+    return {'Authorization': f'Bearer {token}'} if token else {}
+
+
+def _parse(releases):
+    return {
+        release['tag_name']: sorted(_file_name(asset['browser_download_url']) for asset in release['assets'])
+        for release in releases
+    }
+
+
+def _file_name(url):
+    return urllib.parse.unquote(posixpath.basename(urllib.parse.urlsplit(url).path))
@@ -0,0 +1,192 @@
+import threading
+import time
+from collections import OrderedDict
+from . import config
+from .lazy import lazy_import
+
+
+pd = lazy_import('pandas')
+
+
+_entries = OrderedDict()
+_stats = {'hits': 0, 'misses': 0, 'bytes': 0}
+_lock = threading.Lock()
+
+
+def memo_key(league, data_type, seasons, columns=None, filters=None):
+    """
+    Builds the key of a loaded DataFrame in the in-memory memo.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' the data belongs to.
+
+    data_type : str
+        The type of data (e.g., 'pbp', 'events_log').
+
+    seasons : list of int
+        The resolved seasons of the data.
+
+    columns : list of str or None, optional
+        The requested columns.
+
+    filters : list of list of tuple or None, optional
+        The normalized row filters, see `filters.normalize_filters`.
+
+    Returns
+    -------
+    tuple
+        A hashable key.
+
+    Examples
+    --------
+    >>> memo_key('mlv', 'player_info', [2025])
+    ('mlv', 'player_info', (2025,), None, 'None')
+    """
+    return (league, data_type, tuple(seasons), None if columns is None else tuple(columns), repr(filters))
+
+
+def get(key):
+    """
+    Returns a copy of a memoized DataFrame, or None if it is missing or expired.
+
+    Parameters
+    ----------
+    key : tuple
+        The key of the DataFrame, see `memo_key`.
+
+    Returns
+    -------
+    pd.DataFrame or None
+        A copy of the memoized frame. It is a lazy copy-on-write view on pandas 3, or
+        when the 'mode.copy_on_write' option of pandas 2 is enabled, and a deep copy
+        otherwise, so changing it never changes the memo.
+
+    Examples
+    --------
+    >>> get(memo_key('mlv', 'player_info', [2025]))
+    """
+    ttl = config.get_option('memo_ttl')
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and ttl is not None and time.monotonic() - entry['stored'] > ttl:
+            _stats['bytes'] -= _entries.pop(key)['size']
+            entry = None
+        if entry is None:
+            _stats['misses'] += 1
+            return None
+        _entries.move_to_end(key)
+        _stats['hits'] += 1
+    return entry['df'].copy(deep=not _copy_on_write())
+
+
+def put(key, df):
+    """
+    Memoizes a loaded DataFrame, evicting the least recently used frames to stay in budget.
+
+    Frames larger than the whole 'memo_max_bytes' budget are not memoized. When hits are
+    deep copies (pandas 2 without copy-on-write, see `get`), a frame is charged twice
+    its size: the memoized frame and the copy every hit makes.
+
+    Parameters
+    ----------
+    key : tuple
+        The key of the DataFrame, see `memo_key`.
+
+    df : pd.DataFrame
+        The loaded frame. Only the returned frame may be changed afterwards.
+
+    Returns
+    -------
+    pd.DataFrame
+        The frame to hand to the caller: a copy, see `get`, if `df` was memoized, and
+        `df` itself otherwise.
+
+    Examples
+    --------
+    >>> df = put(memo_key('mlv', 'player_info', [2025]), df)
+    """
+    max_bytes = config.get_option('memo_max_bytes')
+    size = int(df.memory_usage(deep=True).sum())
+    if not _copy_on_write():
+        size *= 2
+    if not max_bytes or size > max_bytes:
+        return df
+    with _lock:
+        if key in _entries:
+            _stats['bytes'] -= _entries.pop(key)['size']
+        _entries[key] = {'df': df, 'size': size, 'stored': time.monotonic()}
+        _stats['bytes'] += size
+        while _stats['bytes'] > max_bytes:
+            _, entry = _entries.popitem(last=False)
+            _stats['bytes'] -= entry['size']
+    return df.copy(deep=not _copy_on_write())
+
+
+def memoized(key, load):
+    """
+    Returns a memoized DataFrame, loading and memoizing it on a miss.
+
+    Parameters
+    ----------
+    key : tuple
+        The key of the DataFrame, see `memo_key`.
+
+    load : callable
+        A function without arguments that loads the DataFrame.
+
+    Returns
+    -------
+    pd.DataFrame
+        A copy of the memoized or freshly loaded frame.
+
+    Examples
+    --------
+    >>> memoized(key, lambda: read_file('mlv', 'player_info'))
+    """
+    df = get(key)
+    if df is not None:
+        return df
+    return put(key, load())
+
+
+def clear():
+    """
+    Drops every memoized DataFrame and resets the hit and miss counters.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> clear()
+    """
+    with _lock:
+        _entries.clear()
+        _stats.update(hits=0, misses=0, bytes=0)
+
+
+def info():
+    """
+    Returns the hit and miss counters and the size of the memo.
+
+    Returns
+    -------
+    dict
+        The number of 'hits' and 'misses', the number of memoized 'entries', and the
+        'bytes' charged for them, see `put`.
+
+    Examples
+    --------
+    >>> info()
+    {'hits': 3, 'misses': 1, 'entries': 1, 'bytes': 48213}
+    """
+    with _lock:
+        return {'hits': _stats['hits'], 'misses': _stats['misses'], 'entries': len(_entries), 'bytes': _stats['bytes']}
+
+
+def _copy_on_write():
+    # Shallow copies are only safe to hand out when pandas copies shared data on write
+    return int(pd.__version__.split('.')[0]) >= 3 or pd.get_option('mode.copy_on_write') is True
@@ -0,0 +1,332 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from . import cache, config, memo, schemas, storage
+from . import helpers as h
+from .filters import apply_filters, filter_columns, normalize_filters
+from .lazy import lazy_import
+
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+
+# The player_info columns added to pbp rows, after 'jersey_number'
+PLAYER_COLUMNS = ['player_id', 'player_name', 'primary_position']
+# The player_info columns read for the join
+PLAYER_INFO_COLUMNS = ['match_id', 'team_name', 'jersey_number', *PLAYER_COLUMNS]
+# Jersey numbers fit in SMALL, so (match, team, jersey) triples are packed into one integer key
+JERSEYS = 128
+
+
+def get_pbp_players(league, seasons, max_workers=None, columns=None, filters=None, engine=None):
+    """
+    Loads pbp data with the player_info columns of the player involved in each row.
+
+    The joined frame of every season is memoized on its own, so loads of overlapping
+    seasons, columns, or filters reuse it. With a cache configured it is also stored in
+    the cache, see `read_pbp_players`. Columns and filters are applied to the joined
+    rows and may refer to the added player columns.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to load data for.
+
+    seasons : int, list of int, or None
+        Season(s) to load. None loads all available seasons.
+
+    max_workers : int or None, optional
+        The number of seasons to load in parallel. By default, None uses the
+        'max_workers' option.
+
+    columns : list of str or None, optional
+        The columns to load, in the order they should be returned. By default, None loads
+        every column.
+
+    filters : list of tuple, list of list of tuple, or None, optional
+        Row filters in the `pandas.read_parquet` format, e.g. [('player_id', '==', 1234)].
+        By default, None keeps every row.
+
+    engine : str or None, optional
+        The CSV parser, see `schemas.resolve_engine`. By default, None uses the 'engine'
+        option.
+
+    Returns
+    -------
+    pd.DataFrame
+        The pbp data with the added player columns and a 'league' column.
+
+    Examples
+    --------
+    >>> get_pbp_players('mlv', 2025, filters=[('action', '==', 'Attack')])
+    """
+    seasons = h.resolve_seasons(league, seasons, 'pbp')
+    filters = normalize_filters(filters)
+    h.validate_columns(
+        None if columns is None else [column for column in columns if column not in PLAYER_COLUMNS],
+        [column for column in filter_columns(filters) if column not in PLAYER_COLUMNS],
+        'pbp'
+    )
+    if max_workers is None:
+        max_workers = config.get_option('max_workers')
+    engine = schemas.resolve_engine(engine)
+    if seasons:
+        # player_info is one all-seasons file. Without a cache it is read once, on the first
+        # season that is not memoized, and split by season for the others
+        player_info = None
+        if cache.get_cache_dir() is None:
+            player_info = _read_once(lambda: read_player_info(league, seasons, engine))
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(seasons))) as executor:
+            futures = [
+                executor.submit(memo.memoized, memo.memo_key(league, 'pbp_players', [season]), lambda season=season: read_pbp_players(league, season, engine, player_info))
+                for season in seasons
+            ]
+        df = h.concat_frames(h.collect_seasons(league, 'pbp', seasons, futures))
+    else:
+        df = join_players(h.read_data(league, [], 'pbp'), schemas.empty_frame('player_info', PLAYER_INFO_COLUMNS))
+    df = apply_filters(df, filters).reset_index(drop=True)
+    if columns is not None:
+        df = df[columns]
+    return df
+
+
+def read_player_info(league, seasons, engine=None):
+    """
+    Reads the player_info columns of the join for several seasons at once, split by season.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to read data for.
+
+    seasons : list of int
+        The seasons to read.
+
+    engine : str or None, optional
+        The CSV parser, see `schemas.resolve_engine`.
+
+    Returns
+    -------
+    dict
+        A mapping of season to its player_info rows, see `join_players`.
+
+    Examples
+    --------
+    >>> read_player_info('mlv', [2024, 2025])[2025]
+    """
+    df = h.read_partitions(league, 'player_info', seasons, ['season', *PLAYER_INFO_COLUMNS], engine=engine)
+    return {
+        season: part[PLAYER_INFO_COLUMNS].reset_index(drop=True)
+        for season, part in df.groupby('season', sort=False, observed=True)
+    }
+
+
+def read_pbp_players(league, season, engine=None, player_info=None):
+    """
+    Reads one season of pbp data and joins the player_info columns to it.
+
+    With a cache configured, the joined season is stored in the cache in the
+    'storage_format' option and read back until the cached pbp or player_info file of
+    the season changes.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to read data for.
+
+    season : int
+        The season to read.
+
+    engine : str or None, optional
+        The CSV parser, see `schemas.resolve_engine`.
+
+    player_info : callable or None, optional
+        A function returning the player_info rows of several seasons, see
+        `read_player_info`, which is used without a cache. By default, None reads the
+        player_info rows of the season.
+
+    Returns
+    -------
+    pd.DataFrame
+        The joined data with a 'league' column, see `join_players`.
+
+    Examples
+    --------
+    >>> read_pbp_players('mlv', 2025)
+    """
+    if cache.get_cache_dir() is None:
+        pbp = h.read_data(league, [season], 'pbp', engine=engine)
+        if player_info is None:
+            players = h.read_data(league, [season], 'player_info', columns=PLAYER_INFO_COLUMNS, engine=engine)
+        else:
+            players = player_info().get(season, schemas.empty_frame('player_info', PLAYER_INFO_COLUMNS))
+        return join_players(pbp, players)
+
+    pbp_path, storage_format = h.locate_file(league, 'pbp', season)
+    partitions, partition_format = h.locate_partitions(league, 'player_info')
+    source = repr([h.file_signature(pbp_path), h.file_signature(partitions[season]) if season in partitions else None])
+    key = cache.cache_key(league, 'pbp_players', season, suffix=storage_format)
+    path = cache.lookup_derived(key, source)
+    if path is not None:
+        if storage_format == 'csv':
+            return pd.read_csv(path, dtype=pbp_players_schema())
+        return storage.read_stored(path, storage_format)
+
+    pbp = h.read_source(pbp_path, storage_format, 'pbp', engine=engine)
+    pbp['league'] = pd.Categorical([league] * len(pbp))
+    players = h.read_partition_files(partitions, partition_format, 'player_info', [season], PLAYER_INFO_COLUMNS, engine=engine)
+    df = join_players(pbp, players)
+    if storage_format == 'csv':
+        cache.store_derived(key, lambda path: df.to_csv(path, index=False), source)
+    else:
+        cache.store_derived(key, lambda path: storage.write_frame(df, path, storage_format), source)
+    return df
+
+
+def pbp_players_schema():
+    """
+    Returns the columns and dtypes of pbp data joined with the player columns.
+
+    Returns
+    -------
+    dict
+        A mapping of column name to dtype, with the player columns after 'jersey_number'
+        and a final 'league' column.
+
+    Examples
+    --------
+    >>> pbp_players_schema()['player_name']
+    """
+    player_info = schemas.get_schema('player_info')
+    schema = {}
+    for column, dtype in schemas.get_schema('pbp').items():
+        schema[column] = dtype
+        if column == 'jersey_number':
+            schema.update({player_column: player_info[player_column] for player_column in PLAYER_COLUMNS})
+    schema['league'] = 'category'
+    return schema
+
+
+def join_players(pbp, players):
+    """
+    Adds the player columns of player_info to pbp rows by match, team, and jersey number.
+
+    Rows are matched with `match_players`. Rows without a matching player get missing
+    values.
+
+    Parameters
+    ----------
+    pbp : pd.DataFrame
+        pbp rows with 'match_id', 'team_involved', and 'jersey_number' columns.
+
+    players : pd.DataFrame
+        player_info rows with 'match_id', 'team_name', 'jersey_number', and the player
+        columns. The first row of a duplicated key wins.
+
+    Returns
+    -------
+    pd.DataFrame
+        The pbp rows with the player columns inserted after 'jersey_number'.
+
+    Examples
+    --------
+    >>> join_players(load_pbp('mlv', 2025), load_player_info('mlv', 2025))
+    """
+    rows = match_players(pbp['match_id'], pbp['team_involved'], pbp['jersey_number'], players)
+    df = pbp.copy(deep=False)
+    at = df.columns.get_loc('jersey_number') + 1 if 'jersey_number' in df else len(df.columns)
+    for offset, column in enumerate(PLAYER_COLUMNS):
+        df.insert(at + offset, column, players[column].array.take(rows, allow_fill=True))
+    return df
+
+
+def add_player_ids(boxscore, players):
+    """
+    Adds the 'player_id' of player_info to player_boxscore rows by match, team, and jersey number.
+
+    Parameters
+    ----------
+    boxscore : pd.DataFrame
+        player_boxscore rows with 'match_id', 'team_name', and 'player_number' columns.
+
+    players : pd.DataFrame
+        player_info rows with 'match_id', 'team_name', 'jersey_number', and 'player_id'
+        columns. The first row of a duplicated key wins.
+
+    Returns
+    -------
+    pd.DataFrame
+        The boxscore rows with 'player_id' inserted before 'player_name'. Rows without a
+        matching player get a missing id.
+
+    Examples
+    --------
+    >>> add_player_ids(load_player_boxscore('mlv', 2025), load_player_info('mlv', 2025))
+    """
+    rows = match_players(boxscore['match_id'], boxscore['team_name'], boxscore['player_number'], players)
+    df = boxscore.copy(deep=False)
+    at = df.columns.get_loc('player_name') if 'player_name' in df else len(df.columns)
+    df.insert(at, 'player_id', players['player_id'].array.take(rows, allow_fill=True))
+    return df
+
+
+def match_players(match_id, team, jersey, players):
+    """
+    Finds the player_info row of every (match, team, jersey number) triple.
+
+    The keys are packed into one integer per row, so the lookup is a single hash lookup
+    instead of a merge on object columns.
+
+    Parameters
+    ----------
+    match_id, team, jersey : pd.Series
+        The match ids, team names, and jersey numbers to look up.
+
+    players : pd.DataFrame
+        player_info rows with 'match_id', 'team_name', and 'jersey_number' columns. The
+        first row of a duplicated key wins.
+
+    Returns
+    -------
+    np.ndarray
+        The position of the matching row in `players`, or -1 where there is none.
+
+    Examples
+    --------
+    >>> match_players(pbp['match_id'], pbp['team_involved'], pbp['jersey_number'], player_info)
+    """
+    teams = pd.Index(pd.unique(np.concatenate([
+        _labels(team).categories.to_numpy(dtype=object),
+        _labels(players['team_name']).categories.to_numpy(dtype=object),
+    ])))
+    player_keys = _keys(players['match_id'], players['team_name'], players['jersey_number'], teams)
+    unique = (player_keys >= 0) & ~pd.Index(player_keys).duplicated()
+    positions = pd.Index(player_keys[unique]).get_indexer(_keys(match_id, team, jersey, teams))
+    return np.append(np.flatnonzero(unique), -1)[positions]
+
+
+def _read_once(read):
+    # Calls `read` on the first call of the returned function only, from any thread
+    lock = threading.Lock()
+    result = []
+
+    def read_once():
+        with lock:
+            if not result:
+                result.append(read())
+        return result[0]
+
+    return read_once
+
+
+def _labels(series):
+    return series.array if isinstance(series.dtype, pd.CategoricalDtype) else pd.Categorical(series)
+
+
+def _keys(match_id, team, jersey, teams):
+    # -1 marks rows with a missing key part, which never match
+    team_codes = np.append(teams.get_indexer(_labels(team).categories), -1)[_labels(team).codes]
+    match_id = match_id.astype('Int64').to_numpy(dtype='int64', na_value=-1)
+    jersey = jersey.astype('Int64').to_numpy(dtype='int64', na_value=-1)
+    keys = (match_id * len(teams) + team_codes) * JERSEYS + jersey
+    return np.where((match_id >= 0) & (team_codes >= 0) & (jersey >= 0) & (jersey < JERSEYS), keys, -1)
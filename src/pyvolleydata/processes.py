@@ -0,0 +1,219 @@
+import atexit
+import concurrent.futures
+import mmap
+import os
+import pickle
+import tempfile
+import threading
+from . import config
+from .lazy import lazy_import
+
+
+# Pools are opt-in, so their modules are only imported once one is started
+multiprocessing = lazy_import('multiprocessing')
+
+
+# Buffers start on cache line boundaries, so arrays mapped from them are aligned
+ALIGNMENT = 64
+# Workers only parse, so they never hand their files on to another pool
+WORKER_OPTIONS = ['chunksize', 'engine']
+
+_pool = None
+_pool_key = None
+_lock = threading.Lock()
+
+
+def get_pool():
+    """
+    Returns the process pool that parses CSV files, sized by the 'processes' option.
+
+    The pool is shared by every load and started on first use. It is restarted when the
+    'processes' option or an option the workers depend on changes.
+
+    Returns
+    -------
+    concurrent.futures.ProcessPoolExecutor or None
+        The shared pool, or None if the 'processes' option is 0.
+
+    Examples
+    --------
+    >>> set_option('processes', 4)
+    >>> get_pool()
+    """
+    global _pool, _pool_key
+    processes = config.get_option('processes')
+    options = {name: config.get_option(name) for name in WORKER_OPTIONS}
+    key = (processes, *options.values())
+    with _lock:
+        if _pool_key != key:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # Loads run in threads, which fork does not copy safely
+            _pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(options,),
+            ) if processes else None
+            _pool_key = key
+        return _pool
+
+
+def shutdown():
+    """
+    Stops the shared process pool, if one was started.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> shutdown()
+    """
+    global _pool, _pool_key
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = None
+        _pool_key = None
+
+
+atexit.register(shutdown)
+
+
+def read_source(pool, source, storage_format, data_type, columns=None, filters=None, engine=None):
+    """
+    Parses a located release file in a worker process of `pool`.
+
+    The worker sends the parsed frame back as a protocol 5 pickle whose array buffers
+    travel out of band, through a memory-mapped file, rather than through the pipe of
+    the pool. The frame's arrays are mapped copy-on-write from that file, so they are
+    never copied on the way back.
+
+    Parameters
+    ----------
+    pool : concurrent.futures.ProcessPoolExecutor
+        The pool to parse in, see `get_pool`.
+
+    source : str
+        The URL or cached path of the file, see `helpers.locate_file`.
+
+    storage_format : str
+        The format of the file, one of 'csv', 'parquet', or 'feather'.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    columns : list of str or None, optional
+        The columns to read. By default, None reads every column.
+
+    filters : list of list of tuple or None, optional
+        Row filters in disjunctive normal form, see `filters.normalize_filters`.
+
+    engine : str or None, optional
+        The CSV parser, see `schemas.resolve_engine`.
+
+    Returns
+    -------
+    pd.DataFrame
+        The parsed contents of the file, like `helpers.read_source`.
+
+    Examples
+    --------
+    >>> read_source(get_pool(), *locate_file('mlv', 'pbp', 2025), 'pbp')
+    """
+    return import_frame(*pool.submit(_parse, source, storage_format, data_type, columns, filters, engine).result())
+
+
+def export_frame(df):
+    """
+    Pickles a frame with its array buffers written to a memory-mappable file.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The frame to export.
+
+    Returns
+    -------
+    tuple of (bytes, str or None, list of tuple)
+        The pickle without its buffers, the path of the file holding them (None when
+        there are none), and the (offset, size) of each buffer in it. The file belongs
+        to whoever calls `import_frame`.
+
+    Examples
+    --------
+    >>> import_frame(*export_frame(df))
+    """
+    buffers = []
+    payload = pickle.dumps(df, protocol=5, buffer_callback=buffers.append)
+    if not buffers:
+        return payload, None, []
+    spans = []
+    fd, path = tempfile.mkstemp(prefix='pyvolleydata-', suffix='.buffers', dir=_buffer_dir())
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for buffer in buffers:
+                view = buffer.raw()
+                f.write(b'\0' * (-f.tell() % ALIGNMENT))
+                spans.append((f.tell(), view.nbytes))
+                f.write(view)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return payload, path, spans
+
+
+def import_frame(payload, path, spans):
+    """
+    Rebuilds a frame exported by `export_frame`, mapping its arrays from the buffer file.
+
+    The file is removed once mapped. Its pages are released when the last array
+    mapped from them is garbage collected.
+
+    Parameters
+    ----------
+    payload : bytes
+        The pickle without its buffers.
+
+    path : str or None
+        The path of the buffer file.
+
+    spans : list of tuple
+        The (offset, size) of each buffer in the file.
+
+    Returns
+    -------
+    pd.DataFrame
+        The exported frame.
+
+    Examples
+    --------
+    >>> import_frame(*export_frame(df))
+    """
+    if path is None:
+        return pickle.loads(payload)
+    try:
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            # Copy-on-write keeps the arrays writable without touching the file
+            mapped = memoryview(mmap.mmap(f.fileno(), size, access=mmap.ACCESS_COPY)) if size else memoryview(b'')
+    finally:
+        os.unlink(path)
+    return pickle.loads(payload, buffers=[mapped[offset:offset + nbytes] for offset, nbytes in spans])
+
+
+def _parse(source, storage_format, data_type, columns, filters, engine):
+    from . import helpers as h
+    return export_frame(h.read_source(source, storage_format, data_type, columns, filters, engine))
+
+
+def _init_worker(options):
+    for name, value in options.items():
+        config.set_option(name, value)
+
+
+def _buffer_dir():
+    # A memory-backed directory keeps the buffers off the disk where there is one
+    return '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
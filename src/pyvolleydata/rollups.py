@@ -0,0 +1,332 @@
+from . import cache, memo, schemas, storage
+from . import helpers as h
+from .players import add_player_ids
+from .lazy import lazy_import
+
+
+pd = lazy_import('pandas')
+
+
+ROLLUP_LEVELS = {'season', 'match'}
+ROLLUP_KEYS = {
+    'player_boxscore': ['season', 'team_name', 'player_id'],
+    'team_boxscore': ['season', 'team_name'],
+}
+# Columns carried along with the keys, from the first row of each group that has them
+ROLLUP_ATTRIBUTES = {
+    'player_boxscore': ['player_name'],
+    'team_boxscore': [],
+}
+# Boxscores have no player ids, they are looked up in player_info, see `add_player_ids`
+PLAYER_ID_COLUMNS = ['match_id', 'team_name', 'jersey_number', 'player_id']
+# Ratios are not published with their numerators, so each row's numerator is recovered
+# as ratio * denominator (a whole number) before summing
+RATIO_DENOMINATORS = {
+    'serve_efficiency': 'serves',
+    'attack_success_ratio': 'attack_attempts',
+    'attack_efficiency': 'attack_attempts',
+    'positive_reception_ratio': 'receptions',
+    'perfect_reception_ratio': 'receptions',
+}
+TOTAL = 'Int32'
+
+
+def get_rollups(league, seasons, data_type, by='season'):
+    """
+    Loads per-player or per-team totals of a boxscore dataset for each season or match.
+
+    Counts are summed over the per-set rows and every ratio is recomputed from the summed
+    counts, so a player's season attack efficiency weighs each set by its attempts.
+    Players are grouped by the 'player_id' of player_info. With a cache configured (see
+    the 'cache_dir' option) the rollups of every season are stored in the cache and
+    only recomputed when the rows of that season change.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to load data for.
+
+    seasons : int, list of int, or None
+        Season(s) to load. None loads all available seasons.
+
+    data_type : str
+        Either 'player_boxscore' or 'team_boxscore'.
+
+    by : str, optional
+        Either 'season' for one row per player or team and season, or 'match' for one
+        row per player or team and match.
+
+    Returns
+    -------
+    pd.DataFrame
+        The rollups with an additional 'league' column, see `rollup`.
+
+    Examples
+    --------
+    >>> get_rollups('mlv', 2025, 'player_boxscore')
+    >>> get_rollups('mlv', [2024, 2025], 'team_boxscore', by='match')
+    """
+    if data_type not in ROLLUP_KEYS:
+        raise ValueError(f"Expected data_type to be one of {sorted(ROLLUP_KEYS)}, got '{data_type}'")
+    if by not in ROLLUP_LEVELS:
+        raise ValueError(f"Expected by to be one of {sorted(ROLLUP_LEVELS)}, got '{by}'")
+    seasons = h.resolve_seasons(league, seasons, data_type)
+    return memo.memoized(
+        memo.memo_key(league, f'{data_type}_{by}_rollups', seasons),
+        lambda: read_rollups(league, seasons, data_type, by)
+    )
+
+
+def read_rollups(league, seasons, data_type, by):
+    """
+    Reads or computes the rollups of checked seasons, bypassing the in-memory memo.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' to load data for.
+
+    seasons : list of int
+        The seasons to load, see `helpers.resolve_seasons`.
+
+    data_type : str
+        Either 'player_boxscore' or 'team_boxscore'.
+
+    by : str
+        Either 'season' or 'match'.
+
+    Returns
+    -------
+    pd.DataFrame
+        The rollups with an additional 'league' column.
+
+    Examples
+    --------
+    >>> read_rollups('mlv', [2025], 'team_boxscore', 'season')
+    """
+    if cache.get_cache_dir() is None:
+        df = h.read_partitions(league, data_type, seasons)
+        if data_type == 'player_boxscore':
+            df = add_player_ids(df, h.read_partitions(league, 'player_info', seasons, PLAYER_ID_COLUMNS))
+        df = rollup(df, data_type, by)
+    else:
+        partitions, storage_format = h.locate_partitions(league, data_type)
+        players = h.locate_partitions(league, 'player_info')[0] if data_type == 'player_boxscore' else {}
+        frames = [
+            stored_rollup(league, season, partitions[season], storage_format, data_type, by, players.get(season))
+            for season in seasons if season in partitions
+        ]
+        df = h.concat_frames(frames) if frames else schemas.empty_frame(data_type).pipe(rollup, data_type, by)
+    df['league'] = pd.Categorical([league] * len(df))
+    return df
+
+
+def stored_rollup(league, season, source, storage_format, data_type, by, players_source=None):
+    """
+    Returns the stored rollup of one season, recomputing it if its source files changed.
+
+    The rollup is stored in the cache with the size and modification time of the
+    partitions it was computed from, see `cache.store_derived`. Refreshing the boxscore
+    file only rewrites the partitions whose rows changed, so the rollups of unchanged
+    seasons are kept.
+
+    Parameters
+    ----------
+    league : str
+        A string specifying which of 'mlv', 'lovb', or 'au' the data belongs to.
+
+    season : int
+        The season of the partition.
+
+    source : str
+        The path of the cached boxscore partition of the season.
+
+    storage_format : str
+        The format of the partitions and of the stored rollup.
+
+    data_type : str
+        Either 'player_boxscore' or 'team_boxscore'.
+
+    by : str
+        Either 'season' or 'match'.
+
+    players_source : str or None, optional
+        The path of the cached player_info partition of the season, which holds the
+        player ids of a player rollup.
+
+    Returns
+    -------
+    pd.DataFrame
+        The rollup of the season.
+
+    Examples
+    --------
+    >>> stored_rollup('mlv', 2025, partitions[2025], 'csv', 'player_boxscore', 'season', players[2025])
+    """
+    key = f'{league}/{data_type}/rollups/{by}-{season}.{storage_format}'
+    signature = repr([h.file_signature(source), None if players_source is None else h.file_signature(players_source)])
+    path = cache.lookup_derived(key, signature)
+    if path is not None:
+        return read_rollup(path, storage_format, data_type, by)
+
+    df = h.read_source(source, storage_format, data_type)
+    if data_type == 'player_boxscore':
+        if players_source is None:
+            players = schemas.empty_frame('player_info', PLAYER_ID_COLUMNS)
+        else:
+            players = h.read_source(players_source, storage_format, 'player_info', PLAYER_ID_COLUMNS)
+        df = add_player_ids(df, players)
+    df = rollup(df, data_type, by)
+    if storage_format == 'csv':
+        cache.store_derived(key, lambda path: df.to_csv(path, index=False), signature)
+    else:
+        cache.store_derived(key, lambda path: storage.write_frame(df, path, storage_format), signature)
+    return df
+
+
+def read_rollup(path, storage_format, data_type, by):
+    """
+    Reads a stored rollup with the dtypes of `rollup_schema`.
+
+    Parameters
+    ----------
+    path : str
+        The path of the stored rollup.
+
+    storage_format : str
+        The format of the stored rollup, one of 'csv', 'parquet', or 'feather'.
+
+    data_type : str
+        Either 'player_boxscore' or 'team_boxscore'.
+
+    by : str
+        Either 'season' or 'match'.
+
+    Returns
+    -------
+    pd.DataFrame
+        The stored rollup.
+
+    Examples
+    --------
+    >>> read_rollup('mlv/player_boxscore/rollups/season-2025.csv', 'csv', 'player_boxscore', 'season')
+    """
+    schema = rollup_schema(data_type, by)
+    if storage_format == 'csv':
+        return pd.read_csv(path, dtype=schema)
+    return storage.read_stored(path, storage_format).astype(schema)
+
+
+def rollup(df, data_type, by='season'):
+    """
+    Sums the per-set rows of a boxscore frame per player or team and season or match.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Rows of 'player_boxscore' or 'team_boxscore', as returned by the `load_*`
+        functions. Players are told apart by the 'player_id' column added by
+        `players.add_player_ids`, and by name where it is missing or has no id.
+
+    data_type : str
+        Either 'player_boxscore' or 'team_boxscore'.
+
+    by : str, optional
+        Either 'season' or 'match'.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per group with its keys, the 'player_name' of player rollups, the number
+        of 'matches' and 'sets' it covers, the summed counts, and the ratios recomputed
+        from them, with the dtypes of
+        `rollup_schema`. Ratios are missing where their denominator sums to 0.
+
+    Examples
+    --------
+    >>> rollup(load_player_boxscore('mlv', 2025), 'player_boxscore')
+    """
+    schema = rollup_schema(data_type, by)
+    keys = rollup_keys(data_type, by)
+    attributes = ROLLUP_ATTRIBUTES[data_type]
+    counts = [column for column, dtype in schema.items() if dtype == TOTAL]
+    numerators = {ratio: f'_{ratio}' for ratio in RATIO_DENOMINATORS}
+    groups = [key for key in keys if key != 'player_id']
+    frame = df[list(dict.fromkeys(groups + ['match_id'])) + attributes + counts].assign(**{
+        numerator: (df[ratio] * df[RATIO_DENOMINATORS[ratio]]).round().fillna(0) for ratio, numerator in numerators.items()
+    })
+    if 'player_id' in keys:
+        ids = df['player_id'] if 'player_id' in df else pd.Series(pd.NA, index=df.index, dtype=schema['player_id'])
+        # Players without an id are told apart by name
+        frame = frame.assign(player_id=ids, _player_name=df['player_name'].where(ids.isna()))
+        groups = keys + ['_player_name']
+    grouped = frame.groupby(groups, observed=True, sort=True, dropna=False)
+    totals = grouped[counts + list(numerators.values())].sum()
+    totals.insert(0, 'matches', grouped['match_id'].nunique())
+    totals.insert(1, 'sets', grouped.size())
+    for column in attributes:
+        totals[column] = grouped[column].first()
+    for ratio, numerator in numerators.items():
+        denominator = totals[RATIO_DENOMINATORS[ratio]].astype('float64')
+        totals[ratio] = (totals.pop(numerator).astype('float64') / denominator.where(denominator != 0)).astype(schemas.RATIO)
+    return totals.reset_index()[list(schema)].astype(schema)
+
+
+def rollup_keys(data_type, by):
+    """
+    Returns the columns a rollup is grouped by.
+
+    Parameters
+    ----------
+    data_type : str
+        Either 'player_boxscore' or 'team_boxscore'.
+
+    by : str
+        Either 'season' or 'match'.
+
+    Returns
+    -------
+    list of str
+        The key columns.
+
+    Examples
+    --------
+    >>> rollup_keys('team_boxscore', 'match')
+    ['season', 'match_id', 'team_name']
+    """
+    keys = ROLLUP_KEYS[data_type]
+    return keys[:1] + ['match_id'] + keys[1:] if by == 'match' else list(keys)
+
+
+def rollup_schema(data_type, by):
+    """
+    Returns the columns and dtypes of a rollup.
+
+    Parameters
+    ----------
+    data_type : str
+        Either 'player_boxscore' or 'team_boxscore'.
+
+    by : str
+        Either 'season' or 'match'.
+
+    Returns
+    -------
+    dict
+        A mapping of column name to dtype: the keys and the 'player_name' of player
+        rollups keep their boxscore dtypes ('player_id' its player_info dtype), counts
+        are summed into 'Int32', and ratios are 'float64'.
+
+    Examples
+    --------
+    >>> rollup_schema('team_boxscore', 'season')['attack_kills']
+    'Int32'
+    """
+    source = schemas.get_schema(data_type)
+    types = {**source, 'player_id': schemas.get_schema('player_info')['player_id']}
+    schema = {key: types[key] for key in rollup_keys(data_type, by)}
+    schema.update({column: source[column] for column in ROLLUP_ATTRIBUTES[data_type]})
+    schema.update(matches=schemas.COUNT, sets=schemas.COUNT)
+    schema.update({column: TOTAL for column, dtype in source.items() if dtype == schemas.COUNT and column != 'season'})
+    schema.update({ratio: schemas.RATIO for ratio in RATIO_DENOMINATORS})
+    return schema
@@ -0,0 +1,281 @@
+from . import schemas
+from .lazy import lazy_import
+
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+
+SIDES = ['home', 'away']
+SET_KEYS = ['match_id', 'set']
+TEAM_COLUMNS = ['team_involved', 'rally_point_winner', 'serving_team']
+LINEUP_COLUMNS = {side: [f'{side}_team_p{position}' for position in range(1, 7)] for side in SIDES}
+EVENT_COLUMNS = [
+    'match_id', 'set', *TEAM_COLUMNS, 'current_home_score', 'current_away_score',
+    'substitute_in_jersey_number', 'substitute_out_jersey_number',
+    'libero_enters', 'libero_jersey_number', 'libero_subsitute_jersey_number',
+    *LINEUP_COLUMNS['home'], *LINEUP_COLUMNS['away'],
+]
+RALLY_COLUMNS = [
+    'league', 'season', 'match_id', 'match_datetime', 'set', 'point_number',
+    'serving_team', 'rally_point_winner', 'current_home_score', 'current_away_score',
+]
+# Jersey numbers fit in SMALL, so (segment, jersey) pairs are packed into one integer key
+JERSEYS = 128
+
+
+def build_rotations(events_log):
+    """
+    Reconstructs the players on court for every rally of an events log.
+
+    Lineups are recorded on some events only. Within each set, every side keeps the six
+    players of its last recorded lineup by their slot in the rotation. Substitutions
+    and libero swaps of the side put the player coming in in the slot of the player
+    going out, and the slots rotate one position every time the side wins a rally the
+    other side served. Rallies before the first recorded lineup of a set have no
+    players.
+
+    Sides are matched to the team labels of the log by the score: a team is the home
+    side of a match if the home score goes up on the rallies it wins.
+
+    Parameters
+    ----------
+    events_log : pd.DataFrame
+        Events log rows as returned by `load_events_log`, of any number of leagues,
+        seasons, and matches. Events are taken in the order of the frame within each set.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per rally with the 'match_id', 'set', and 'point_number' of the rally,
+        which number the rallies of each set from 1 like the pbp 'point_number', its
+        server, winner, and score, and the jersey numbers in 'home_team_p1' through
+        'away_team_p6'.
+
+    Examples
+    --------
+    >>> rotations = build_rotations(load_events_log('mlv', 2025))
+    >>> pbp.merge(rotations, on=['match_id', 'set', 'point_number'], suffixes=('', '_rally'))
+    """
+    missing = [column for column in EVENT_COLUMNS if column not in events_log]
+    if missing:
+        raise ValueError(f"Expected an events log, the columns {missing} are missing")
+    # A stable sort groups the sets and keeps the recorded order of events within each set
+    events = events_log.sort_values(SET_KEYS, kind='stable', ignore_index=True)
+    new_set = events[SET_KEYS].ne(events[SET_KEYS].shift()).any(axis=1).to_numpy()
+    set_id = np.cumsum(new_set)
+    is_rally = events['rally_point_winner'].notna().to_numpy()
+
+    involved, winner, server = team_sides(events, set_id, is_rally)
+    # Where the server is not recorded, it is the winner of the previous rally of the set
+    previous_winner = pd.Series(np.where(is_rally, winner, np.nan)).groupby(set_id).ffill().shift().to_numpy()
+    previous_winner[new_set] = np.nan
+    server = np.where(server < 0, np.nan_to_num(previous_winner, nan=-1), server)
+
+    rallies = events.loc[is_rally, [column for column in RALLY_COLUMNS if column in events]]
+    rallies['point_number'] = pd.array(pd.Series(set_id[is_rally]).groupby(set_id[is_rally]).cumcount() + 1, dtype=schemas.COUNT)
+    for side, code in zip(SIDES, range(2)):
+        receives = (server >= 0) & (server != code)
+        lineup = side_lineup(events, side, set_id, new_set, involved == code, is_rally & (winner == code) & receives)
+        for position, column in enumerate(LINEUP_COLUMNS[side]):
+            jerseys = lineup[is_rally, position]
+            missing = np.isnan(jerseys)
+            rallies[column] = pd.arrays.IntegerArray(np.where(missing, 0, jerseys).astype('int8'), missing)
+    return rallies[[column for column in RALLY_COLUMNS if column in rallies] + LINEUP_COLUMNS['home'] + LINEUP_COLUMNS['away']].reset_index(drop=True)
+
+
+def team_sides(events, set_id, is_rally):
+    """
+    Translates the team label columns of an events log into sides.
+
+    A label takes the side whose score goes up most often on the rallies it wins in a
+    match. Labels that never win a rally keep their side if they already are 'home'
+    or 'away'.
+
+    Parameters
+    ----------
+    events : pd.DataFrame
+        Events log rows, grouped by set.
+
+    set_id : np.ndarray
+        A number identifying the set of each event.
+
+    is_rally : np.ndarray
+        Whether each event is a rally.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        The side of 'team_involved', 'rally_point_winner', and 'serving_team' for each
+        event: 0 for home, 1 for away, and -1 where it is unknown.
+
+    Examples
+    --------
+    >>> involved, winner, server = team_sides(events, set_id, is_rally)
+    """
+    names, codes = label_codes(events, TEAM_COLUMNS)
+    match = pd.factorize(events['match_id'])[0]
+    scored = []
+    for column in ['current_home_score', 'current_away_score']:
+        score = pd.Series(events[column].astype('Float64').to_numpy(dtype=float, na_value=np.nan)[is_rally])
+        scored.append((score > score.groupby(set_id[is_rally]).shift().fillna(0)).to_numpy())
+    side = np.where(scored[0], 0, np.where(scored[1], 1, -1))
+    winners = codes['rally_point_winner'][is_rally]
+    known = (side >= 0) & (winners >= 0)
+    # Count the points each (match, label) pair scored for either side
+    keys = match[is_rally][known] * len(names) + winners[known]
+    counts = np.bincount(keys * 2 + side[known], minlength=(match.max(initial=-1) + 1) * len(names) * 2).reshape(-1, 2)
+    lowered = names.str.lower()
+    named = np.where(lowered == 'home', 0, np.where(lowered == 'away', 1, -1))
+    sides = np.where(counts.sum(axis=1) > 0, counts.argmax(axis=1), np.tile(named, len(counts) // max(len(names), 1)))
+    return tuple(
+        np.where(codes[column] >= 0, sides[match * len(names) + np.maximum(codes[column], 0)] if len(sides) else -1, -1)
+        for column in TEAM_COLUMNS
+    )
+
+
+def label_codes(events, columns):
+    """
+    Encodes label columns with codes shared between the columns.
+
+    Parameters
+    ----------
+    events : pd.DataFrame
+        The frame holding the columns.
+
+    columns : list of str
+        The label columns to encode.
+
+    Returns
+    -------
+    tuple of (pd.Index, dict)
+        The distinct labels, and the code of each value of every column in them, -1
+        where it is missing.
+
+    Examples
+    --------
+    >>> names, codes = label_codes(events, ['team_involved', 'serving_team'])
+    """
+    values = {}
+    for column in columns:
+        series = events[column]
+        values[column] = series.array if isinstance(series.dtype, pd.CategoricalDtype) else pd.Categorical(series)
+    names = pd.Index(pd.unique(np.concatenate([np.asarray(value.categories, dtype=object) for value in values.values()])))
+    codes = {}
+    for column, value in values.items():
+        lookup = np.append(names.get_indexer(value.categories), -1)
+        codes[column] = lookup[value.codes]
+    return names, codes
+
+
+def side_lineup(events, side, set_id, new_set, swaps_side, side_outs):
+    """
+    Carries the recorded lineup of one side forward through its swaps and rotations.
+
+    Parameters
+    ----------
+    events : pd.DataFrame
+        Events log rows, grouped by set.
+
+    side : str
+        Either 'home' or 'away'.
+
+    set_id : np.ndarray
+        A number identifying the set of each event.
+
+    new_set : np.ndarray
+        Whether each event is the first of its set.
+
+    swaps_side : np.ndarray
+        Whether each event concerns the side.
+
+    side_outs : np.ndarray
+        Whether each event is a rally the side won while the other side served.
+
+    Returns
+    -------
+    np.ndarray
+        A float array with one row per event and the jersey numbers in positions 1 to 6
+        as columns, NaN where they are unknown.
+
+    Examples
+    --------
+    >>> side_lineup(events, 'home', set_id, new_set, involved == 0, side_outs)
+    """
+    recorded = events[LINEUP_COLUMNS[side]].astype('Float64').to_numpy(dtype=float, na_value=np.nan)
+    is_lineup = ~np.isnan(recorded).any(axis=1)
+    # A segment runs from a recorded lineup, or the start of a set, to the next one
+    segment = np.cumsum(is_lineup | new_set)
+
+    slots = np.full(recorded.shape, np.nan)
+    slots[is_lineup] = recorded[is_lineup]
+    swaps = player_swaps(events, swaps_side & ~is_lineup)
+    swap_segment = segment[swaps.index]
+    holders = pd.Series(
+        np.tile(np.arange(6.0), is_lineup.sum()),
+        index=np.repeat(segment[is_lineup], 6) * JERSEYS + recorded[is_lineup].ravel().astype(int),
+    )
+    slot = np.full(len(swaps), np.nan)
+    # A player coming in takes the slot of the player going out, so substitutes of
+    # substitutes resolve over a few passes. The libero never holds a slot: it enters
+    # the slot of the player it replaces and leaves it to the player returning.
+    while True:
+        holder = holders[~holders.index.duplicated()]
+        found = holder.reindex(swap_segment * JERSEYS + swaps['primary'].to_numpy()).to_numpy()
+        found = np.where(np.isnan(found), holder.reindex(swap_segment * JERSEYS + swaps['secondary'].to_numpy()).to_numpy(), found)
+        resolved = np.isnan(slot) & ~np.isnan(found)
+        if not resolved.any():
+            break
+        slot[resolved] = found[resolved]
+        entering = resolved & ~swaps['libero_in'].to_numpy()
+        holders = pd.concat([holders, pd.Series(slot[entering], index=swap_segment[entering] * JERSEYS + swaps['in'].to_numpy()[entering])])
+    placed = ~np.isnan(slot)
+    slots[swaps.index[placed], slot[placed].astype(int)] = swaps['in'].to_numpy()[placed]
+    slots = pd.DataFrame(slots).groupby(segment).ffill().to_numpy()
+
+    # The slots rotate once for every side out won in the segment before the event
+    rotation = pd.Series(side_outs.astype(int)).groupby(segment).cumsum().to_numpy() - side_outs
+    return np.take_along_axis(slots, (np.arange(6) + rotation[:, None]) % 6, axis=1)
+
+
+def player_swaps(events, mask):
+    """
+    Collects the substitutions and libero swaps among events.
+
+    Parameters
+    ----------
+    events : pd.DataFrame
+        Events log rows.
+
+    mask : np.ndarray
+        The events to consider.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per swap, indexed by event, with the jersey numbers going 'in', whether
+        the libero goes in ('libero_in'), and the jerseys whose slot the swap takes: the
+        'primary' one, or else the 'secondary' one.
+
+    Examples
+    --------
+    >>> player_swaps(events, involved == 0)
+    """
+    columns = ['substitute_in_jersey_number', 'substitute_out_jersey_number', 'libero_jersey_number', 'libero_subsitute_jersey_number']
+    sub_in, sub_out, libero, replaced = (
+        events[column].astype('Float64').to_numpy(dtype=float, na_value=np.nan) for column in columns
+    )
+    enters = events['libero_enters'].astype('boolean')
+    is_sub = mask & ~np.isnan(sub_in) & ~np.isnan(sub_out)
+    is_libero = mask & ~is_sub & enters.notna().to_numpy() & ~np.isnan(libero) & ~np.isnan(replaced)
+    enters = enters.fillna(False).to_numpy(dtype=bool)
+    jersey_in = np.where(is_sub, sub_in, np.where(enters, libero, replaced))
+    jersey_out = np.where(is_sub, sub_out, np.where(enters, replaced, libero))
+    leaves = is_libero & ~enters
+    index = np.flatnonzero(is_sub | is_libero)
+    return pd.DataFrame({
+        'in': jersey_in[index].astype(int),
+        'libero_in': is_libero[index] & enters[index],
+        'primary': np.where(leaves, jersey_in, jersey_out)[index].astype(int),
+        'secondary': np.where(leaves, jersey_out, jersey_in)[index].astype(int),
+    }, index=index)
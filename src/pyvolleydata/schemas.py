@@ -0,0 +1,475 @@
+import csv
+import importlib.util
+import io
+import warnings
+from . import config, session
+from .lazy import lazy_import
+
+
+pd = lazy_import('pandas')
+
+
+# Text columns with many distinct values (names, timestamps) are kept as strings, backed
+# by pyarrow when it is installed. Repetitive labels (teams, actions, outcomes) are
+# categoricals and numbers are nullable integers sized for their range.
+TEXT = 'string[pyarrow]' if importlib.util.find_spec('pyarrow') is not None else 'string'
+LABEL = 'category'
+FLAG = 'boolean'
+ID = 'Int64'
+SMALL = 'Int8'
+COUNT = 'Int16'
+INTEGERS = {ID, 'Int32', COUNT, SMALL}
+RATIO = 'float64'
+
+ENGINES = {'c', 'pyarrow'}
+# The missing value markers of pd.read_csv, so both engines agree on which values are missing
+NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+_MATCH = {
+    'match_id': ID,
+    'season': COUNT,
+    'match_datetime': LABEL,
+}
+
+_BOXSCORE_STATS = {
+    'serves': COUNT,
+    'serve_errors': COUNT,
+    'serve_aces': COUNT,
+    'serve_efficiency': RATIO,
+    'attack_attempts': COUNT,
+    'attack_errors': COUNT,
+    'attack_kills': COUNT,
+    'attack_success_ratio': RATIO,
+    'attack_efficiency': RATIO,
+    'receptions': COUNT,
+    'reception_errors': COUNT,
+    'positive_reception_ratio': RATIO,
+    'perfect_reception_ratio': RATIO,
+    'block_points': COUNT,
+    'block_touches': COUNT,
+    'earned_points': COUNT,
+    'net_points': COUNT,
+    'assists': COUNT,
+    'successful_digs': COUNT,
+    'id': TEXT,
+    'spike_hp': COUNT,
+    'points': COUNT,
+}
+
+SCHEMAS = {
+    'schedule': {
+        'season': COUNT,
+        'date': LABEL,
+        'home_team': LABEL,
+        'away_team': LABEL,
+        'home_team_set_wins': SMALL,
+        'away_team_set_wins': SMALL,
+        'result': LABEL,
+        'match_id': ID,
+        'phase': LABEL,
+    },
+    'officials': {
+        **_MATCH,
+        'officials_type': LABEL,
+        'full_name': TEXT,
+        'first_name': TEXT,
+        'last_name': TEXT,
+        'level': LABEL,
+    },
+    'player_info': {
+        **_MATCH,
+        'player_id': ID,
+        'player_name': TEXT,
+        'first_name': TEXT,
+        'last_name': TEXT,
+        'jersey_number': SMALL,
+        'primary_position': SMALL,
+        'roster_status': LABEL,
+        'is_foreign': FLAG,
+        'is_confederation': FLAG,
+        'is_captain': FLAG,
+        'is_libero': FLAG,
+        **{
+            column: dtype
+            for set_number in range(1, 6)
+            for column, dtype in [
+                (f'set_{set_number}_is_starter', FLAG),
+                (f'set_{set_number}_starting_position', SMALL),
+            ]
+        },
+        'team_name': LABEL,
+        'team_short_name': LABEL,
+        'team_code': LABEL,
+        'team_color': LABEL,
+    },
+    'team_staff': {
+        **_MATCH,
+        'team_name': LABEL,
+        'staff_type': LABEL,
+        'full_name': TEXT,
+        'first_name': TEXT,
+        'last_name': TEXT,
+    },
+    'pbp': {
+        **_MATCH,
+        'home_team_name': LABEL,
+        'away_team_name': LABEL,
+        'team_involved': LABEL,
+        'jersey_number': SMALL,
+        'action': LABEL,
+        'outcome': LABEL,
+        'set': SMALL,
+        'point_number': COUNT,
+        'point_winner': LABEL,
+        'home_score': SMALL,
+        'away_score': SMALL,
+        'rally_length': COUNT,
+    },
+    'events_log': {
+        **_MATCH,
+        'set': SMALL,
+        'set_start_time': LABEL,
+        'set_end_time': LABEL,
+        'set_duration': 'Int32',
+        'set_final_home_score': SMALL,
+        'set_final_away_score': SMALL,
+        'event_type': LABEL,
+        'event_time': TEXT,
+        'libero_enters': FLAG,
+        'team_involved': LABEL,
+        'libero_jersey_number': SMALL,
+        'libero_subsitute_jersey_number': SMALL,
+        'rally_start_time': TEXT,
+        'rally_end_time': TEXT,
+        'rally_point_winner': LABEL,
+        'substitute_in_jersey_number': SMALL,
+        'substitute_out_jersey_number': SMALL,
+        'challenge_approved': LABEL,
+        'challenge_reason': LABEL,
+        'challenge_method': LABEL,
+        'challenge_response': LABEL,
+        'challenge_at_home_score': SMALL,
+        'challenge_at_away_score': SMALL,
+        'challenge_score_change': LABEL,
+        'serving_team': LABEL,
+        'current_home_score': SMALL,
+        'current_away_score': SMALL,
+        **{f'{side}_team_p{position}': SMALL for side in ['home', 'away'] for position in range(1, 7)},
+        'verified_time': TEXT,
+        'verified_method': LABEL,
+        'sanction_type': LABEL,
+        'sanction_remark': LABEL,
+        'sanction_staff_role': LABEL,
+        'staff_first_name': TEXT,
+        'staff_last_name': TEXT,
+        'staff_type': LABEL,
+        'is_exceptional': LABEL,
+    },
+    'player_boxscore': {
+        **_MATCH,
+        'team_involved': LABEL,
+        'team_name': LABEL,
+        'player_name': TEXT,
+        'first_name': TEXT,
+        'last_name': TEXT,
+        'sets_played': SMALL,
+        'player_number': SMALL,
+        'is_captain': FLAG,
+        'is_libero': FLAG,
+        'set_number': SMALL,
+        'set_starting_position': LABEL,
+        **_BOXSCORE_STATS,
+    },
+    'team_boxscore': {
+        **_MATCH,
+        'team_involved': LABEL,
+        'team_name': LABEL,
+        'set_number': SMALL,
+        **_BOXSCORE_STATS,
+    },
+}
+
+
+def get_schema(data_type):
+    """
+    Returns the column dtypes of a dataset.
+
+    Parameters
+    ----------
+    data_type : str
+        The type of data (e.g., 'pbp', 'events_log').
+
+    Returns
+    -------
+    dict
+        A mapping of column name to pandas dtype, in file column order.
+
+    Examples
+    --------
+    >>> get_schema('pbp')['team_involved']
+    'category'
+    """
+    if data_type not in SCHEMAS:
+        raise ValueError(f"data_type must be one of {sorted(SCHEMAS)}, got '{data_type}'")
+    return SCHEMAS[data_type]
+
+
+def empty_frame(data_type, columns=None):
+    """
+    Returns a DataFrame without rows that has the registered columns and dtypes of a dataset.
+
+    Parameters
+    ----------
+    data_type : str
+        The type of data (e.g., 'pbp', 'events_log').
+
+    columns : list of str or None, optional
+        The columns to include. By default, None includes every registered column.
+
+    Returns
+    -------
+    pd.DataFrame
+        An empty frame.
+
+    Examples
+    --------
+    >>> empty_frame('schedule', ['season', 'match_id'])
+    """
+    schema = get_schema(data_type)
+    columns = list(schema) if columns is None else [column for column in columns if column in schema]
+    return pd.DataFrame({column: pd.Series(dtype=schema[column]) for column in columns})
+
+
+def read_csv(source, data_type, usecols=None, engine=None, **kwargs):
+    """
+    Parses a release CSV file with the dtypes registered for its dataset.
+
+    The header of the file is validated against the registry: missing or unexpected
+    columns are reported in a warning, and unexpected columns keep their inferred dtype.
+    Columns whose values do not fit their registered dtype also keep their inferred
+    dtype and are reported in a warning. Registered columns get the same dtypes with
+    either engine.
+
+    Parameters
+    ----------
+    source : str or file-like
+        The path, URL, or buffer of the CSV file.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    usecols : list of str or None, optional
+        The columns to parse. By default, None parses every column.
+
+    engine : str or None, optional
+        The parser, see `resolve_engine`. By default, None uses the 'engine' option.
+
+    **kwargs
+        Extra keyword arguments passed on to `pd.read_csv`, which always parses with the
+        'c' engine.
+
+    Returns
+    -------
+    pd.DataFrame
+        The parsed file.
+
+    Examples
+    --------
+    >>> read_csv('aupvb_pbp_2024.csv', 'pbp')
+    >>> read_csv('aupvb_pbp_2024.csv', 'pbp', usecols=['match_id', 'action'], engine='pyarrow')
+    """
+    if resolve_engine(engine) == 'pyarrow' and not kwargs:
+        return _cast(_read_arrow_csv(source, data_type, usecols), data_type, usecols)
+    parse_dtypes = _parse_dtypes(data_type)
+    try:
+        df = pd.read_csv(source, dtype=parse_dtypes, usecols=_usecols(usecols), **kwargs)
+    except (ValueError, TypeError):
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        df = pd.read_csv(source, usecols=_usecols(usecols), **kwargs)
+    return _cast(df, data_type, usecols)
+
+
+def iter_csv(source, data_type, chunksize, usecols=None, **kwargs):
+    """
+    Parses a release CSV file in chunks with the dtypes registered for its dataset.
+
+    Parameters
+    ----------
+    source : str or file-like
+        The path, URL, or buffer of the CSV file.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    chunksize : int
+        The number of rows in each chunk.
+
+    usecols : list of str or None, optional
+        The columns to parse. By default, None parses every column.
+
+    **kwargs
+        Extra keyword arguments passed on to `pd.read_csv`.
+
+    Yields
+    ------
+    pd.DataFrame
+        The parsed chunks of the file.
+
+    Examples
+    --------
+    >>> for chunk in iter_csv('aupvb_pbp_2024.csv', 'pbp', chunksize=10_000):
+    ...     print(len(chunk))
+    """
+    parse_dtypes = _parse_dtypes(data_type)
+    with pd.read_csv(source, dtype=parse_dtypes, usecols=_usecols(usecols), chunksize=chunksize, **kwargs) as reader:
+        for i, chunk in enumerate(reader):
+            yield _cast(chunk, data_type, usecols, validate=i == 0)
+
+
+def resolve_engine(engine=None):
+    """
+    Returns the CSV parser to use, falling back to 'c' when pyarrow is not installed.
+
+    Parameters
+    ----------
+    engine : str or None, optional
+        Either 'c' for the single-threaded pandas parser or 'pyarrow' for the
+        multithreaded pyarrow parser. By default, None uses the 'engine' option.
+
+    Returns
+    -------
+    str
+        The engine that is available.
+
+    Examples
+    --------
+    >>> resolve_engine('pyarrow')
+    'pyarrow'
+    """
+    if engine is None:
+        engine = config.get_option('engine')
+    if engine not in ENGINES:
+        raise ValueError(f"Expected engine to be one of {sorted(ENGINES)}, got '{engine}'")
+    if engine == 'pyarrow' and importlib.util.find_spec('pyarrow') is None:
+        warnings.warn("The 'pyarrow' engine requires pyarrow, parsing with the 'c' engine instead", stacklevel=2)
+        return 'c'
+    return engine
+
+
+def _read_arrow_csv(source, data_type, usecols=None):
+    import pyarrow as pa
+    if isinstance(source, str) and source.startswith(('http://', 'https://')):
+        with session.urlopen(source) as response:
+            source = pa.py_buffer(response.read())
+    elif hasattr(source, 'read'):
+        source = pa.py_buffer(source.read())
+    schema = get_schema(data_type)
+    header = _read_header(source)
+    columns = header if usecols is None else [column for column in header if column in set(usecols)]
+    # Integers are parsed as int64 and cast afterwards, like with the C parser. Labels
+    # are dictionary encoded so pandas builds categoricals without a string per row.
+    text_types = {LABEL: pa.dictionary(pa.int32(), pa.string()), TEXT: pa.large_string()}
+    other_types = {FLAG: pa.bool_(), RATIO: pa.float64(), **dict.fromkeys(INTEGERS, pa.int64())}
+    column_types = {column: text_types.get(schema[column], other_types.get(schema[column])) for column in columns if column in schema}
+    try:
+        table = _arrow_csv(source, columns, column_types)
+    except pa.ArrowInvalid:
+        # Values that do not fit their type leave the column to inference, see _cast
+        column_types = {column: dtype for column, dtype in column_types.items() if schema[column] in text_types}
+        table = _arrow_csv(source, columns, column_types)
+    df = table.to_pandas(types_mapper={pa.large_string(): pd.StringDtype('pyarrow')}.get)
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].cat.reorder_categories(df[column].cat.categories.sort_values())
+    return df
+
+
+def _arrow_csv(source, columns, column_types):
+    import pyarrow as pa
+    import pyarrow.csv
+    return pyarrow.csv.read_csv(
+        pa.BufferReader(source) if isinstance(source, pa.Buffer) else source,
+        convert_options=pyarrow.csv.ConvertOptions(
+            column_types=column_types,
+            include_columns=columns,
+            null_values=NA_VALUES,
+            strings_can_be_null=True,
+        )
+    )
+
+
+def _read_header(source):
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            line = f.readline()
+    else:
+        line = io.BytesIO(source).readline()
+    return next(csv.reader([line.decode('utf-8-sig')]), [])
+
+
+def _parse_dtypes(data_type):
+    # The C parser is several times slower at nullable integers than at inferring
+    # int64/float64, so integers are parsed plainly and cast afterwards. The cast also
+    # raises on out-of-range values, which read_csv would silently wrap.
+    return {column: dtype for column, dtype in get_schema(data_type).items() if dtype not in INTEGERS}
+
+
+def _usecols(usecols):
+    # A callable keeps read_csv from failing on requested columns that are missing from
+    # the file, which are reported by the validation instead
+    if usecols is None:
+        return None
+    wanted = set(usecols)
+    return lambda column: column in wanted
+
+
+def _cast(df, data_type, usecols=None, validate=True):
+    schema = get_schema(data_type)
+    failed = []
+    for column in df.columns:
+        if column in schema and df[column].dtype != schema[column]:
+            try:
+                df[column] = df[column].astype(schema[column])
+            except (ValueError, TypeError, OverflowError):
+                failed.append(column)
+    if failed:
+        warnings.warn(f"{data_type} columns kept their inferred dtype: {', '.join(failed)}", stacklevel=3)
+    if validate:
+        validate_columns(df.columns, data_type, usecols)
+    return df
+
+
+def validate_columns(columns, data_type, expected=None):
+    """
+    Compares the columns of a parsed file with the registry and warns about differences.
+
+    Parameters
+    ----------
+    columns : list of str
+        The columns of the parsed file.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    expected : list of str or None, optional
+        The columns that were requested. By default, None expects every registered column.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> validate_columns(['match_id', 'season'], 'pbp')  # Warns about missing columns
+    """
+    schema = get_schema(data_type)
+    missing = [column for column in (schema if expected is None else expected) if column not in columns]
+    unexpected = [column for column in columns if column not in schema]
+    if missing:
+        warnings.warn(f"{data_type} file is missing columns: {', '.join(missing)}", stacklevel=4)
+    if unexpected:
+        warnings.warn(f"{data_type} file has unregistered columns: {', '.join(unexpected)}", stacklevel=4)
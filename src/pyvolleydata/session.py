@@ -0,0 +1,189 @@
+import atexit
+import functools
+import http.client
+import os
+import socket
+import threading
+import urllib.error
+import urllib.request
+from . import config
+
+
+_idle = {}
+_lock = threading.Lock()
+
+
+class PooledHandler(urllib.request.HTTPHandler, urllib.request.HTTPSHandler):
+    """
+    A urllib handler that keeps HTTP/1.1 connections alive and reuses them across requests.
+
+    urllib opens a new connection, and for https a new TLS handshake, for every request.
+    This handler instead takes an idle connection to the host from a pool shared by
+    every thread, and returns it to the pool once the body of the response was read to
+    the end. Responses closed early, or that the server closes, are not reused.
+    """
+
+    def http_open(self, req):
+        return self._open(req, http.client.HTTPConnection)
+
+    def https_open(self, req):
+        if req._tunnel_host:
+            # Connections through a proxy tunnel are left to urllib
+            return super().https_open(req)
+        return self._open(req, http.client.HTTPSConnection)
+
+    def _open(self, req, connection_class):
+        headers = dict(req.unredirected_hdrs)
+        headers.update({name: value for name, value in req.headers.items() if name not in headers})
+        headers = {name.title(): value for name, value in headers.items()}
+        headers['Connection'] = 'keep-alive'
+        origin = (connection_class.__name__, req.host)
+        for attempt in range(2):
+            connection, reused = _acquire(origin, connection_class, req.timeout)
+            try:
+                connection.request(req.get_method(), req.selector, req.data, headers)
+                response = connection.getresponse()
+            except OSError as e:
+                connection.close()
+                # The server may have closed an idle connection just before it was
+                # reused, which is retried once on a fresh connection
+                if reused and attempt == 0 and isinstance(e, ConnectionError):
+                    continue
+                raise urllib.error.URLError(e) from e
+            except BaseException:
+                connection.close()
+                raise
+            break
+        response.release = functools.partial(_release, origin, connection)
+        if response.length == 0 and not response.chunked:
+            # Nothing is left to read (e.g., a 304 response), so the connection is free
+            response.close()
+        response.url = req.get_full_url()
+        response.msg = response.reason
+        return response
+
+
+class PooledResponse(http.client.HTTPResponse):
+    """
+    An HTTP response that returns its connection to the pool once its body was read.
+    """
+    release = None
+
+    def _close_conn(self):
+        # Called once the body was read to the end
+        super()._close_conn()
+        release, self.release = self.release, None
+        if release is not None:
+            release(not self.will_close)
+
+    def close(self):
+        finished = self.fp is None or (not self.chunked and self.length == 0)
+        release, self.release = self.release, None
+        super().close()
+        if release is not None:
+            release(finished and not self.will_close)
+
+
+def urlopen(url, timeout=None):
+    """
+    Opens a URL like `urllib.request.urlopen`, through pooled keep-alive connections.
+
+    Parameters
+    ----------
+    url : str or urllib.request.Request
+        The URL or request to open.
+
+    timeout : float or None, optional
+        Number of seconds to wait for the server. None uses the default socket timeout.
+
+    Returns
+    -------
+    http.client.HTTPResponse
+        The response, which returns its connection to the pool once it is read to the end.
+
+    Raises
+    ------
+    urllib.error.HTTPError
+        If the server responds with an error status.
+
+    urllib.error.URLError
+        If the server cannot be reached.
+
+    Examples
+    --------
+    >>> with urlopen(build_url('mlv', 'pbp', 2025)) as response:
+    ...     content = response.read()
+    """
+    if timeout is None:
+        return _opener.open(url)
+    return _opener.open(url, timeout=timeout)
+
+
+def close():
+    """
+    Closes every idle pooled connection.
+
+    Connections in use are closed when their response is, rather than returned to the
+    pool. The pool is closed when the interpreter exits.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> close()
+    """
+    with _lock:
+        idle = [connection for connections in _idle.values() for connection in connections]
+        _idle.clear()
+    for connection in idle:
+        connection.close()
+
+
+def idle_connections():
+    """
+    Returns the number of idle connections held in the pool.
+
+    Returns
+    -------
+    int
+        The number of pooled connections that are not in use.
+
+    Examples
+    --------
+    >>> idle_connections()
+    """
+    with _lock:
+        return sum(len(connections) for connections in _idle.values())
+
+
+def _acquire(origin, connection_class, timeout):
+    with _lock:
+        connections = _idle.get(origin)
+        connection = connections.pop() if connections else None
+    if connection is not None:
+        if connection.sock is not None:
+            # urllib passes a sentinel rather than None for the default timeout
+            connection.sock.settimeout(timeout if isinstance(timeout, (int, float)) else socket.getdefaulttimeout())
+        return connection, True
+    connection = connection_class(origin[1], timeout=timeout)
+    connection.response_class = PooledResponse
+    return connection, False
+
+
+def _release(origin, connection, reusable):
+    if reusable:
+        with _lock:
+            connections = _idle.setdefault(origin, [])
+            # At most one idle connection per download thread is kept per host
+            if len(connections) < config.get_option('max_workers'):
+                connections.append(connection)
+                return
+    connection.close()
+
+
+_opener = urllib.request.build_opener(PooledHandler())
+atexit.register(close)
+# A forked child must not share the sockets of its parent
+os.register_at_fork(after_in_child=_idle.clear)
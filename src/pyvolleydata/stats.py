@@ -0,0 +1,272 @@
+import threading
+import time
+from contextlib import contextmanager
+from .lazy import lazy_import
+
+
+pd = lazy_import('pandas')
+
+
+# The stages of a load, in the order a file goes through them:
+# - connect : the request of a release file, until its response headers arrive
+# - download : the body of the file, or how the cache answered ('cache' field)
+# - parse : reading a file into a frame, including the rows filtered while parsing
+# - filter : the row filters applied to each parsed chunk
+# - concat : assembling the frames of several files or chunks
+# - load : a whole load_* call, answered from memory or not ('cache' field)
+STAGES = ['connect', 'download', 'parse', 'filter', 'concat', 'load']
+EVENT_FIELDS = ['stage', 'league', 'data_type', 'source', 'seconds', 'bytes', 'rows', 'memory', 'cache', 'error']
+
+_hooks = []
+_lock = threading.Lock()
+
+
+class Recorder:
+    """
+    Collects the events of the load pipeline, see `record`.
+
+    Attributes
+    ----------
+    events : list of dict
+        The recorded events, in the order they finished.
+
+    Examples
+    --------
+    >>> with record() as recorder:
+    ...     load_events_log('mlv', [2024, 2025])
+    >>> recorder.summary()
+    """
+
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        with self._lock:
+            self.events.append(event)
+
+    def report(self):
+        """
+        Returns the recorded events as a DataFrame.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per event with the columns of `EVENT_FIELDS`: the 'stage', the
+            'league' and 'data_type' it concerns, the URL or path of the file
+            ('source'), its duration in 'seconds', the 'bytes' downloaded, the 'rows'
+            and 'memory' (in bytes) of the resulting frame, how the cache answered
+            ('cache'), and the name of the exception it raised ('error'). Fields that do
+            not apply to a stage are missing.
+
+        Examples
+        --------
+        >>> recorder.report().query("stage == 'download'")
+        """
+        with self._lock:
+            events = list(self.events)
+        df = pd.DataFrame(events, columns=EVENT_FIELDS)
+        df['stage'] = pd.Categorical(df['stage'], categories=STAGES)
+        for column in ['bytes', 'rows', 'memory']:
+            df[column] = df[column].astype('Int64')
+        return df
+
+    def summary(self):
+        """
+        Returns the events of each stage added up.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per stage with the number of 'events', and the total 'seconds',
+            'bytes', and 'rows'. The seconds of stages that run in parallel threads
+            add up to more than the time the load took.
+
+        Examples
+        --------
+        >>> recorder.summary().loc['parse', 'seconds']
+        """
+        return self.report().groupby('stage', observed=False).agg(
+            events=('stage', 'size'),
+            seconds=('seconds', 'sum'),
+            bytes=('bytes', 'sum'),
+            rows=('rows', 'sum'),
+        )
+
+
+def add_hook(hook):
+    """
+    Registers a function that is called with every event of the load pipeline.
+
+    Hooks are called in the thread that did the work, with a dict holding the fields
+    of `EVENT_FIELDS` that apply to the event. While no hook is registered, nothing is
+    measured.
+
+    Parameters
+    ----------
+    hook : callable
+        A function `hook(event)`.
+
+    Returns
+    -------
+    callable
+        The hook, so `add_hook` can be used as a decorator.
+
+    Examples
+    --------
+    >>> @add_hook
+    ... def log_downloads(event):
+    ...     if event['stage'] == 'download':
+    ...         print(event['source'], event.get('bytes'), event['seconds'])
+    """
+    with _lock:
+        _hooks.append(hook)
+    return hook
+
+
+def remove_hook(hook):
+    """
+    Unregisters a hook added with `add_hook`.
+
+    Parameters
+    ----------
+    hook : callable
+        The hook to remove.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> remove_hook(log_downloads)
+    """
+    with _lock:
+        _hooks.remove(hook)
+
+
+@contextmanager
+def record():
+    """
+    Records the events of the load pipeline while the context is open.
+
+    Events of every thread are recorded, including loads that other threads run at the
+    same time.
+
+    Yields
+    ------
+    Recorder
+        The recorder, whose `report` and `summary` describe the recorded events.
+
+    Examples
+    --------
+    >>> with record() as recorder:
+    ...     load_events_log('mlv', 2025)
+    >>> recorder.report()
+    """
+    recorder = Recorder()
+    add_hook(recorder)
+    try:
+        yield recorder
+    finally:
+        remove_hook(recorder)
+
+
+def enabled():
+    """Returns whether any hook is registered."""
+    return bool(_hooks)
+
+
+def emit(stage, **fields):
+    """
+    Sends an event to the registered hooks.
+
+    Parameters
+    ----------
+    stage : str
+        One of `STAGES`.
+
+    **fields
+        Fields of the event, see `EVENT_FIELDS`.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> emit('download', source=url, cache='revalidated', seconds=0.02)
+    """
+    if _hooks:
+        event = {'stage': stage, **fields}
+        for hook in list(_hooks):
+            hook(event)
+
+
+def span(stage, **fields):
+    """
+    Measures a block of the load pipeline as one event.
+
+    The event gets the 'seconds' the block took, and the 'error' it raised. The block
+    can add fields to the event it is given, and a 'frame' field is replaced with the
+    'rows' and 'memory' of the frame. While no hook is registered, the block is not
+    measured and its fields are discarded.
+
+    Parameters
+    ----------
+    stage : str
+        One of `STAGES`.
+
+    **fields
+        Fields of the event, see `EVENT_FIELDS`.
+
+    Returns
+    -------
+    context manager
+        A context manager that yields the dict of the event.
+
+    Examples
+    --------
+    >>> with span('parse', data_type='pbp', source=path) as event:
+    ...     event['frame'] = df = parse_csv(path, 'pbp')
+    """
+    if not _hooks:
+        return _NULL_SPAN
+    return _Span(stage, fields)
+
+
+class _Span:
+    __slots__ = ('event', 'start')
+
+    def __init__(self, stage, fields):
+        self.event = {'stage': stage, **fields}
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self.event
+
+    def __exit__(self, exc_type, exc, traceback):
+        event = self.event
+        event['seconds'] = time.perf_counter() - self.start
+        frame = event.pop('frame', None)
+        if frame is not None:
+            event['rows'] = len(frame)
+            event['memory'] = int(frame.memory_usage(deep=True).sum())
+        if exc_type is not None:
+            event['error'] = exc_type.__name__
+        for hook in list(_hooks):
+            hook(event)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return {}
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
@@ -0,0 +1,509 @@
+import filecmp
+import hashlib
+import io
+import json
+import os
+from . import schemas
+from .filters import filter_columns, to_expression
+from .lazy import lazy_import
+
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+
+STORAGE_FORMATS = {'csv', 'parquet', 'feather'}
+METADATA_KEY = b'pyvolleydata'
+
+
+def import_pyarrow():
+    """
+    Imports pyarrow, raising a helpful error if it is not installed.
+
+    Returns
+    -------
+    module
+        The pyarrow module.
+
+    Examples
+    --------
+    >>> pa = import_pyarrow()
+    """
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for the 'parquet' and 'feather' storage formats, "
+            "install it with `pip install pyvolleydata[arrow]`"
+        ) from e
+    return pyarrow
+
+
+def validate_storage_format(storage_format):
+    """
+    Checks whether the storage format is supported and raises an error if not.
+
+    Parameters
+    ----------
+    storage_format : str
+        One of 'csv', 'parquet', or 'feather'.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> validate_storage_format('feather')
+    >>> validate_storage_format('xlsx')  # Raises ValueError
+    """
+    if storage_format not in STORAGE_FORMATS:
+        raise ValueError(f"storage_format must be one of {sorted(STORAGE_FORMATS)}, got '{storage_format}'")
+    if storage_format != 'csv':
+        import_pyarrow()
+
+
+def convert_csv(csv_path, path, storage_format, data_type):
+    """
+    Converts a downloaded CSV file into a typed columnar file.
+
+    The CSV is parsed with the dtypes registered for its dataset, so the stored column
+    types match what the CSV path returns. Feather (Arrow IPC) files are written
+    uncompressed so they can be memory-mapped without decoding.
+
+    Parameters
+    ----------
+    csv_path : str
+        The path of the CSV file to convert.
+
+    path : str
+        The path to write the converted file to.
+
+    storage_format : str
+        Either 'parquet' or 'feather'.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> convert_csv('pbp_2025.csv', 'pbp_2025.feather', 'feather', 'pbp')
+    """
+    write_frame(schemas.read_csv(csv_path, data_type), path, storage_format)
+
+
+def scan_matches(content):
+    """
+    Splits the raw rows of a release CSV file into the byte ranges of its matches and hashes them.
+
+    Parameters
+    ----------
+    content : bytes
+        The contents of the CSV file.
+
+    Returns
+    -------
+    tuple of (bytes, dict, dict) or None
+        The header line, a mapping of match_id (as a string) to the (start, end) byte
+        range of its rows in file order, and the digests of the header and of each
+        match. None if the rows of a match are not contiguous or the rows cannot be
+        located by line (e.g., quoted line breaks).
+
+    Examples
+    --------
+    >>> header, blocks, digests = scan_matches(open('pbp_2025.csv', 'rb').read())
+    """
+    match_ids = pd.read_csv(io.BytesIO(content), usecols=['match_id'])['match_id']
+    ends = np.flatnonzero(np.frombuffer(content, dtype=np.uint8) == ord('\n')) + 1
+    if len(content) and content[-1:] != b'\n':
+        ends = np.append(ends, len(content))
+    if len(ends) != len(match_ids) + 1:
+        return None
+    runs = match_runs(match_ids)
+    if runs is None:
+        return None
+    header = content[:ends[0]]
+    blocks = {match_id: (int(ends[begin]), int(ends[end])) for match_id, (begin, end) in runs.items()}
+    digests = {
+        'header': _digest(header),
+        'matches': {match_id: _digest(content[start:stop]) for match_id, (start, stop) in blocks.items()},
+    }
+    return header, blocks, digests
+
+
+def match_runs(match_ids):
+    """
+    Returns the row range of every match in a column of match_ids.
+
+    Parameters
+    ----------
+    match_ids : pd.Series
+        The match_id column of a file, in file order.
+
+    Returns
+    -------
+    dict or None
+        A mapping of match_id (as a string) to its (start, stop) rows in file order, or None
+        if the rows of a match are not contiguous or a match_id is missing.
+
+    Examples
+    --------
+    >>> match_runs(pd.Series([7, 7, 8]))
+    {'7': (0, 2), '8': (2, 3)}
+    """
+    if match_ids.isna().any():
+        return None
+    codes, uniques = pd.factorize(match_ids)
+    bounds = [0, *(np.flatnonzero(np.diff(codes)) + 1), len(codes)]
+    if len(bounds) - 1 != len(uniques):
+        return None
+    return {str(int(match_ids.iloc[begin])): (int(begin), int(end)) for begin, end in zip(bounds[:-1], bounds[1:])}
+
+
+def index_matches(path, storage_format):
+    """
+    Locates the rows of every match in a stored file.
+
+    Parameters
+    ----------
+    path : str
+        The path of the stored file.
+
+    storage_format : str
+        One of 'csv', 'parquet', or 'feather'.
+
+    Returns
+    -------
+    dict
+        A mapping of match_id (as a string) to the (start, stop) byte range of its rows
+        for CSV files, or its row range for columnar files. The range is (None, None) for
+        every match of a file whose matches are not contiguous.
+
+    Examples
+    --------
+    >>> index_matches('mlv/pbp/2025.csv', 'csv')['2025001']
+    """
+    if storage_format == 'csv':
+        with open(path, 'rb') as f:
+            content = f.read()
+        scan = scan_matches(content)
+        if scan is not None:
+            return scan[1]
+        match_ids = pd.read_csv(io.BytesIO(content), usecols=['match_id'])['match_id']
+    else:
+        match_ids = read_stored(path, storage_format, columns=['match_id'])['match_id']
+        runs = match_runs(match_ids)
+        if runs is not None:
+            return runs
+    return {str(int(match_id)): (None, None) for match_id in match_ids.dropna().unique()}
+
+
+def read_match(path, storage_format, data_type, start, stop):
+    """
+    Reads the rows of a single match from a stored file, see `index_matches`.
+
+    Only the byte range of the match is read from CSV files. Columnar files are sliced
+    through a memory map (feather), or by reading the row groups that hold the rows (parquet).
+
+    Parameters
+    ----------
+    path : str
+        The path of the stored file.
+
+    storage_format : str
+        One of 'csv', 'parquet', or 'feather'.
+
+    data_type : str
+        The type of data in the file (e.g., 'pbp', 'events_log').
+
+    start : int
+        The first byte (CSV) or row (columnar) of the match.
+
+    stop : int
+        The byte or row after the last one of the match.
+
+    Returns
+    -------
+    pd.DataFrame
+        The rows of the match.
+
+    Examples
+    --------
+    >>> read_match('mlv/pbp/2025.feather', 'feather', 'pbp', 1200, 1530)
+    """
+    if storage_format == 'csv':
+        with open(path, 'rb') as f:
+            header = f.readline()
+            f.seek(start)
+            return schemas.read_csv(io.BytesIO(header + f.read(stop - start)), data_type)
+    pa = import_pyarrow()
+    if storage_format == 'feather':
+        import pyarrow.ipc
+        table = pyarrow.ipc.open_file(pa.memory_map(path)).read_all().slice(start, stop - start)
+    else:
+        import pyarrow.parquet
+        parquet_file = pyarrow.parquet.ParquetFile(path, memory_map=True)
+        groups = []
+        offset = first = 0
+        for i in range(parquet_file.num_row_groups):
+            rows = parquet_file.metadata.row_group(i).num_rows
+            if offset < stop and offset + rows > start:
+                if not groups:
+                    first = offset
+                groups.append(i)
+            offset += rows
+        table = parquet_file.read_row_groups(groups).slice(start - first, stop - start)
+    return _to_pandas(table)
+
+
+def read_digests(path, storage_format):
+    """
+    Returns the match digests kept in the metadata of a stored file.
+
+    Parameters
+    ----------
+    path : str
+        The path of the stored file.
+
+    storage_format : str
+        Either 'parquet' or 'feather'.
+
+    Returns
+    -------
+    dict or None
+        The digests of the header and of each match, or None if the file has none.
+
+    Examples
+    --------
+    >>> read_digests('pbp_2025.feather', 'feather')['matches']
+    """
+    pa = import_pyarrow()
+    if storage_format == 'feather':
+        import pyarrow.ipc
+        metadata = pyarrow.ipc.open_file(pa.memory_map(path)).schema.metadata
+    else:
+        import pyarrow.parquet
+        metadata = pyarrow.parquet.read_schema(path).metadata
+    if not metadata or METADATA_KEY not in metadata:
+        return None
+    return json.loads(metadata[METADATA_KEY])
+
+
+def write_partitions(csv_path, path, storage_format, data_type, chunksize=100_000, previous_path=None):
+    """
+    Splits a downloaded all-seasons CSV file into one file per season.
+
+    CSV partitions are written while the file is parsed chunk by chunk, so the whole file
+    is never held in memory. Columnar partitions are written from a single typed parse,
+    like `convert_csv`. Rows without a season are dropped. Partitions that are identical
+    to the previous ones keep their modification time, so files derived from them (see
+    `cache.store_derived`) stay valid.
+
+    Parameters
+    ----------
+    csv_path : str
+        The path of the CSV file to split.
+
+    path : str
+        The directory to write the 'season.storage_format' files to.
+
+    storage_format : str
+        One of 'csv', 'parquet', or 'feather'.
+
+    data_type : str
+        The type of data in the file (e.g., 'schedule', 'player_boxscore').
+
+    chunksize : int, optional
+        The number of rows parsed at a time for CSV partitions.
+
+    previous_path : str or None, optional
+        The directory of the currently stored partitions, which may not exist.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> write_partitions('pvf_schedule.csv', 'schedule', 'csv', 'schedule')
+    """
+    os.makedirs(path)
+    if storage_format == 'csv':
+        written = set()
+        for chunk in schemas.iter_csv(csv_path, data_type, chunksize):
+            for season, part in chunk.groupby('season', sort=False):
+                part.to_csv(os.path.join(path, f'{season}.csv'), mode='a', header=season not in written, index=False)
+                written.add(season)
+    else:
+        for season, part in schemas.read_csv(csv_path, data_type).groupby('season', sort=False):
+            write_frame(part, os.path.join(path, f'{season}.{storage_format}'), storage_format)
+    if previous_path is not None and os.path.isdir(previous_path):
+        for name in os.listdir(path):
+            previous = os.path.join(previous_path, name)
+            if os.path.isfile(previous) and filecmp.cmp(os.path.join(path, name), previous, shallow=False):
+                stat = os.stat(previous)
+                os.utime(os.path.join(path, name), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def read_stored(path, storage_format, columns=None, filters=None):
+    """
+    Reads a stored columnar file into a DataFrame through a memory map.
+
+    Only the requested columns are read, and parquet files skip the row groups that no
+    filtered row can be in. Rows are filtered on the Arrow table before conversion, so
+    data that is not requested is never materialized in pandas. Numeric columns of
+    feather files are handed to pandas without copying, so they stay backed by the page
+    cache rather than the heap.
+
+    Parameters
+    ----------
+    path : str
+        The path of the stored file.
+
+    storage_format : str
+        Either 'parquet' or 'feather'.
+
+    columns : list of str or None, optional
+        The columns to read. By default, None reads every column.
+
+    filters : list of list of tuple or None, optional
+        Row filters in disjunctive normal form, see `filters.normalize_filters`.
+
+    Returns
+    -------
+    pd.DataFrame
+        The contents of the file.
+
+    Examples
+    --------
+    >>> read_stored('pbp_2025.feather', 'feather')
+    >>> read_stored('pbp_2025.parquet', 'parquet', columns=['match_id'], filters=[[('set', '==', 5)]])
+    """
+    pa = import_pyarrow()
+    if storage_format == 'feather':
+        import pyarrow.feather
+        import pyarrow.ipc
+        names = pyarrow.ipc.open_file(pa.memory_map(path)).schema.names
+    else:
+        import pyarrow.parquet
+        names = pyarrow.parquet.read_schema(path, memory_map=True).names
+    read_columns = None
+    if columns is not None:
+        read_columns = [column for column in dict.fromkeys([*columns, *filter_columns(filters)]) if column in names]
+    if storage_format == 'feather':
+        table = pyarrow.feather.read_table(path, columns=read_columns, memory_map=True)
+        if filters is not None:
+            table = table.filter(to_expression(filters))
+    else:
+        table = pyarrow.parquet.read_table(
+            path, columns=read_columns, filters=None if filters is None else to_expression(filters), memory_map=True
+        )
+    if columns is not None:
+        table = table.select([column for column in columns if column in names])
+    return _to_pandas(table, self_destruct=True)
+
+
+def iter_stored(path, storage_format, chunksize, columns=None, filters=None):
+    """
+    Streams a stored columnar file batch by batch through a memory map.
+
+    Parameters
+    ----------
+    path : str
+        The path of the stored file.
+
+    storage_format : str
+        Either 'parquet' or 'feather'.
+
+    chunksize : int
+        The maximum number of rows in each yielded frame.
+
+    columns : list of str or None, optional
+        The columns to read. By default, None reads every column.
+
+    filters : list of list of tuple or None, optional
+        Row filters in disjunctive normal form, see `filters.normalize_filters`.
+
+    Yields
+    ------
+    pd.DataFrame
+        The matching rows of each batch, which may be empty.
+
+    Examples
+    --------
+    >>> for chunk in iter_stored('pbp_2025.feather', 'feather', 10_000):
+    ...     print(len(chunk))
+    """
+    pa = import_pyarrow()
+    if storage_format == 'feather':
+        import pyarrow.ipc
+        reader = pyarrow.ipc.open_file(pa.memory_map(path))
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    else:
+        import pyarrow.parquet
+        read_columns = None if columns is None else list(dict.fromkeys([*columns, *filter_columns(filters)]))
+        batches = pyarrow.parquet.ParquetFile(path, memory_map=True).iter_batches(batch_size=chunksize, columns=read_columns)
+    for batch in batches:
+        table = pa.Table.from_batches([batch])
+        if filters is not None:
+            table = table.filter(to_expression(filters))
+        if columns is not None:
+            table = table.select([column for column in columns if column in table.column_names])
+        for small_batch in table.to_batches(max_chunksize=chunksize):
+            yield _to_pandas(small_batch)
+
+
+def write_frame(df, path, storage_format, digests=None):
+    """
+    Writes a DataFrame to a typed columnar file, see `convert_csv`.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The frame to write.
+
+    path : str
+        The path to write the file to.
+
+    storage_format : str
+        Either 'parquet' or 'feather'.
+
+    digests : dict or None, optional
+        Match digests to keep in the metadata of the file, see `scan_matches` and
+        `read_digests`.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> write_frame(pbp, 'pbp_2025.feather', 'feather')
+    """
+    pa = import_pyarrow()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if digests is not None:
+        table = table.replace_schema_metadata({**table.schema.metadata, METADATA_KEY: json.dumps(digests)})
+    if storage_format == 'feather':
+        import pyarrow.feather
+        pyarrow.feather.write_feather(table, path, compression='uncompressed')
+    else:
+        import pyarrow.parquet
+        pyarrow.parquet.write_table(table, path)
+
+
+def _to_pandas(table, **kwargs):
+    # Text columns are converted to python-backed strings unless mapped, while the CSV
+    # path returns them as 'string[pyarrow]', see schemas.read_csv
+    pa = import_pyarrow()
+    string_dtype = pd.StringDtype('pyarrow')
+    types_mapper = {pa.string(): string_dtype, pa.large_string(): string_dtype}.get
+    return table.to_pandas(split_blocks=True, types_mapper=types_mapper, **kwargs)
+
+
+def _digest(content):
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
@@ -0,0 +1,143 @@
+import hashlib
+import json
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pyvolleydata import config, helpers, manifest, memo, session
+
+
+MANIFEST_PATH = '/releases'
+
+
+class VolleyServer:
+    """A local stand-in for the volleydata GitHub releases and their manifest."""
+
+    def __init__(self):
+        self.files = {}
+        self.requests = []
+        self.manifest_requests = []
+        self.manifest_authorizations = []
+        self.connections = 0
+        self.delay = 0
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True
+        )
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def add(self, path, content, modified=1_700_000_000, status=200):
+        self.files[path] = self._file(content, modified)
+        self.files[path]['status'] = status
+
+    def add_csv(self, league, data_type, df, season=None, status=200):
+        path = helpers.build_url(league, data_type, season)[len(helpers.BASE_URL):]
+        self.add(path, df.to_csv(index=False), status=status)
+
+    def manifest(self):
+        releases = {}
+        for path in sorted(self.files):
+            release, name = path.strip('/').split('/', 1)
+            releases.setdefault(release, []).append({'name': name, 'browser_download_url': self.url + path})
+        return self._file(json.dumps([{'tag_name': tag, 'assets': assets} for tag, assets in releases.items()]))
+
+    @staticmethod
+    def _file(content, modified=1_700_000_000):
+        if isinstance(content, str):
+            content = content.encode()
+        return {
+            'content': content,
+            'etag': f'"{hashlib.md5(content).hexdigest()}"',
+            'last_modified': formatdate(modified, usegmt=True),
+            'status': 200,
+        }
+
+    def statuses(self, path=None):
+        return [status for p, status in self.requests if path is None or p == path]
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                server.connections += 1
+                super().setup()
+
+            def do_GET(self):
+                is_manifest = self.path == MANIFEST_PATH
+                if is_manifest:
+                    server.manifest_authorizations.append(self.headers.get('Authorization'))
+                else:
+                    time.sleep(server.delay)
+                file = server.manifest() if is_manifest else server.files.get(self.path)
+                if file is None:
+                    status = 404
+                elif file['status'] != 200:
+                    status = file['status']
+                elif 'If-None-Match' in self.headers:
+                    status = 304 if self.headers['If-None-Match'] == file['etag'] else 200
+                elif self.headers.get('If-Modified-Since') == file['last_modified']:
+                    status = 304
+                else:
+                    status = 200
+                (server.manifest_requests if is_manifest else server.requests).append((self.path, status))
+                self.send_response(status)
+                if file is not None:
+                    self.send_header('ETag', file['etag'])
+                    self.send_header('Last-Modified', file['last_modified'])
+                body = file['content'] if status == 200 else b''
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def volley_server(monkeypatch):
+    server = VolleyServer()
+    server.start()
+    monkeypatch.setattr(helpers, 'BASE_URL', server.url)
+    monkeypatch.setattr(manifest, 'MANIFEST_URL', server.url + MANIFEST_PATH)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    config.set_option('cache_dir', str(tmp_path / 'cache'))
+    yield tmp_path / 'cache'
+    config.reset_option('cache_dir')
+    config.reset_option('cache_max_bytes')
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(monkeypatch):
+    # Most tests check what is fetched and parsed, which repeat loads would skip. Tests
+    # without a server never reach the real manifest and fall back to the calendar.
+    config.set_option('memo_max_bytes', 0)
+    monkeypatch.setattr(manifest, 'MANIFEST_URL', 'http://127.0.0.1:9' + MANIFEST_PATH)
+    yield
+    for name in ['memo_max_bytes', 'memo_ttl', 'manifest_ttl', 'engine', 'processes']:
+        config.reset_option(name)
+    memo.clear()
+    manifest.clear()
+    session.close()
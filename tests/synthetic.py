@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+from pyvolleydata import schemas
+
+
+def make_frame(data_type, season, n_rows=3, n_matches=1, seed=0):
+    """Builds a synthetic release file for a dataset, following its registered schema."""
+    rng = np.random.default_rng(seed)
+    match_ids = season * 1000 + np.arange(n_rows) * n_matches // n_rows
+    columns = {}
+    for column, dtype in schemas.get_schema(data_type).items():
+        if column == 'season':
+            values = np.full(n_rows, season)
+        elif column == 'match_id':
+            values = match_ids
+        elif column in {'set', 'set_number'}:
+            values = rng.integers(1, 6, n_rows)
+        elif dtype == schemas.ID:
+            values = rng.integers(1, 1_000_000, n_rows)
+        elif dtype in {schemas.SMALL, schemas.COUNT, 'Int32'}:
+            values = rng.integers(0, 26, n_rows)
+        elif dtype == schemas.RATIO:
+            values = rng.random(n_rows).round(3)
+        elif dtype == schemas.FLAG:
+            values = rng.random(n_rows) < 0.5
+        elif dtype == schemas.LABEL:
+            values = rng.choice([f'{column}_{i}' for i in range(4)], n_rows)
+        else:
+            values = [f'{column} {i}' for i in rng.integers(0, 10_000, n_rows)]
+        columns[column] = values
+    return pd.DataFrame(columns)
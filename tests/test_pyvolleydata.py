@@ -1 +1,876 @@
-from pyvolleydata import pyvolleydata
+import asyncio
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import urllib.error
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyvolleydata import aio, cache, config, get_data, manifest, memo, players, processes, rollups, schemas, session, stats
+from conftest import MANIFEST_PATH
+from synthetic import make_frame
+
+
+CURRENT_YEAR = datetime.now().year
+
+
+def make_pbp(season, n_rows=3):
+    return make_frame('pbp', season, n_rows)
+
+
+def make_schedule(seasons):
+    return pd.concat([make_frame('schedule', season, 1, seed=i) for i, season in enumerate(seasons)], ignore_index=True)
+
+
+def test_cache_revalidates_current_season(volley_server, cache_dir):
+    volley_server.add_csv('mlv', 'pbp', make_pbp(CURRENT_YEAR), CURRENT_YEAR)
+    first = get_data.load_pbp('mlv', CURRENT_YEAR)
+    second = get_data.load_pbp('mlv', CURRENT_YEAR)
+    pd.testing.assert_frame_equal(first, second)
+    assert volley_server.statuses() == [200, 304]
+
+
+def test_cache_redownloads_changed_file(volley_server, cache_dir):
+    volley_server.add_csv('mlv', 'pbp', make_pbp(CURRENT_YEAR, 2), CURRENT_YEAR)
+    assert len(get_data.load_pbp('mlv', CURRENT_YEAR)) == 2
+    volley_server.add_csv('mlv', 'pbp', make_pbp(CURRENT_YEAR, 5), CURRENT_YEAR)
+    assert len(get_data.load_pbp('mlv', CURRENT_YEAR)) == 5
+    assert volley_server.statuses() == [200, 200]
+
+
+def test_cache_keeps_completed_seasons(volley_server, cache_dir):
+    volley_server.add_csv('mlv', 'pbp', make_pbp(2024), 2024)
+    get_data.load_pbp('mlv', 2024)
+    get_data.load_pbp('mlv', 2024)
+    assert volley_server.statuses() == [200]
+
+
+def test_cache_serves_stale_copy_when_offline(volley_server, cache_dir, monkeypatch):
+    volley_server.add_csv('au', 'schedule', make_schedule([2022, 2023]))
+    expected = get_data.load_schedule('au', 2023)
+    monkeypatch.setattr(get_data.h, 'BASE_URL', 'http://127.0.0.1:9')
+    pd.testing.assert_frame_equal(get_data.load_schedule('au', 2023), expected)
+
+
+def test_cache_serves_stale_copy_on_server_errors(volley_server, cache_dir):
+    volley_server.add_csv('mlv', 'pbp', make_pbp(CURRENT_YEAR), CURRENT_YEAR)
+    expected = get_data.load_pbp('mlv', CURRENT_YEAR)
+    get_data.clear_cache()
+    volley_server.add_csv('mlv', 'pbp', make_pbp(CURRENT_YEAR), CURRENT_YEAR, status=503)
+    pd.testing.assert_frame_equal(get_data.load_pbp('mlv', CURRENT_YEAR), expected)
+    volley_server.add_csv('mlv', 'pbp', make_pbp(CURRENT_YEAR), CURRENT_YEAR, status=404)
+    get_data.clear_cache()
+    with pytest.raises(urllib.error.HTTPError, match='404'):
+        get_data.load_pbp('mlv', CURRENT_YEAR)
+    assert volley_server.statuses() == [200, 503, 404]
+
+
+def test_cache_evicts_least_recently_used(volley_server, cache_dir):
+    for league in ['mlv', 'lovb', 'au']:
+        volley_server.add_csv(league, 'schedule', make_schedule([2025] * 50))
+    get_data.load_schedule('mlv')
+    size = cache.cache_size()
+    config.set_option('cache_max_bytes', 2 * size)
+    get_data.load_schedule('lovb')
+    get_data.load_schedule('mlv')
+    get_data.load_schedule('au')
+    assert cache.cache_size() <= 2 * size
+    assert os.path.exists(cache_dir / 'mlv' / 'schedule' / 'csv-seasons' / '2025.csv')
+    assert os.path.exists(cache_dir / 'au' / 'schedule' / 'csv-seasons' / '2025.csv')
+    assert not os.path.exists(cache_dir / 'lovb' / 'schedule' / 'csv-seasons')
+
+
+def test_cache_never_evicts_completed_seasons(volley_server, cache_dir):
+    volley_server.add_csv('mlv', 'pbp', make_pbp(2024, 50), 2024)
+    volley_server.add_csv('mlv', 'schedule', make_schedule([2024] * 50))
+    config.set_option('cache_max_bytes', 1)
+    get_data.load_pbp('mlv', 2024)
+    get_data.load_schedule('mlv')
+    assert os.path.exists(cache_dir / 'mlv' / 'pbp' / '2024.csv')
+
+
+def test_clear_cache_only_deletes_cached_files(volley_server, cache_dir):
+    volley_server.add_csv('mlv', 'pbp', make_pbp(2024), 2024)
+    (cache_dir / 'mlv').mkdir(parents=True)
+    (cache_dir / 'mlv' / 'notes.txt').write_text('kept')
+    (cache_dir / 'other-tool').mkdir()
+    get_data.load_pbp('mlv', 2024)
+    get_data.clear_cache(disk=True)
+    assert sorted(os.listdir(cache_dir)) == ['mlv', 'other-tool']
+    assert os.listdir(cache_dir / 'mlv') == ['notes.txt']
+    assert cache.cache_size() == 0
+
+
+def test_seasons_download_in_parallel_and_in_order(volley_server):
+    for season in range(2022, 2026):
+        volley_server.add_csv('au', 'events_log', make_frame('events_log', season), season)
+    volley_server.delay = 0.3
+    start = time.perf_counter()
+    df = get_data.load_events_log('au', [2025, 2022, 2024, 2023])
+    assert time.perf_counter() - start < 0.9
+    assert df['season'].drop_duplicates().tolist() == [2025, 2022, 2024, 2023]
+
+
+def test_failed_seasons_are_reported(volley_server):
+    volley_server.add_csv('au', 'pbp', make_pbp(2022), 2022)
+    volley_server.add_csv('au', 'pbp', make_pbp(2023), 2023, status=404)
+    volley_server.add_csv('au', 'pbp', make_pbp(2024), 2024)
+    with pytest.warns(UserWarning, match=r'season\(s\): 2023 \(HTTP Error 404'):
+        df = get_data.load_pbp('au', [2022, 2023, 2024])
+    assert df['season'].unique().tolist() == [2022, 2024]
+
+
+def test_all_seasons_failing_raises(volley_server):
+    for season in [2022, 2023]:
+        volley_server.add_csv('au', 'pbp', make_pbp(season), season, status=404)
+    with pytest.raises(urllib.error.HTTPError):
+        get_data.load_pbp('au', [2022, 2023])
+
+
+def test_many_seasons_assemble_in_one_pass(tmp_path, monkeypatch):
+    n_seasons = 40
+    seasons = list(range(2026 - n_seasons, 2026))
+    for season in seasons:
+        path = tmp_path / get_data.h.build_url('au', 'pbp', season)[len(get_data.h.BASE_URL) + 1:]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        make_pbp(season, 1_000).to_csv(path, index=False)
+    monkeypatch.setattr(get_data.h, 'BASE_URL', tmp_path.as_uri())
+    monkeypatch.setitem(get_data.h.LEAGUE_CONFIG, 'au', {'start_year': seasons[0], 'internal_name': 'aupvb'})
+    monkeypatch.setitem(config._options, 'max_workers', 1)
+
+    def traced_load(seasons):
+        tracemalloc.start()
+        df = get_data.load_pbp('au', seasons)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return df, peak
+
+    _, single_peak = traced_load(seasons[:1])
+    concat_calls = []
+    concat = pd.concat
+    monkeypatch.setattr(pd, 'concat', lambda *args, **kwargs: concat_calls.append(1) or concat(*args, **kwargs))
+    df, peak = traced_load(seasons)
+
+    assert len(concat_calls) == 1
+    assert len(df) == n_seasons * 1_000
+    assert isinstance(df.index, pd.RangeIndex) and df.index.is_unique
+    assert peak < 4 * df.memory_usage(deep=True).sum() + single_peak
+
+
+@pytest.mark.parametrize('storage_format', ['parquet', 'feather'])
+def test_columnar_storage_matches_csv(volley_server, cache_dir, storage_format):
+    pytest.importorskip('pyarrow')
+    volley_server.add_csv('mlv', 'pbp', make_pbp(2024), 2024)
+    volley_server.add_csv('mlv', 'schedule', make_schedule([2024, 2025]))
+    # Datasets with text columns (e.g., event_time, player_name) keep them as 'string[pyarrow]'
+    volley_server.add_csv('mlv', 'events_log', make_frame('events_log', 2024), 2024)
+    volley_server.add_csv('mlv', 'player_boxscore', make_frame('player_boxscore', 2024))
+    expected_pbp = get_data.load_pbp('mlv', 2024)
+    expected_schedule = get_data.load_schedule('mlv', 2024)
+    expected_events = get_data.load_events_log('mlv', 2024)
+    expected_boxscore = get_data.load_player_boxscore('mlv', 2024)
+
+    config.set_option('storage_format', storage_format)
+    try:
+        for _ in range(2):
+            pd.testing.assert_frame_equal(get_data.load_pbp('mlv', 2024), expected_pbp)
+            pd.testing.assert_frame_equal(get_data.load_schedule('mlv', 2024), expected_schedule)
+            pd.testing.assert_frame_equal(get_data.load_events_log('mlv', 2024), expected_events)
+            pd.testing.assert_frame_equal(get_data.load_player_boxscore('mlv', 2024), expected_boxscore)
+        pd.testing.assert_frame_equal(
+            get_data.load_pbp('mlv', 2024, columns=['action', 'set'], filters=[('set', '<=', 2)]),
+            expected_pbp.loc[expected_pbp['set'] <= 2, ['action', 'set']].reset_index(drop=True)
+        )
+        team = expected_boxscore['team_name'].iloc[0]
+        pd.testing.assert_frame_equal(
+            get_data.load_player_boxscore('mlv', 2024, columns=['player_name'], filters=[('team_name', '==', team)]),
+            expected_boxscore.loc[expected_boxscore['team_name'] == team, ['player_name']].reset_index(drop=True)
+        )
+    finally:
+        config.reset_option('storage_format')
+    assert os.path.exists(cache_dir / 'mlv' / 'pbp' / f'2024.{storage_format}')
+    schedule_path = get_data.h.build_url('mlv', 'schedule')[len(get_data.h.BASE_URL):]
+    assert volley_server.statuses(schedule_path) == [200, 200, 304]
+
+
+def test_schema_dtypes_survive_multi_season_loads(volley_server):
+    volley_server.add_csv('mlv', 'pbp', make_frame('pbp', 2024, 200, seed=1), 2024)
+    volley_server.add_csv('mlv', 'pbp', make_frame('pbp', 2025, 200, seed=2).assign(action='block'), 2025)
+    df = get_data.load_pbp('mlv', [2024, 2025])
+    expected = {**schemas.get_schema('pbp'), 'league': 'category'}
+    assert {column: str(dtype) for column, dtype in df.dtypes.items()} == expected
+    assert 'block' in df['action'].cat.categories
+
+    plain = pd.concat([make_frame('pbp', 2024, 200, seed=1), make_frame('pbp', 2025, 200, seed=2)])
+    assert df.memory_usage(deep=True).sum() * 3 < plain.memory_usage(deep=True).sum()
+
+
+def test_schema_validation_reports_drift():
+    df = make_frame('schedule', 2025, 5).drop(columns='phase').assign(venue='Arena')
+    df['home_team_set_wins'] = 300
+    with pytest.warns(UserWarning) as record:
+        parsed = schemas.read_csv(io.StringIO(df.to_csv(index=False)), 'schedule')
+    messages = [str(warning.message) for warning in record]
+    assert 'schedule columns kept their inferred dtype: home_team_set_wins' in messages
+    assert 'schedule file is missing columns: phase' in messages
+    assert 'schedule file has unregistered columns: venue' in messages
+    assert parsed['home_team_set_wins'].tolist() == [300] * 5
+    assert parsed['home_team'].dtype == 'category'
+
+
+def test_columns_and_filters_are_pushed_into_parsing(volley_server, monkeypatch):
+    monkeypatch.setitem(config._options, 'chunksize', 50)
+    pbp = make_frame('pbp', 2024, 500, n_matches=10)
+    boxscore = make_frame('player_boxscore', 2024, 200, n_matches=10)
+    volley_server.add_csv('mlv', 'pbp', pbp, 2024)
+    volley_server.add_csv('mlv', 'player_boxscore', boxscore)
+
+    df = get_data.load_pbp('mlv', 2024, columns=['action', 'match_id'], filters=[('set', '==', 5), ('match_id', 'in', [2024001, 2024002])])
+    expected = pbp[(pbp['set'] == 5) & pbp['match_id'].isin([2024001, 2024002])]
+    assert df.columns.tolist() == ['action', 'match_id']
+    assert df['match_id'].tolist() == expected['match_id'].tolist()
+    assert isinstance(df.index, pd.RangeIndex)
+
+    team = boxscore['team_name'].iloc[0]
+    df = get_data.load_player_boxscore('mlv', 2024, columns=['player_name', 'league'], filters=[[('team_name', '==', team)], [('set_number', '>', 4)]])
+    expected = boxscore[(boxscore['team_name'] == team) | (boxscore['set_number'] > 4)]
+    assert df.columns.tolist() == ['player_name', 'league']
+    assert df['player_name'].tolist() == expected['player_name'].tolist()
+
+    df = get_data.load_player_boxscore('mlv', 2024, columns=['team_name'], filters=[('team_name', '>=', team)])
+    assert df['team_name'].tolist() == boxscore.loc[boxscore['team_name'] >= team, 'team_name'].tolist()
+
+
+def test_columns_and_filters_are_validated():
+    with pytest.raises(ValueError, match='Unknown pbp column'):
+        get_data.load_pbp('mlv', 2024, columns=['goals'])
+    with pytest.raises(ValueError, match='Unknown pbp column'):
+        get_data.load_pbp('mlv', 2024, filters=[('goals', '==', 1)])
+    with pytest.raises(ValueError, match='Unknown filter operator'):
+        get_data.load_pbp('mlv', 2024, filters=[('set', '~', 1)])
+    with pytest.raises(TypeError):
+        get_data.load_pbp('mlv', 2024, columns='match_id')
+
+
+def test_iter_groups_rows_by_chunk_match_and_season(volley_server):
+    volley_server.add_csv('mlv', 'pbp', make_frame('pbp', 2024, 300, n_matches=7), 2024)
+    volley_server.add_csv('mlv', 'pbp', make_frame('pbp', 2025, 200, n_matches=4), 2025)
+    volley_server.add_csv('mlv', 'schedule', make_schedule([2024, 2024, 2025, 2026]))
+    expected = get_data.load_pbp('mlv', [2024, 2025])
+
+    chunks = list(get_data.iter_pbp('mlv', [2024, 2025], chunksize=64))
+    assert max(len(chunk) for chunk in chunks) <= 64
+    pd.testing.assert_frame_equal(get_data.h.concat_frames(chunks), expected, check_categorical=False)
+
+    matches = list(get_data.iter_pbp('mlv', [2024, 2025], by='match', chunksize=64, columns=['action']))
+    assert len(matches) == 11
+    assert [len(match) for match in matches] == expected.groupby('match_id', sort=False).size().tolist()
+    assert all(match.columns.tolist() == ['action'] for match in matches)
+
+    seasons = list(get_data.iter_schedule('mlv', [2024, 2025], by='season', chunksize=1))
+    assert [season['season'].tolist() for season in seasons] == [[2024, 2024], [2025]]
+
+
+def test_iter_memory_is_bounded_by_chunk_size(tmp_path, monkeypatch):
+    path = tmp_path / get_data.h.build_url('au', 'events_log', 2024)[len(get_data.h.BASE_URL) + 1:]
+    path.parent.mkdir(parents=True)
+    make_frame('events_log', 2024, 8_000, n_matches=40).to_csv(path, index=False)
+    monkeypatch.setattr(get_data.h, 'BASE_URL', tmp_path.as_uri())
+
+    tracemalloc.start()
+    n_rows = sum(len(chunk) for chunk in get_data.iter_events_log('au', 2024, chunksize=1_000))
+    _, iter_peak = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    df = get_data.load_events_log('au', 2024)
+    _, load_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert n_rows == len(df) == 8_000
+    assert iter_peak * 4 < load_peak
+
+
+def test_iter_reads_columnar_storage(volley_server, cache_dir, monkeypatch):
+    pytest.importorskip('pyarrow')
+    monkeypatch.setitem(config._options, 'storage_format', 'feather')
+    volley_server.add_csv('mlv', 'events_log', make_frame('events_log', 2024, 300, n_matches=5), 2024)
+    expected = get_data.load_events_log('mlv', 2024, filters=[('set', '>', 2)])
+    matches = list(get_data.iter_events_log('mlv', 2024, by='match', chunksize=32, filters=[('set', '>', 2)]))
+    assert len(matches) == 5
+    pd.testing.assert_frame_equal(get_data.h.concat_frames(matches), expected)
+
+
+def test_single_file_datasets_filter_seasons_while_parsing(volley_server, monkeypatch):
+    monkeypatch.setitem(config._options, 'chunksize', 10)
+    boxscore = pd.concat([make_frame('player_boxscore', season, 40, seed=season) for season in [2024, 2025]], ignore_index=True)
+    volley_server.add_csv('mlv', 'player_boxscore', boxscore)
+    parsed_rows = []
+    iter_csv = schemas.iter_csv
+    monkeypatch.setattr(schemas, 'iter_csv', lambda *args, **kwargs: (parsed_rows.append(len(chunk)) or chunk for chunk in iter_csv(*args, **kwargs)))
+
+    df = get_data.load_player_boxscore('mlv', 2025, columns=['season', 'player_name'])
+    assert df['season'].unique().tolist() == [2025]
+    assert df['player_name'].tolist() == boxscore.loc[boxscore['season'] == 2025, 'player_name'].tolist()
+    assert max(parsed_rows) == 10
+
+
+def test_cache_stores_single_file_datasets_as_season_partitions(volley_server, cache_dir, monkeypatch):
+    volley_server.add_csv('mlv', 'schedule', make_schedule([2024, 2024, 2024]))
+    get_data.load_schedule('mlv', 2024)
+    partitions = cache_dir / 'mlv' / 'schedule' / 'csv-seasons'
+    assert sorted(os.listdir(partitions)) == ['2024.csv']
+
+    read_sources = []
+    read_csv = schemas.read_csv
+    monkeypatch.setattr(schemas, 'read_csv', lambda source, *args, **kwargs: read_sources.append(source) or read_csv(source, *args, **kwargs))
+    assert len(get_data.load_schedule('mlv', 2024)) == 3
+    assert read_sources == [str(partitions / '2024.csv')]
+    assert len(get_data.load_schedule('mlv', CURRENT_YEAR)) == 0
+
+    volley_server.add_csv('mlv', 'schedule', make_schedule([2024, 2024, CURRENT_YEAR]))
+    assert len(get_data.load_schedule('mlv', CURRENT_YEAR)) == 1
+    assert sorted(os.listdir(partitions)) == ['2024.csv', f'{CURRENT_YEAR}.csv']
+
+
+@pytest.mark.parametrize('cached', [False, True])
+def test_async_loaders_match_sync(volley_server, tmp_path, cached):
+    for season in [2024, 2025]:
+        volley_server.add_csv('mlv', 'pbp', make_pbp(season), season)
+    volley_server.add_csv('mlv', 'schedule', make_schedule([2024, 2025]))
+    if cached:
+        config.set_option('cache_dir', str(tmp_path / 'cache'))
+
+    async def load():
+        return await asyncio.gather(
+            aio.load_pbp('mlv', [2024, 2025]),
+            aio.load_schedule('mlv', 2025, columns=['match_id', 'league']),
+        )
+
+    try:
+        pbp, schedule = asyncio.run(load())
+        pd.testing.assert_frame_equal(pbp, get_data.load_pbp('mlv', [2024, 2025]))
+        pd.testing.assert_frame_equal(schedule, get_data.load_schedule('mlv', 2025, columns=['match_id', 'league']))
+    finally:
+        config.reset_option('cache_dir')
+
+
+def test_async_loaders_download_seasons_concurrently(volley_server, cache_dir):
+    seasons = [2022, 2023, 2024, 2025]
+    for season in seasons:
+        volley_server.add_csv('au', 'events_log', make_frame('events_log', season), season)
+    volley_server.delay = 0.3
+
+    start = time.perf_counter()
+    df = asyncio.run(aio.load_events_log('au', seasons))
+    assert time.perf_counter() - start < 0.3 * len(seasons) - 0.3
+    assert df['season'].unique().tolist() == seasons
+    asyncio.run(aio.load_events_log('au', seasons))
+    assert volley_server.statuses().count(200) == len(seasons)
+
+
+def test_async_loaders_reuse_connections(volley_server):
+    seasons = [2022, 2023, 2024, 2025]
+    for season in seasons:
+        volley_server.add_csv('au', 'events_log', make_frame('events_log', season), season)
+    for _ in range(3):
+        asyncio.run(aio.load_events_log('au', seasons))
+    assert volley_server.statuses().count(200) == 3 * len(seasons)
+    assert volley_server.connections <= len(seasons)
+    assert session.idle_connections() == volley_server.connections
+
+
+def test_async_loaders_do_not_block_the_event_loop(volley_server):
+    volley_server.add_csv('au', 'pbp', make_pbp(2024, 2000), 2024)
+    volley_server.delay = 0.3
+
+    async def load():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        df = await aio.load_pbp('au', 2024)
+        ticker.cancel()
+        return df, ticks
+
+    df, ticks = asyncio.run(load())
+    assert len(df) == 2000
+    assert ticks >= 10
+
+
+def test_async_loads_are_memoized(volley_server):
+    volley_server.add_csv('mlv', 'player_info', make_frame('player_info', 2025, 5))
+    config.set_option('memo_max_bytes', 10 * 1024 ** 2)
+    first = asyncio.run(aio.load_player_info('mlv', 2025))
+    with get_data.record_stats() as recorder:
+        second = asyncio.run(aio.load_player_info('mlv', 2025))
+    pd.testing.assert_frame_equal(first, second)
+    assert len(volley_server.requests) == 1
+    assert get_data.cache_info()['hits'] == get_data.cache_info()['misses'] == 1
+    load = recorder.report().query("stage == 'load'")
+    assert load['cache'].tolist() == ['hit'] and load['rows'].tolist() == [5]
+    pd.testing.assert_frame_equal(get_data.load_player_info('mlv', 2025), first)
+    assert len(volley_server.requests) == 1
+
+
+def test_async_loaders_report_failed_seasons(volley_server):
+    volley_server.add_csv('mlv', 'pbp', make_pbp(2024), 2024)
+    volley_server.add_csv('mlv', 'pbp', make_pbp(2025), 2025, status=404)
+    with pytest.warns(UserWarning, match=r'2025 \(HTTP Error 404'):
+        df = asyncio.run(aio.load_pbp('mlv', [2024, 2025]))
+    assert len(df) == 3
+    with pytest.raises(urllib.error.HTTPError):
+        asyncio.run(aio.load_pbp('mlv', 2025))
+
+
+def test_load_many_fetches_each_file_once(volley_server):
+    volley_server.add_csv('mlv', 'pbp', make_pbp(2024), 2024)
+    volley_server.add_csv('mlv', 'pbp', make_pbp(2025), 2025)
+    volley_server.add_csv('lovb', 'pbp', make_frame('pbp', 2025, seed=1), 2025)
+    volley_server.add_csv('mlv', 'schedule', make_schedule([2024, 2025]))
+    volley_server.add_csv('lovb', 'schedule', make_schedule([2025]))
+
+    data = get_data.load_many(['mlv', 'lovb'], ['pbp', 'schedule'], [2024, 2025])
+    assert all(statuses == [200] for statuses in map(volley_server.statuses, {p for p, _ in volley_server.requests}))
+    assert len(volley_server.requests) == 5
+    pd.testing.assert_frame_equal(data['mlv']['pbp'], get_data.load_pbp('mlv', [2024, 2025]))
+    pd.testing.assert_frame_equal(data['lovb']['schedule'], get_data.load_schedule('lovb', 2025))
+
+    combined = get_data.load_many(['mlv', 'lovb'], 'pbp', 2025, concat=True)['pbp']
+    assert list(combined['league']) == ['mlv'] * 3 + ['lovb'] * 3
+    assert isinstance(combined['league'].dtype, pd.CategoricalDtype)
+    assert isinstance(combined['action'].dtype, pd.CategoricalDtype)
+
+
+def test_load_many_reports_failed_seasons(volley_server):
+    volley_server.add_csv('mlv', 'pbp', make_pbp(2024), 2024)
+    volley_server.add_csv('mlv', 'pbp', make_pbp(2025), 2025, status=404)
+    with pytest.warns(UserWarning, match=r'mlv pbp for season\(s\): 2025'):
+        data = get_data.load_many('mlv', 'pbp', [2024, 2025])
+    assert len(data['mlv']['pbp']) == 3
+    with pytest.raises(ValueError):
+        get_data.load_many('mlv', 'goals')
+
+
+def test_repeat_loads_are_memoized(volley_server, monkeypatch):
+    volley_server.add_csv('mlv', 'player_info', make_frame('player_info', 2025, 5))
+    config.set_option('memo_max_bytes', 10 * 1024 ** 2)
+    first = get_data.load_player_info('mlv', 2025)
+    first['jersey_number'] = 0
+    second = get_data.load_player_info('mlv', 2025)
+    third = get_data.load_player_info('mlv', 2025)
+    second.loc[0, 'player_name'] = 'changed'
+    assert len(volley_server.requests) == 1
+    assert (third['jersey_number'] != 0).any()
+    assert third.loc[0, 'player_name'] != 'changed'
+    assert get_data.cache_info()['hits'] == 2
+    assert get_data.cache_info()['misses'] == 1
+
+    get_data.load_player_info('mlv', 2025, columns=['player_id'])
+    assert len(volley_server.requests) == 2
+    config.set_option('memo_ttl', 0)
+    get_data.load_player_info('mlv', 2025)
+    assert len(volley_server.requests) == 3
+    get_data.clear_cache()
+    assert get_data.cache_info() == {'hits': 0, 'misses': 0, 'entries': 0, 'bytes': 0}
+
+
+def test_memo_evicts_least_recently_used(volley_server):
+    for league in ['mlv', 'lovb', 'au']:
+        volley_server.add_csv(league, 'schedule', make_schedule([2025] * 20))
+    config.set_option('memo_max_bytes', 10 * 1024 ** 2)
+    frame_bytes = get_data.load_schedule('mlv', 2025).memory_usage(deep=True).sum()
+    # Hits are deep copies without copy-on-write, which the budget accounts for
+    size = get_data.cache_info()['bytes']
+    assert size == (frame_bytes if memo._copy_on_write() else 2 * frame_bytes)
+    config.set_option('memo_max_bytes', int(2.5 * size))
+    get_data.load_schedule('lovb', 2025)
+    get_data.load_schedule('mlv', 2025)
+    get_data.load_schedule('au', 2025)
+    assert get_data.cache_info()['entries'] == 2
+    assert get_data.cache_info()['bytes'] <= 2.5 * size
+    requests = len(volley_server.requests)
+    get_data.load_schedule('mlv', 2025)
+    get_data.load_schedule('au', 2025)
+    assert len(volley_server.requests) == requests
+    get_data.load_schedule('lovb', 2025)
+    assert len(volley_server.requests) == requests + 1
+
+
+def test_manifest_decides_which_seasons_exist(volley_server, cache_dir):
+    volley_server.add_csv('au', 'pbp', make_pbp(2022), 2022)
+    volley_server.add_csv('au', 'pbp', make_pbp(2024), 2024)
+    df = get_data.load_pbp('au')
+    assert df['season'].unique().tolist() == [2022, 2024]
+    assert volley_server.statuses() == [200, 200]
+
+    with pytest.raises(ValueError, match=r'season\(s\) 2023 \(available: 2022, 2024\)'):
+        get_data.load_pbp('au', [2022, 2023])
+    assert len(volley_server.requests) == 2
+    assert volley_server.statuses(MANIFEST_PATH) == []
+    assert [status for _, status in volley_server.manifest_requests] == [200]
+
+    config.set_option('manifest_ttl', 0)
+    get_data.load_pbp('au', 2024)
+    assert [status for _, status in volley_server.manifest_requests] == [200, 304]
+    volley_server.add_csv('au', 'pbp', make_pbp(2023), 2023)
+    assert get_data.load_pbp('au')['season'].unique().tolist() == [2022, 2023, 2024]
+
+
+@pytest.mark.parametrize('cached', [False, True])
+def test_manifest_requests_send_the_github_token(volley_server, monkeypatch, request, cached):
+    if cached:
+        request.getfixturevalue('cache_dir')
+    monkeypatch.setenv('GITHUB_TOKEN', 'secret')
+    volley_server.add_csv('au', 'pbp', make_pbp(2022), 2022)
+    assert get_data.load_pbp('au')['season'].unique().tolist() == [2022]
+    assert volley_server.manifest_authorizations == ['Bearer secret']
+
+
+def test_seasons_fall_back_to_the_calendar_without_a_manifest(volley_server, monkeypatch):
+    monkeypatch.setattr(manifest, 'MANIFEST_URL', 'http://127.0.0.1:9/releases')
+    volley_server.add_csv('lovb', 'pbp', make_pbp(2025), 2025)
+    seasons = list(range(2025, CURRENT_YEAR + 1))
+    with pytest.warns(UserWarning) if len(seasons) > 1 else contextlib.nullcontext():
+        df = get_data.load_pbp('lovb')
+    assert df['season'].unique().tolist() == [2025]
+    assert len(volley_server.requests) == len(seasons)
+
+
+def test_seasons_in_progress_refresh_only_changed_matches(volley_server, cache_dir, monkeypatch):
+    pytest.importorskip('pyarrow')
+    config.set_option('storage_format', 'feather')
+    pbp = make_frame('pbp', CURRENT_YEAR, 30, n_matches=3)
+    volley_server.add_csv('mlv', 'pbp', pbp, CURRENT_YEAR)
+    get_data.load_pbp('mlv', CURRENT_YEAR)
+
+    first_match = pbp['match_id'].iloc[0]
+    revised = pbp.copy()
+    revised.loc[revised['match_id'] == first_match, 'rally_length'] += 1
+    added = make_frame('pbp', CURRENT_YEAR, 10, seed=1).assign(match_id=first_match + 100)
+    updated = pd.concat([revised, added], ignore_index=True)
+    volley_server.add_csv('mlv', 'pbp', updated, CURRENT_YEAR)
+
+    parsed = []
+    read_csv = schemas.read_csv
+    monkeypatch.setattr(schemas, 'read_csv', lambda *args, **kwargs: parsed.append(read_csv(*args, **kwargs)) or parsed[-1])
+    try:
+        refreshed = get_data.load_pbp('mlv', CURRENT_YEAR)
+    finally:
+        config.reset_option('storage_format')
+    assert [len(df) for df in parsed] == [20]
+    expected = updated.astype(schemas.get_schema('pbp')).assign(league=pd.Categorical(['mlv'] * len(updated)))
+    pd.testing.assert_frame_equal(refreshed, expected)
+
+
+@pytest.mark.parametrize('storage_format', ['csv', 'parquet', 'feather'])
+def test_load_match_reads_only_the_match(volley_server, cache_dir, storage_format):
+    if storage_format != 'csv':
+        pytest.importorskip('pyarrow')
+    config.set_option('storage_format', storage_format)
+    for season in [2024, 2025]:
+        volley_server.add_csv('mlv', 'pbp', make_frame('pbp', season, 60, n_matches=4, seed=season), season)
+    volley_server.add_csv('mlv', 'events_log', make_frame('events_log', 2025, 20, n_matches=4), 2025)
+    match_id = 2025001
+    volley_server.add_csv('mlv', 'schedule', make_schedule([2024, 2025]).assign(match_id=[2024001, match_id]))
+    volley_server.add_csv('mlv', 'player_info', make_frame('player_info', 2024))
+    try:
+        match = get_data.load_match('mlv', match_id, ['pbp', 'events_log', 'schedule', 'player_info'])
+        requests = len(volley_server.requests)
+        assert get_data.load_match('mlv', match_id, 'pbp')['pbp'].equals(match['pbp'])
+        assert len(volley_server.requests) == requests
+        for data_type in ['pbp', 'events_log']:
+            loader = getattr(get_data, f'load_{data_type}')
+            expected = loader('mlv', filters=[('match_id', '==', match_id)])
+            assert len(expected) > 0
+            pd.testing.assert_frame_equal(match[data_type], expected, check_categorical=False)
+        assert match['schedule']['match_id'].tolist() == [match_id]
+        assert match['player_info'].empty
+    finally:
+        config.reset_option('storage_format')
+
+
+def test_database_answers_queries_offline_and_rebuilds_incrementally(volley_server, cache_dir, monkeypatch):
+    for season in [2024, CURRENT_YEAR]:
+        volley_server.add_csv('mlv', 'pbp', make_frame('pbp', season, 40, n_matches=4, seed=season), season)
+    volley_server.add_csv('mlv', 'schedule', make_schedule([2024, CURRENT_YEAR]))
+    assert get_data.build_database('mlv', ['pbp', 'schedule']) == 4
+
+    filters = [('set', '==', 5), ('match_id', 'in', [CURRENT_YEAR * 1000 + 1, CURRENT_YEAR * 1000 + 2])]
+    expected = get_data.load_pbp('mlv', CURRENT_YEAR, filters=filters)
+    base_url = get_data.h.BASE_URL
+    monkeypatch.setattr(get_data.h, 'BASE_URL', 'http://127.0.0.1:9')
+    assert get_data.build_database('mlv', ['pbp', 'schedule']) == 0
+    rows = get_data.query_table('pbp', 'mlv', CURRENT_YEAR, filters=filters)
+    pd.testing.assert_frame_equal(rows[expected.columns], expected, check_categorical=False)
+    numpy_filters = [('set', '==', np.int64(5)), ('match_id', 'in', np.array([CURRENT_YEAR * 1000 + 1, CURRENT_YEAR * 1000 + 2]))]
+    numpy_rows = get_data.query_table('pbp', 'mlv', CURRENT_YEAR, columns=['match_id', 'set'], filters=numpy_filters)
+    pd.testing.assert_frame_equal(numpy_rows, expected[['match_id', 'set']].reset_index(drop=True))
+    counts = get_data.query('SELECT season, COUNT(*) AS n FROM pbp WHERE league = ? GROUP BY season', ['mlv'])
+    assert counts['n'].tolist() == [40, 40]
+    plan = get_data.query('EXPLAIN QUERY PLAN SELECT * FROM pbp WHERE league = ? AND season = ? AND match_id = ?', ['mlv', 2024, 1])
+    assert plan['detail'].str.contains('USING INDEX').any()
+
+    monkeypatch.setattr(get_data.h, 'BASE_URL', base_url)
+    volley_server.add_csv('mlv', 'pbp', make_frame('pbp', CURRENT_YEAR, 50, n_matches=4), CURRENT_YEAR)
+    assert get_data.build_database('mlv', ['pbp', 'schedule']) == 1
+    assert get_data.query('SELECT COUNT(*) AS n FROM pbp WHERE season = ?', [CURRENT_YEAR])['n'].iloc[0] == 50
+
+
+def make_events_log(events):
+    records = []
+    for event in events:
+        record = dict.fromkeys(schemas.get_schema('events_log'), pd.NA)
+        record.update(match_id=2025001, season=2025, set=event.get('set', 1))
+        record.update({column: value for column, value in event.items() if column in record})
+        for side in ['home', 'away']:
+            for position, jersey in enumerate(event.get(side, []), 1):
+                record[f'{side}_team_p{position}'] = jersey
+        records.append(record)
+    return pd.DataFrame(records).astype(schemas.get_schema('events_log'))
+
+
+def test_build_rotations_follows_swaps_and_side_outs():
+    home, away = 'Home Team', 'Away Team'
+    def rally(winner, score, server=pd.NA):
+        return {'rally_point_winner': winner, 'serving_team': server, 'current_home_score': score[0], 'current_away_score': score[1]}
+    events_log = make_events_log([
+        {'home': [1, 2, 3, 4, 5, 6], 'away': [11, 12, 13, 14, 15, 16]},
+        rally(home, (1, 0), home),
+        rally(away, (1, 1), home),
+        {'team_involved': home, 'substitute_in_jersey_number': 7, 'substitute_out_jersey_number': 3},
+        {'team_involved': away, 'libero_enters': True, 'libero_jersey_number': 20, 'libero_subsitute_jersey_number': 11},
+        rally(home, (2, 1)),
+        rally(home, (3, 1)),
+        {'team_involved': away, 'libero_enters': False, 'libero_jersey_number': 20, 'libero_subsitute_jersey_number': 11},
+        rally(away, (3, 2), home),
+        {'set': 2, **rally(away, (0, 1), away)},
+    ])
+    rotations = get_data.build_rotations(events_log)
+    assert rotations[['set', 'point_number']].values.tolist() == [[1, 1], [1, 2], [1, 3], [1, 4], [1, 5], [2, 1]]
+    home_lineups = rotations[[f'home_team_p{position}' for position in range(1, 7)]].astype(object)
+    away_lineups = rotations[[f'away_team_p{position}' for position in range(1, 7)]].astype(object)
+    assert home_lineups.values.tolist()[:5] == [
+        [1, 2, 3, 4, 5, 6], [1, 2, 3, 4, 5, 6], [1, 2, 7, 4, 5, 6], [2, 7, 4, 5, 6, 1], [2, 7, 4, 5, 6, 1],
+    ]
+    assert away_lineups.values.tolist()[:5] == [
+        [11, 12, 13, 14, 15, 16], [11, 12, 13, 14, 15, 16], [12, 13, 14, 15, 16, 20], [12, 13, 14, 15, 16, 20], [12, 13, 14, 15, 16, 11],
+    ]
+    assert rotations.iloc[5, rotations.columns.get_loc('home_team_p1'):].isna().all()
+
+
+def test_load_pbp_with_players_joins_and_caches_each_season(volley_server, monkeypatch):
+    config.set_option('memo_max_bytes', 64 * 1024 ** 2)
+    pbp = {season: make_frame('pbp', season, 200, n_matches=4, seed=season) for season in [2024, 2025]}
+    for season, df in pbp.items():
+        volley_server.add_csv('mlv', 'pbp', df, season)
+    info = pd.concat([
+        df[['match_id', 'season', 'team_involved', 'jersey_number']].drop_duplicates().rename(columns={'team_involved': 'team_name'})
+        for df in pbp.values()
+    ], ignore_index=True).iloc[::2]
+    info['player_id'] = range(len(info))
+    info['player_name'] = [f'Player {i}' for i in range(len(info))]
+    info['primary_position'] = info['player_id'] % 6 + 1
+    volley_server.add_csv('mlv', 'player_info', info)
+
+    loaded = get_data.load_pbp('mlv', [2024, 2025], with_players=True)
+    assert len(volley_server.statuses(get_data.h.build_url('mlv', 'player_info')[len(get_data.h.BASE_URL):])) == 1
+    expected = get_data.load_pbp('mlv', [2024, 2025]).merge(
+        get_data.load_player_info('mlv', columns=['match_id', 'team_name', 'jersey_number', 'player_id', 'player_name', 'primary_position']),
+        how='left', left_on=['match_id', 'team_involved', 'jersey_number'], right_on=['match_id', 'team_name', 'jersey_number'],
+    )
+    assert loaded['player_id'].notna().any() and loaded['player_id'].isna().any()
+    for column in ['player_id', 'player_name', 'primary_position']:
+        pd.testing.assert_series_equal(loaded[column], expected[column])
+    assert loaded.columns.tolist()[7:10] == ['player_id', 'player_name', 'primary_position']
+
+    requests = len(volley_server.requests)
+    player = loaded['player_name'].dropna().iloc[0]
+    rows = get_data.load_pbp('mlv', 2025, columns=['match_id', 'player_name'], with_players=True, filters=[('player_name', '==', player)])
+    assert len(volley_server.requests) == requests
+    assert len(rows) == (loaded['player_name'].eq(player) & loaded['season'].eq(2025)).sum()
+    assert rows.columns.tolist() == ['match_id', 'player_name'] and rows['player_name'].eq(player).all()
+
+
+@pytest.mark.parametrize('storage_format', ['csv', 'parquet'])
+def test_load_pbp_with_players_stores_joined_seasons_in_the_cache(volley_server, cache_dir, monkeypatch, storage_format):
+    config.set_option('storage_format', storage_format)
+    pbp = make_frame('pbp', 2024, 200, n_matches=4)
+    info = pbp[['match_id', 'season', 'team_involved', 'jersey_number']].drop_duplicates().rename(columns={'team_involved': 'team_name'})
+    info['player_id'] = range(len(info))
+    info['player_name'] = [f'Player {i}' for i in range(len(info))]
+    info['primary_position'] = info['player_id'] % 6 + 1
+    volley_server.add_csv('mlv', 'pbp', pbp, 2024)
+    volley_server.add_csv('mlv', 'player_info', info)
+    joins = []
+    join_players = players.join_players
+    monkeypatch.setattr(players, 'join_players', lambda *args: joins.append(1) or join_players(*args))
+
+    try:
+        first = get_data.load_pbp('mlv', 2024, with_players=True)
+        second = get_data.load_pbp('mlv', 2024, with_players=True)
+        assert len(joins) == 1
+        pd.testing.assert_frame_equal(first, second)
+        assert any(key.startswith('mlv/pbp_players/') for key in cache._read_index(cache.get_cache_dir()))
+
+        volley_server.add_csv('mlv', 'player_info', info.assign(player_name='Renamed'))
+        assert get_data.load_pbp('mlv', 2024, with_players=True)['player_name'].eq('Renamed').all()
+        assert len(joins) == 2
+    finally:
+        config.reset_option('storage_format')
+
+
+def test_rollups_recompute_ratios_and_only_refresh_changed_seasons(volley_server, cache_dir, monkeypatch):
+    boxscore = pd.concat([make_frame('player_boxscore', season, 40, n_matches=4, seed=season) for season in [2024, 2025]], ignore_index=True)
+    # The last two players of Team 1 share a name, they are told apart by their player_info id
+    boxscore['player_name'] = [f'Player {min(i % 5, 3)}' for i in range(80)]
+    boxscore['player_number'] = [i % 5 + 1 for i in range(80)]
+    boxscore['team_name'] = [f'Team {i % 5 // 3}' for i in range(80)]
+    boxscore['attack_attempts'] = [0, 4, 1, 7] * 20
+    boxscore['attack_kills'] = [0, 1, 1, 3] * 20
+    boxscore['attack_success_ratio'] = (boxscore['attack_kills'] / boxscore['attack_attempts']).round(3)
+    volley_server.add_csv('mlv', 'player_boxscore', boxscore)
+    info = boxscore[['match_id', 'season', 'team_name', 'player_number']].drop_duplicates()
+    info = info.rename(columns={'player_number': 'jersey_number'}).assign(player_id=lambda df: df['jersey_number'] * 100)
+    volley_server.add_csv('mlv', 'player_info', info)
+
+    computed = []
+    rollup = rollups.rollup
+    monkeypatch.setattr(rollups, 'rollup', lambda df, *args: computed.append(len(df)) or rollup(df, *args))
+    totals = get_data.load_player_rollups('mlv', [2024, 2025])
+    assert computed == [40, 40]
+    expected = boxscore.assign(player_id=boxscore['player_number'] * 100).groupby(['season', 'team_name', 'player_id'])[['attack_attempts', 'attack_kills']].sum()
+    merged = totals.set_index(['season', 'team_name', 'player_id'])
+    assert len(merged) == 10
+    assert merged.loc[(2025, 'Team 1'), 'player_name'].tolist() == ['Player 3', 'Player 3']
+    assert (merged[['attack_attempts', 'attack_kills']].to_numpy() == expected.loc[merged.index].to_numpy()).all()
+    ratio = merged['attack_kills'] / merged['attack_attempts'].where(merged['attack_attempts'] > 0)
+    pd.testing.assert_series_equal(merged['attack_success_ratio'], ratio.astype('float64'), check_names=False)
+    assert totals['sets'].sum() == 80 and get_data.load_player_rollups('mlv', 2025, by='match')['sets'].sum() == 40
+
+    boxscore.loc[boxscore['season'] == 2025, 'serves'] += 1
+    volley_server.add_csv('mlv', 'player_boxscore', boxscore)
+    computed.clear()
+    refreshed = get_data.load_player_rollups('mlv', [2024, 2025])
+    assert computed == [40]
+    pd.testing.assert_frame_equal(refreshed[refreshed['season'] == 2024], totals[totals['season'] == 2024])
+
+
+def test_pyarrow_engine_matches_the_c_engine(volley_server, monkeypatch):
+    pytest.importorskip('pyarrow')
+    for data_type in schemas.SCHEMAS:
+        df = make_frame(data_type, 2025, 300, n_matches=6).astype(object)
+        for i, column in enumerate(df.columns[2:]):
+            df.loc[df.index % 7 == i % 7, column] = None
+        volley_server.add_csv('mlv', data_type, df, 2025 if data_type in {'pbp', 'events_log'} else None)
+
+    read_csv = schemas.read_csv
+    engines = []
+    monkeypatch.setattr(schemas, 'read_csv', lambda *args, engine=None, **kwargs: engines.append(engine) or read_csv(*args, engine=engine, **kwargs))
+    for data_type in schemas.SCHEMAS:
+        load = getattr(get_data, f'load_{data_type}')
+        pd.testing.assert_frame_equal(load('mlv', 2025, engine='pyarrow'), load('mlv', 2025, engine='c'))
+        filters = [('match_id', 'in', [2025001, 2025003])]
+        pd.testing.assert_frame_equal(load('mlv', 2025, columns=['season'], filters=filters, engine='pyarrow'), load('mlv', 2025, columns=['season'], filters=filters))
+    assert set(engines) == {'c', 'pyarrow'}
+    # Both engines drop the categories that only the filtered out rows used
+    teams = get_data.load_player_boxscore('mlv', 2025)['team_name'].cat.categories[:1].tolist()
+    filtered = [get_data.load_player_boxscore('mlv', 2025, filters=[('team_name', 'in', teams)], engine=engine) for engine in ['pyarrow', 'c']]
+    pd.testing.assert_frame_equal(*filtered)
+    assert filtered[0]['team_name'].cat.categories.tolist() == teams
+
+    config.set_option('engine', 'pyarrow')
+    engines.clear()
+    get_data.load_pbp('mlv', 2025)
+    assert engines == ['pyarrow']
+    monkeypatch.setattr(schemas.importlib.util, 'find_spec', lambda name: None)
+    with pytest.warns(UserWarning, match="parsing with the 'c' engine"):
+        get_data.load_pbp('mlv', 2025)
+    assert engines[-1] == 'c'
+    with pytest.raises(ValueError, match='Expected engine'):
+        get_data.load_pbp('mlv', 2025, engine='python')
+
+
+@pytest.mark.parametrize('cached', [False, True])
+def test_process_pool_parsing_matches_threads(volley_server, tmp_path, cached):
+    for season in [2024, 2025]:
+        volley_server.add_csv('mlv', 'events_log', make_frame('events_log', season, 2000, n_matches=10, seed=season), season)
+    volley_server.add_csv('mlv', 'schedule', make_frame('schedule', 2025, 50))
+    if cached:
+        config.set_option('cache_dir', str(tmp_path / 'cache'))
+    filters = [('set', '>', 3)]
+    expected = [get_data.load_events_log('mlv', [2024, 2025]), get_data.load_events_log('mlv', 2025, columns=['match_id'], filters=filters), get_data.load_schedule('mlv', 2025)]
+
+    config.set_option('processes', 1)
+    try:
+        parsed = [get_data.load_events_log('mlv', [2024, 2025]), get_data.load_events_log('mlv', 2025, columns=['match_id'], filters=filters), get_data.load_schedule('mlv', 2025)]
+        assert processes.get_pool() is not None
+    finally:
+        processes.shutdown()
+        config.reset_option('cache_dir')
+    for df, expected_df in zip(parsed, expected):
+        pd.testing.assert_frame_equal(df, expected_df)
+
+    # Arrays come back mapped from the buffer file, which is removed once mapped
+    df = processes.import_frame(*processes.export_frame(expected[0]))
+    pd.testing.assert_frame_equal(df, expected[0])
+    assert not df['match_id'].to_numpy().flags.owndata
+    df.loc[0, 'match_id'] = 1
+    assert not [name for name in os.listdir(processes._buffer_dir() or tempfile.gettempdir()) if name.startswith('pyvolleydata-')]
+
+
+def test_record_stats_reports_each_stage_of_a_load(volley_server, tmp_path, monkeypatch):
+    monkeypatch.setitem(config._options, 'chunksize', 50)
+    files = {season: make_frame('events_log', season, 200, n_matches=4, seed=season) for season in [2024, 2025]}
+    for season, df in files.items():
+        volley_server.add_csv('mlv', 'events_log', df, season)
+    assert stats.span('parse') is stats._NULL_SPAN
+
+    with get_data.record_stats() as recorder:
+        df = get_data.load_events_log('mlv', [2024, 2025], filters=[('set', '>', 2)])
+    report = recorder.report()
+    summary = recorder.summary()
+    assert not stats._hooks
+    assert summary.loc['connect', 'events'] == summary.loc['download', 'events'] == summary.loc['parse', 'events'] == 2
+    assert sorted(report.loc[report['stage'] == 'download', 'bytes']) == sorted(len(frame.to_csv(index=False).encode()) for frame in files.values())
+    assert summary.loc['filter', 'rows'] == len(df) and summary.loc['filter', 'events'] == 8
+    load = report[report['stage'] == 'load'].iloc[0]
+    assert (load['league'], load['data_type'], load['cache'], load['rows']) == ('mlv', 'events_log', 'miss', len(df))
+    assert load['memory'] == df.memory_usage(deep=True).sum()
+    assert load['seconds'] >= report.loc[report['stage'] == 'parse', 'seconds'].max()
+
+    config.set_option('cache_dir', str(tmp_path / 'cache'))
+    try:
+        get_data.load_events_log('mlv', 2025)
+        with get_data.record_stats() as recorder:
+            get_data.load_events_log('mlv', 2025)
+    finally:
+        config.reset_option('cache_dir')
+    download = recorder.report().query("stage == 'download'").iloc[0]
+    assert download['cache'] in {'hit', 'revalidated'} and download['bytes'] == 0
+
+
+def test_importing_the_package_defers_pandas():
+    script = """
+import sys
+import pyvolleydata
+from pyvolleydata import config, get_data, helpers, schemas
+config.get_option('engine')
+helpers.validate_seasons(helpers.resolve_seasons('mlv', 2024), 2024)
+heavy = ['pandas', 'numpy', 'pyarrow', 'multiprocessing', 'importlib.metadata']
+print([name for name in heavy if name in sys.modules])
+get_data.pd.DataFrame
+print('pandas' in sys.modules, bool(pyvolleydata.__version__))
+"""
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+    assert result.stdout.splitlines() == ['[]', 'True True']